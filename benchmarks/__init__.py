@@ -0,0 +1,5 @@
+"""Performance benchmarks for PyConstructor.
+
+Benchmarks aren't part of the test suite, run them as modules,
+e.g. ``python -m benchmarks.preview_memory``.
+"""
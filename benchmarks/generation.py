@@ -0,0 +1,297 @@
+"""Measure parse, validate, preview and generation time on synthetic configs.
+
+Every workload is a synthetic config of one preset and size. Each phase is
+run several times and the results are written as JSON, so runs on two
+branches can be compared:
+
+    python -m benchmarks.generation --contexts 10 100 1000 10000 -o main.json
+    python -m benchmarks.generation --contexts 10 100 1000 10000 --compare main.json
+
+Phases:
+    parse: YAML parsing of the config file, with its source map
+    validate: Validation of the parsed config
+    preview: Preview generation and JSON rendering, written to /dev/null
+    generate: Full generation into a temporary directory
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import shutil
+import statistics
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.synthetic import SyntheticSpec, write_config
+from src.core.dependencies import get_container
+from src.core.parser import YamlParser
+from src.core.utils import GenerationRequest
+from src.generators import ProjectGenerator
+from src.preview.collector import PreviewCollector
+
+PHASES = ("parse", "validate", "preview", "generate")
+RESULTS_VERSION = 1
+
+
+class Workload:
+    """Synthetic config written to a working directory, with its phases.
+
+    Every phase method runs the phase once and returns the number of
+    nodes it produced, 0 for phases that produce none.
+    """
+
+    def __init__(self, spec: SyntheticSpec, work_dir: Path) -> None:
+        """Write the config of a workload.
+
+        Args:
+            spec: Shape of the config
+            work_dir: Directory receiving the config and generated projects
+
+        """
+        self.spec = spec
+        self.work_dir = work_dir
+        self.config_path = write_config(spec, work_dir / f"{spec.name}.yaml")
+        self.parser = YamlParser()
+        self.container = get_container()
+        self._raw_config: dict[str, Any] = {}
+        self.parse()
+
+    def parse(self) -> int:
+        self._raw_config = self.parser.load_document(self.config_path).data
+        return 0
+
+    def validate(self) -> int:
+        # Validation normalizes values in place, which leaves the result of later runs unchanged.
+        self.parser.validate(self._raw_config)
+        return 0
+
+    def preview(self) -> int:
+        request = GenerationRequest(
+            file_path=self.config_path, preview_mode=True, render_format="json"
+        )
+        with (
+            open(os.devnull, "w", encoding="utf-8") as devnull,
+            contextlib.redirect_stdout(devnull),
+            self.container.request(request) as request_container,
+        ):
+            request_container.get(ProjectGenerator).generate()
+            collector = request_container.get(PreviewCollector)
+            collector.display()
+            return len(collector.all_nodes)
+
+    def generate(self) -> int:
+        project_root = Path(tempfile.mkdtemp(dir=self.work_dir))
+        request = GenerationRequest(file_path=self.config_path, project_root=project_root)
+        try:
+            with self.container.request(request) as request_container:
+                request_container.get(ProjectGenerator).generate()
+            return sum(len(dirs) + len(files) for _, dirs, files in os.walk(project_root))
+        finally:
+            shutil.rmtree(project_root)
+
+    def phase(self, name: str) -> Callable[[], int]:
+        """Get the method running a phase.
+
+        Args:
+            name: Phase name, one of PHASES
+
+        Returns:
+            Bound phase method
+
+        """
+        method: Callable[[], int] = getattr(self, name)
+        return method
+
+
+def time_phase(run: Callable[[], int], repeat: int) -> dict[str, Any]:
+    """Run a phase several times.
+
+    Args:
+        run: Phase method
+        repeat: Number of runs
+
+    Returns:
+        Run times in seconds, their minimum and median, and the produced node count
+
+    """
+    runs = []
+    nodes = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        nodes = run()
+        runs.append(time.perf_counter() - started)
+    return {"runs": runs, "min": min(runs), "median": statistics.median(runs), "nodes": nodes}
+
+
+def peak_memory(run: Callable[[], int]) -> int:
+    """Run a phase once under tracemalloc.
+
+    Args:
+        run: Phase method
+
+    Returns:
+        Peak traced memory of the run in bytes
+
+    """
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_workload(
+    spec: SyntheticSpec,
+    work_dir: Path,
+    phases: Iterable[str] = PHASES,
+    repeat: int = 3,
+    memory: bool = False,
+) -> dict[str, Any]:
+    """Benchmark the phases of one workload.
+
+    Args:
+        spec: Shape of the config
+        work_dir: Directory receiving the config and generated projects
+        phases: Phases to run
+        repeat: Number of timed runs of every phase
+        memory: Whether to measure peak memory of every phase in an extra run
+
+    Returns:
+        Workload spec and per-phase results
+
+    """
+    workload = Workload(spec, work_dir)
+    result: dict[str, Any] = {"workload": spec.to_dict(), "phases": {}}
+    for name in phases:
+        phase_result = time_phase(workload.phase(name), repeat)
+        if memory:
+            phase_result["peak_memory"] = peak_memory(workload.phase(name))
+        result["phases"][name] = phase_result
+    return result
+
+
+def build_specs(
+    presets: Iterable[str],
+    contexts: Iterable[int],
+    components_per_type: int,
+    group_components: bool,
+    init_imports: bool,
+) -> list[SyntheticSpec]:
+    """Build the workload matrix.
+
+    Args:
+        presets: Preset names
+        contexts: Context counts
+        components_per_type: Number of components of every type in every context
+        group_components: Whether components of a type share a single module
+        init_imports: Whether __init__.py files import their package's components
+
+    Returns:
+        One spec per preset and context count
+
+    """
+    return [
+        SyntheticSpec(preset, count, components_per_type, group_components, init_imports)
+        for preset in presets
+        for count in contexts
+    ]
+
+
+def print_results(results: list[dict[str, Any]], baseline: dict[str, Any] | None = None) -> None:
+    """Print median phase times, compared with a baseline if given.
+
+    Args:
+        results: Workload results
+        baseline: Earlier results file contents
+
+    """
+    baseline_phases = {
+        item["workload"]["name"]: item["phases"] for item in (baseline or {}).get("results", [])
+    }
+    table = Table(title="Median time, ms")
+    table.add_column("Workload")
+    table.add_column("Nodes", justify="right")
+    for phase in PHASES:
+        table.add_column(phase, justify="right")
+
+    for result in results:
+        name = result["workload"]["name"]
+        phases = result["phases"]
+        nodes = max((phase["nodes"] for phase in phases.values()), default=0)
+        cells = []
+        for phase in PHASES:
+            if phase not in phases:
+                cells.append("-")
+                continue
+            median = phases[phase]["median"]
+            cell = f"{median * 1000:.1f}"
+            base = baseline_phases.get(name, {}).get(phase)
+            if base and base["median"]:
+                cell += f" ({median / base['median'] - 1:+.0%})"
+            cells.append(cell)
+        table.add_row(name, str(nodes or "-"), *cells)
+    Console().print(table)
+
+
+def main() -> None:
+    """Run the benchmark matrix and write the results."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--presets", nargs="+", choices=("simple", "standard", "advanced"), default=["standard"]
+    )
+    parser.add_argument("--contexts", nargs="+", type=int, default=[10, 100, 1000])
+    parser.add_argument("--components-per-type", type=int, default=2)
+    parser.add_argument("--no-group-components", dest="group_components", action="store_false")
+    parser.add_argument("--init-imports", action="store_true")
+    parser.add_argument("--phases", nargs="+", choices=PHASES, default=list(PHASES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--memory", action="store_true", help="Also measure peak memory")
+    parser.add_argument("-o", "--output", type=Path, help="Write results as JSON")
+    parser.add_argument("--compare", type=Path, help="Compare with earlier results")
+    args = parser.parse_args()
+
+    baseline = json.loads(args.compare.read_text(encoding="utf-8")) if args.compare else None
+    specs = build_specs(
+        args.presets,
+        args.contexts,
+        args.components_per_type,
+        args.group_components,
+        args.init_imports,
+    )
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="pyc-bench-") as work_dir:
+        for spec in specs:
+            print(f"{spec.name}...", flush=True)
+            results.append(
+                run_workload(spec, Path(work_dir), args.phases, args.repeat, args.memory)
+            )
+
+    print_results(results, baseline)
+    if args.output:
+        document = {
+            "version": RESULTS_VERSION,
+            "created": datetime.now(UTC).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": results,
+        }
+        args.output.write_text(json.dumps(document, indent=2), encoding="utf-8")
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
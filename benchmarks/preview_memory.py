@@ -0,0 +1,130 @@
+"""Measure memory used per preview node.
+
+Compares the slotted PreviewNode representation with the previous one,
+a regular dataclass holding the full path, an always-allocated children
+container and metadata dict, indexed by yet another copy of the path.
+
+Usage:
+    python -m benchmarks.preview_memory --files 50000
+"""
+
+import argparse
+import gc
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from src.preview.collector import PreviewCollector
+from src.preview.objects import ComponentType
+
+
+@dataclass
+class LegacyPreviewNode:
+    name: str
+    type: ComponentType
+    path: str
+    children: dict[str, "LegacyPreviewNode"] = field(default_factory=dict)
+    metadata: dict = field(default_factory=dict)
+
+
+class LegacyPreviewCollector:
+    """Path-indexed collector as it was before slotted nodes."""
+
+    def __init__(self) -> None:
+        """Initialize an empty collector."""
+        self.nodes: dict[str, LegacyPreviewNode] = {}
+
+    def add(self, path: Path, node_type: ComponentType) -> None:
+        path_str = str(path)
+        if path_str in self.nodes:
+            return
+        node = LegacyPreviewNode(name=path.name, type=node_type, path=path_str)
+        self.nodes[path_str] = node
+        parent = self.nodes.get(str(path.parent))
+        if parent is not None:
+            parent.children[node.name] = node
+
+
+def build_paths(root: Path, files: int, files_per_dir: int) -> list[tuple[Path, ComponentType]]:
+    """Build a synthetic list of directories and files in generation order.
+
+    Args:
+        root: Project root
+        files: Number of files
+        files_per_dir: Number of files in each component directory
+
+    Returns:
+        Paths with their node types
+
+    """
+    entries = [(root, ComponentType.DIRECTORY)]
+    for index in range(files):
+        directory = root / "domain" / f"context_{index // files_per_dir}" / "entities"
+        if index % files_per_dir == 0:
+            entries.append((directory.parent, ComponentType.DIRECTORY))
+            entries.append((directory, ComponentType.DIRECTORY))
+            entries.append((directory / "__init__.py", ComponentType.INIT))
+        entries.append((directory / f"entity_{index}.py", ComponentType.FILE))
+    return entries
+
+
+def measure(build: Callable[[], object]) -> int:
+    """Measure memory retained by the object returned from build.
+
+    Args:
+        build: Callable building the structure
+
+    Returns:
+        Retained memory in bytes
+
+    """
+    gc.collect()
+    tracemalloc.start()
+    structure = build()
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del structure
+    return retained
+
+
+def main() -> None:
+    """Run the benchmark and print bytes per node."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=50_000)
+    parser.add_argument("--files-per-dir", type=int, default=20)
+    args = parser.parse_args()
+
+    entries = build_paths(Path.cwd() / "src", args.files, args.files_per_dir)
+    node_count = len(entries)
+    # Touch the cached string and parts of every path, so they aren't attributed to collectors.
+    for path, _ in entries:
+        str(path)
+        _ = path.parts, path.name, path.parent
+
+    def build_legacy() -> LegacyPreviewCollector:
+        collector = LegacyPreviewCollector()
+        for path, node_type in entries:
+            collector.add(path, node_type)
+        return collector
+
+    def build_current() -> PreviewCollector:
+        collector = PreviewCollector()
+        for path, node_type in entries:
+            if node_type == ComponentType.DIRECTORY:
+                collector.add_directory(path)
+            else:
+                collector.add_file(path, node_type)
+        return collector
+
+    legacy = measure(build_legacy)
+    current = measure(build_current)
+    print(f"nodes: {node_count}")
+    print(f"legacy dataclass nodes: {legacy / node_count:8.1f} bytes/node")
+    print(f"slotted preview nodes:  {current / node_count:8.1f} bytes/node")
+    print(f"saved: {1 - current / legacy:.0%}")
+
+
+if __name__ == "__main__":
+    main()
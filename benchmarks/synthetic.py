@@ -0,0 +1,198 @@
+"""Synthetic configs of any size for benchmarks.
+
+Usage:
+    python -m benchmarks.synthetic --preset advanced --contexts 1000 -o ddd-config.yaml
+"""
+
+import argparse
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+# Component types of every layer, a subset of the bundled config templates.
+LAYER_COMPONENTS = {
+    "domain": ("entities", "value_objects", "services", "repositories", "events"),
+    "application": ("use_cases", "event_handlers", "validators"),
+    "infrastructure": ("repositories", "models", "configs"),
+    "interface": ("controllers", "dto", "api_routes"),
+}
+# Layer-level components of the standard preset, shared by all contexts.
+SHARED_COMPONENTS = {"interface": ("middleware", "error_handlers")}
+
+
+@dataclass(frozen=True)
+class SyntheticSpec:
+    """Shape of a synthetic config.
+
+    Attributes:
+        preset: Preset name: simple, standard or advanced
+        contexts: Number of bounded contexts. The simple preset has no contexts,
+            every context adds components to its layers instead
+        components_per_type: Number of components of every type in every context
+        group_components: Whether components of a type share a single module
+        init_imports: Whether __init__.py files import their package's components
+
+    """
+
+    preset: str = "standard"
+    contexts: int = 10
+    components_per_type: int = 2
+    group_components: bool = True
+    init_imports: bool = False
+
+    @property
+    def name(self) -> str:
+        """Short unique name of the workload, e.g. standard-1000x2-grouped."""
+        parts = [f"{self.preset}-{self.contexts}x{self.components_per_type}"]
+        if self.group_components:
+            parts.append("grouped")
+        if self.init_imports:
+            parts.append("imports")
+        return "-".join(parts)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the spec to a JSON-serializable dictionary.
+
+        Returns:
+            Spec fields and the workload name
+
+        """
+        return {"name": self.name, **asdict(self)}
+
+
+def component_names(component_type: str, prefix: str, count: int) -> list[str]:
+    """Build CamelCase component names, e.g. Context3ValueObjects0.
+
+    Args:
+        component_type: Component type, e.g. value_objects
+        prefix: CamelCase prefix making names unique, e.g. the context name
+        count: Number of names
+
+    Returns:
+        Component names
+
+    """
+    stem = prefix + "".join(part.title() for part in component_type.split("_"))
+    return [f"{stem}{index}" for index in range(count)]
+
+
+def _context_names(contexts: int) -> list[str]:
+    return [f"context_{index}" for index in range(contexts)]
+
+
+def _layer_components(layer_name: str, prefix: str, count: int) -> dict[str, list[str]]:
+    return {
+        component_type: component_names(component_type, prefix, count)
+        for component_type in LAYER_COMPONENTS[layer_name]
+    }
+
+
+def build_config(spec: SyntheticSpec) -> dict[str, Any]:
+    """Build a raw config for a spec, as it would be loaded from YAML.
+
+    Args:
+        spec: Shape of the config
+
+    Returns:
+        Raw configuration dictionary
+
+    Raises:
+        ValueError: If the preset is unknown
+
+    """
+    settings = {
+        "preset": spec.preset,
+        "group_components": spec.group_components,
+        "init_imports": spec.init_imports,
+        "root_name": "src",
+    }
+    layers: dict[str, Any] = {}
+    context_names = _context_names(spec.contexts)
+
+    if spec.preset == "simple":
+        for layer_name in LAYER_COMPONENTS:
+            layers[layer_name] = _layer_components(
+                layer_name, "", spec.components_per_type * spec.contexts
+            )
+
+    elif spec.preset == "standard":
+        for layer_name in LAYER_COMPONENTS:
+            layer: dict[str, Any] = {
+                "contexts": [
+                    {
+                        "name": context_name,
+                        **_layer_components(
+                            layer_name, f"Context{index}", spec.components_per_type
+                        ),
+                    }
+                    for index, context_name in enumerate(context_names)
+                ]
+            }
+            for component_type in SHARED_COMPONENTS.get(layer_name, ()):
+                layer[component_type] = component_names(
+                    component_type, "Shared", spec.components_per_type
+                )
+            layers[layer_name] = layer
+
+    elif spec.preset == "advanced":
+        settings["contexts_layout"] = "nested"
+        layers["contexts"] = [
+            {
+                "name": context_name,
+                **{
+                    layer_name: _layer_components(
+                        layer_name, f"Context{index}", spec.components_per_type
+                    )
+                    for layer_name in LAYER_COMPONENTS
+                },
+            }
+            for index, context_name in enumerate(context_names)
+        ]
+
+    else:
+        raise ValueError(f"Unknown preset: {spec.preset}")
+
+    return {"settings": settings, "layers": layers}
+
+
+def write_config(spec: SyntheticSpec, path: Path) -> Path:
+    """Write a synthetic config as YAML.
+
+    Args:
+        spec: Shape of the config
+        path: Output file path
+
+    Returns:
+        The output file path
+
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        yaml.safe_dump(build_config(spec), file, sort_keys=False)
+    return path
+
+
+def main() -> None:
+    """Write a synthetic config."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--preset", choices=("simple", "standard", "advanced"), default="standard")
+    parser.add_argument("--contexts", type=int, default=10)
+    parser.add_argument("--components-per-type", type=int, default=2)
+    parser.add_argument("--no-group-components", dest="group_components", action="store_false")
+    parser.add_argument("--init-imports", action="store_true")
+    parser.add_argument("-o", "--output", type=Path, default=Path("ddd-config.yaml"))
+    args = parser.parse_args()
+
+    spec = SyntheticSpec(
+        preset=args.preset,
+        contexts=args.contexts,
+        components_per_type=args.components_per_type,
+        group_components=args.group_components,
+        init_imports=args.init_imports,
+    )
+    print(f"{spec.name}: {write_config(spec, args.output)}")
+
+
+if __name__ == "__main__":
+    main()
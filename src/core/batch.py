@@ -0,0 +1,243 @@
+import glob
+import os
+import time
+from collections import Counter
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass
+from logging import getLogger
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+from rich.text import Text
+
+from src.core.dependencies import Container, get_container
+from src.core.parser import YamlParser
+from src.core.utils import GenerationRequest
+from src.generators import ProjectGenerator
+
+logger = getLogger(__name__)
+
+
+@dataclass
+class BatchResult:
+    """Outcome of generating a single project in a batch.
+
+    Attributes:
+        config_path: Path to the configuration file
+        project_root: Directory where the project was generated
+        duration: Wall time of the generation in seconds
+        error: Error message if the generation failed
+
+    """
+
+    config_path: Path
+    project_root: Path
+    duration: float
+    error: str | None = None
+
+    @property
+    def success(self) -> bool:
+        """Whether the generation succeeded."""
+        return self.error is None
+
+
+def expand_config_paths(patterns: Iterable[str]) -> list[Path]:
+    """Expand config paths and glob patterns, keeping the given order.
+
+    Patterns already expanded by the shell are passed through unchanged.
+
+    Args:
+        patterns: Paths or glob patterns
+
+    Returns:
+        Unique config paths
+
+    """
+    paths: dict[Path, None] = {}
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) if glob.has_magic(pattern) else []
+        for match in matches or [pattern]:
+            paths[Path(match)] = None
+    return list(paths)
+
+
+class BatchGenerator:
+    """Generates many projects from many configs in one process.
+
+    All generations share the app-scoped dependencies of one container,
+    so the template engine and its compiled templates are reused, while
+    each config gets its own request scope.
+    """
+
+    def __init__(
+        self,
+        container: Container | None = None,
+        workers: int | None = None,
+        output_dir: Path | None = None,
+    ) -> None:
+        """Initialize the batch generator.
+
+        Args:
+            container: Dependency container, defaults to the application container
+            workers: Number of concurrent generations, defaults to the CPU count
+            output_dir: Directory receiving one sub-directory per config, see
+                get_project_roots. Defaults to generating next to each config file
+
+        """
+        self.container = container or get_container()
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.output_dir = output_dir
+
+    def get_project_roots(self, config_paths: list[Path]) -> list[Path]:
+        """Get the directories where the configs' projects are generated.
+
+        In an output directory, projects are named after their config files.
+        Configs sharing a file name, e.g. services/*/ddd-config.yaml, are
+        named after their directories relative to the common parent of all
+        configs instead.
+
+        Args:
+            config_paths: Paths to configuration files
+
+        Returns:
+            Project root directories in the order of the config paths
+
+        """
+        if self.output_dir is None:
+            return [config_path.parent for config_path in config_paths]
+
+        stems = Counter(config_path.stem for config_path in config_paths)
+        parents = [config_path.resolve().parent for config_path in config_paths]
+        common_parent = Path(os.path.commonpath(parents)) if parents else Path()
+        return [
+            self.output_dir / config_path.stem
+            if stems[config_path.stem] == 1
+            else self.output_dir / parent.relative_to(common_parent)
+            for config_path, parent in zip(config_paths, parents, strict=True)
+        ]
+
+    def generate(self, config_paths: Iterable[Path]) -> list[BatchResult]:
+        """Generate a project for every config.
+
+        Configs whose root packages would land in the same directory, e.g.
+        configs next to each other with the same root_name, fail without
+        generating anything, instead of overwriting each other.
+
+        Args:
+            config_paths: Paths to configuration files
+
+        Returns:
+            Results in the order of the given config paths
+
+        """
+        paths = list(config_paths)
+        project_roots = self.get_project_roots(paths)
+
+        # Resolve shared dependencies once, before worker threads race for them.
+        parser = self.container.get(YamlParser)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            package_dirs = list(
+                executor.map(self._get_package_dir, [parser] * len(paths), paths, project_roots)
+            )
+            owners: dict[Path, int] = {}
+            shared: set[int] = set()
+            for index, package_dir in enumerate(package_dirs):
+                if package_dir is None:
+                    continue
+                first = owners.setdefault(package_dir, index)
+                if first != index:
+                    shared.update((first, index))
+
+            # Each generation runs in a copy of the caller's context, e.g. to see its profiler.
+            futures = {
+                index: executor.submit(
+                    copy_context().run, self.generate_one, paths[index], project_roots[index]
+                )
+                for index in range(len(paths))
+                if index not in shared
+            }
+            return [
+                futures[index].result()
+                if index in futures
+                else BatchResult(
+                    paths[index],
+                    project_roots[index],
+                    0.0,
+                    f"Root package {package_dirs[index]} is shared with another config",
+                )
+                for index in range(len(paths))
+            ]
+
+    @staticmethod
+    def _get_package_dir(parser: YamlParser, config_path: Path, project_root: Path) -> Path | None:
+        """Get the resolved root package directory of a config, None if it can't be loaded."""
+        try:
+            root_name = parser.load(config_path).settings.root_name
+        except Exception as error:
+            # The generation reports the error.
+            logger.debug(f"Root package of {config_path} unknown: {error}")
+            return None
+        return (project_root / root_name).resolve()
+
+    def generate_one(self, config_path: Path, project_root: Path) -> BatchResult:
+        """Generate a project for a single config.
+
+        Args:
+            config_path: Path to the configuration file
+            project_root: Directory where the project is generated
+
+        Returns:
+            Result of the generation
+
+        """
+        started = time.perf_counter()
+        try:
+            project_root.mkdir(parents=True, exist_ok=True)
+            request = GenerationRequest(file_path=config_path, project_root=project_root)
+            with self.container.request(request) as request_container:
+                request_container.get(ProjectGenerator).generate()
+        except Exception as error:
+            logger.debug(f"Batch generation failed for {config_path}: {error}")
+            return BatchResult(config_path, project_root, time.perf_counter() - started, str(error))
+
+        return BatchResult(config_path, project_root, time.perf_counter() - started)
+
+
+def print_batch_report(results: list[BatchResult], total_duration: float) -> None:
+    """Print a per-config timing and status table with an aggregate summary.
+
+    Args:
+        results: Batch results
+        total_duration: Wall time of the whole batch in seconds
+
+    """
+    table = Table(title="Batch generation")
+    table.add_column("Config")
+    table.add_column("Project root")
+    table.add_column("Status")
+    table.add_column("Time, ms", justify="right")
+
+    for result in results:
+        if result.success:
+            status = Text("ok", style="green")
+        else:
+            status = Text(f"failed: {result.error}", style="red")
+        table.add_row(
+            str(result.config_path),
+            str(result.project_root),
+            status,
+            f"{result.duration * 1000:.1f}",
+        )
+
+    failed = sum(not result.success for result in results)
+    busy_time = sum(result.duration for result in results)
+    console = Console()
+    console.print(table)
+    console.print(
+        f"{len(results) - failed} succeeded, {failed} failed, "
+        f"{total_duration:.2f}s wall, {busy_time:.2f}s total generation time"
+    )
@@ -0,0 +1,209 @@
+from dataclasses import dataclass
+from logging import getLogger
+from pathlib import Path
+
+from src.core.code_index import CodeIndex, ModuleInfo
+from src.core.exceptions import LayoutNotFoundError
+from src.core.layout import CompiledLayout
+from src.core.linter import ConfigLinter
+from src.core.tracing import span
+from src.schemas import ConfigModel
+from src.schemas.config_schema import ContextsLayout
+
+logger = getLogger(__name__)
+
+LAYER_BOUNDARY = "layer-boundary"
+CONTEXT_BOUNDARY = "context-boundary"
+PARSE_ERROR = "parse-error"
+
+# Layers may import layers of the same or a lower rank, inner layers come first.
+LAYER_RANKS = {
+    "domain": 0,
+    "application": 1,
+    "infrastructure": 2,
+    "interface": 3,
+    "interfaces": 3,
+    "presentation": 3,
+}
+
+Scope = tuple[str, str | None]
+
+
+@dataclass(frozen=True)
+class BoundaryViolation:
+    """Import crossing a layer or context boundary.
+
+    Attributes:
+        code: Kind of violation, e.g. "layer-boundary"
+        message: Description of the violation
+        path: Path of the importing module relative to the root package
+        line: One-based line of the import, None if unknown
+
+    """
+
+    code: str
+    message: str
+    path: str
+    line: int | None = None
+
+    def format(self, root_path: Path) -> str:
+        """Format the violation like compiler diagnostics.
+
+        Args:
+            root_path: Root package directory the path is relative to
+
+        Returns:
+            "file:line: message [code]", without line if unknown
+
+        """
+        position = f":{self.line}" if self.line is not None else ""
+        return f"{root_path / self.path}{position}: {self.message} [{self.code}]"
+
+
+class BoundaryLinter:
+    """Checks the imports of a generated project against its configuration.
+
+    Modules are mapped to the layers and contexts of the config through
+    its layout. Allowed dependency directions follow from the layers:
+
+    - a layer may import itself and the layers of LAYER_RANKS with a lower
+      rank, e.g. application may import domain but not infrastructure
+    - configured layers missing from LAYER_RANKS, e.g. common, are shared:
+      every layer may import them, they may only import shared layers
+    - a bounded context may not import another context, code outside
+      contexts may import every context
+
+    Imports of modules outside the configured layers are ignored. The
+    import graph comes from a CodeIndex, so only changed modules are
+    parsed again.
+    """
+
+    def __init__(
+        self,
+        config: ConfigModel,
+        root_path: Path,
+        workers: int | None = None,
+        use_cache: bool = True,
+    ) -> None:
+        """Initialize the linter.
+
+        Args:
+            config: Validated configuration model
+            root_path: Generated root package directory
+            workers: Number of parsing processes, defaults to the CPU count
+            use_cache: Whether to reuse modules parsed by previous runs
+
+        """
+        self.config = config
+        self.index = CodeIndex(
+            root_path, config.settings.root_name, workers=workers, use_cache=use_cache
+        )
+        self._directory_scopes: dict[str, Scope] = {}
+        self._package_scopes: dict[str, Scope] = {}
+
+    def lint(self) -> list[BoundaryViolation]:
+        """Index the project and check its imports.
+
+        Returns:
+            Violations ordered by module path and line
+
+        Raises:
+            LayoutNotFoundError: If the preset has no layout to map modules with
+
+        """
+        layout = ConfigLinter(self.config).get_layout()
+        if layout is None:
+            raise LayoutNotFoundError(self.config.settings.preset_name)
+        self._map_scopes(layout.compile(self.index.root, self.config.settings.root_name))
+
+        modules = self.index.build()
+        violations: list[BoundaryViolation] = []
+        with span("boundaries.check", modules=len(modules)):
+            for info in modules.values():
+                violations.extend(self._check_module(info))
+        violations.sort(key=lambda violation: (violation.path, violation.line or 0))
+        return violations
+
+    @staticmethod
+    def check(source: Scope, target: Scope) -> tuple[str, str] | None:
+        """Check whether one layer or context may import another.
+
+        Args:
+            source: Layer and context of the importing module
+            target: Layer and context of the imported module
+
+        Returns:
+            Violation code and message, None if the import is allowed
+
+        """
+        source_layer, source_context = source
+        target_layer, target_context = target
+        if source_context and target_context and source_context != target_context:
+            return CONTEXT_BOUNDARY, f"Context {source_context} must not import {target_context}"
+        if source_layer == target_layer:
+            return None
+
+        target_rank = LAYER_RANKS.get(target_layer)
+        if target_rank is None:
+            return None
+        source_rank = LAYER_RANKS.get(source_layer)
+        if source_rank is None or target_rank > source_rank:
+            return LAYER_BOUNDARY, f"Layer {source_layer} must not import {target_layer}"
+        return None
+
+    def _map_scopes(self, layout: CompiledLayout) -> None:
+        """Index the packages of the configured layers and contexts by directory and name."""
+        settings = self.config.settings
+        scopes: list[Scope] = []
+        if settings.use_contexts and settings.contexts_layout == ContextsLayout.NESTED:
+            for context in self.config.layers.iter_contexts():
+                scopes.extend((layer.name, context.name) for layer in context.layers())
+        else:
+            for layer in self.config.layers.iter_layers():
+                scopes.append((layer.name, None))
+                if settings.use_contexts:
+                    scopes.extend((layer.name, context.name) for context in layer.contexts())
+
+        self._directory_scopes = {}
+        self._package_scopes = {}
+        for scope in scopes:
+            directory, package = layout.scope_package(*scope)
+            if directory == layout.root_path:
+                continue
+            self._directory_scopes[directory.relative_to(layout.root_path).as_posix()] = scope
+            self._package_scopes[package] = scope
+        logger.debug(f"Checking imports between {len(self._package_scopes)} packages")
+
+    def _check_module(self, info: ModuleInfo) -> list[BoundaryViolation]:
+        if info.error:
+            return [BoundaryViolation(PARSE_ERROR, f"Module not checked: {info.error}", info.path)]
+
+        source = self._module_scope(info)
+        if source is None:
+            return []
+        violations = []
+        for name, line in info.imports:
+            target = self._import_scope(name)
+            if target is None or target == source:
+                continue
+            problem = self.check(source, target)
+            if problem is not None:
+                code, message = problem
+                violations.append(BoundaryViolation(code, f"{message} ({name})", info.path, line))
+        return violations
+
+    def _module_scope(self, info: ModuleInfo) -> Scope | None:
+        parts = info.package_parts
+        for end in range(len(parts), 0, -1):
+            scope = self._directory_scopes.get("/".join(parts[:end]))
+            if scope is not None:
+                return scope
+        return None
+
+    def _import_scope(self, name: str) -> Scope | None:
+        while name:
+            scope = self._package_scopes.get(name)
+            if scope is not None:
+                return scope
+            name = name.rpartition(".")[0]
+        return None
@@ -0,0 +1,289 @@
+import ast
+import hashlib
+import json
+import os
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from logging import getLogger
+from pathlib import Path
+
+from .plugins import get_cache_dir
+from .tracing import span
+
+logger = getLogger(__name__)
+
+INDEX_CACHE_VERSION = 1
+# Below this many changed modules, starting worker processes costs more than parsing.
+PARALLEL_THRESHOLD = 64
+SKIPPED_DIRS = frozenset({"__pycache__", "node_modules", "venv"})
+
+
+@dataclass
+class ModuleInfo:
+    """Classes and imports of a Python module.
+
+    Attributes:
+        path: Module path relative to the package root, with "/" separators
+        module: Dotted module name, packages are named after their __init__.py
+        mtime_ns: Modification time of the file when it was parsed
+        size: File size when it was parsed
+        classes: Names of the top-level classes in definition order
+        imports: Imported absolute module or attribute names with their line numbers
+        error: Why the module couldn't be parsed, None if it was
+
+    """
+
+    path: str
+    module: str
+    mtime_ns: int
+    size: int
+    classes: list[str] = field(default_factory=list)
+    imports: list[tuple[str, int]] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def is_package(self) -> bool:
+        """Whether the module is the __init__.py of a package."""
+        return self.path.rpartition("/")[2] == "__init__.py"
+
+    @property
+    def package_parts(self) -> tuple[str, ...]:
+        """Directories of the module below the package root."""
+        return tuple(self.path.split("/")[:-1])
+
+
+def module_name(root_name: str, path: str) -> str:
+    """Get the dotted name of a module from its relative path.
+
+    Args:
+        root_name: Name of the root package
+        path: Module path relative to the root package, e.g. "domain/users/entities.py"
+
+    Returns:
+        Dotted name, e.g. "src.domain.users.entities"
+
+    """
+    parts = path.removesuffix(".py").split("/")
+    if parts[-1] == "__init__":
+        parts.pop()
+    return ".".join([root_name, *parts])
+
+
+def _resolve_import(module: str, is_package: bool, node: ast.ImportFrom) -> str:
+    package = module if is_package else module.rpartition(".")[0]
+    if node.level:
+        parts = package.split(".")
+        package = ".".join(parts[: len(parts) - node.level + 1])
+        return f"{package}.{node.module}" if node.module else package
+    return node.module or ""
+
+
+def parse_module(
+    file_path: str, module: str
+) -> tuple[list[str], list[tuple[str, int]], str | None]:
+    """Parse a module for its top-level classes and all its imports.
+
+    Relative imports are resolved against the module's package, names
+    imported from a module are recorded with the module, e.g.
+    "src.domain.users.User" for "from src.domain.users import User".
+
+    Args:
+        file_path: Path to the module file
+        module: Dotted module name
+
+    Returns:
+        Class names, imported names with line numbers and a parse error or None
+
+    """
+    try:
+        with open(file_path, "rb") as file:
+            tree = ast.parse(file.read(), filename=file_path)
+    except (OSError, SyntaxError, ValueError) as error:
+        return [], [], f"{type(error).__name__}: {error}"
+
+    classes = [node.name for node in tree.body if isinstance(node, ast.ClassDef)]
+    imports: list[tuple[str, int]] = []
+    is_package = file_path.endswith("__init__.py")
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imports.extend((alias.name, node.lineno) for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = _resolve_import(module, is_package, node)
+            imports.extend(
+                (base if alias.name == "*" else f"{base}.{alias.name}", node.lineno)
+                for alias in node.names
+            )
+    return classes, imports, None
+
+
+def _parse_chunk(
+    chunk: list[tuple[str, str]],
+) -> list[tuple[list[str], list[tuple[str, int]], str | None]]:
+    return [parse_module(file_path, module) for file_path, module in chunk]
+
+
+def scan_python_files(root: Path) -> Iterator[tuple[str, int, int]]:
+    """Find the Python files below a directory.
+
+    Hidden directories, __pycache__ and virtual environments are skipped.
+
+    Args:
+        root: Directory to scan
+
+    Yields:
+        Path relative to the root with "/" separators, modification time and size
+
+    """
+    stack = [("", str(root))]
+    while stack:
+        prefix, directory = stack.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError as error:
+            logger.warning(f"Directory skipped: {error}")
+            continue
+        for entry in entries:
+            if entry.name.startswith(".") or entry.name in SKIPPED_DIRS:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                stack.append((f"{prefix}{entry.name}/", entry.path))
+            elif entry.name.endswith(".py") and entry.is_file():
+                stat = entry.stat()
+                yield f"{prefix}{entry.name}", stat.st_mtime_ns, stat.st_size
+
+
+class CodeIndex:
+    """Index of the modules of a package, cached by modification time.
+
+    Only modules that changed since the last build are parsed again, in
+    worker processes when there are many of them. The index is cached on
+    disk per package directory.
+
+    Attributes:
+        parsed: Number of modules parsed by the last build
+        cached: Number of modules taken from the cache by the last build
+
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        root_name: str | None = None,
+        workers: int | None = None,
+        cache_path: Path | None = None,
+        use_cache: bool = True,
+    ) -> None:
+        """Initialize the index.
+
+        Args:
+            root: Root package directory
+            root_name: Dotted name of the root package, the directory name by default
+            workers: Number of parsing processes, defaults to the CPU count
+            cache_path: Cache file, defaults to one per package in the cache directory
+            use_cache: Whether to read and write the cache
+
+        """
+        self.root = root.resolve()
+        self.root_name = root_name or self.root.name
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.cache_path = cache_path or self.get_cache_path(self.root)
+        self.use_cache = use_cache
+        self.parsed = 0
+        self.cached = 0
+
+    @staticmethod
+    def get_cache_path(root: Path) -> Path:
+        """Get the default cache file of a package directory.
+
+        Args:
+            root: Resolved root package directory
+
+        Returns:
+            Cache file path, named after a hash of the directory
+
+        """
+        digest = hashlib.sha1(str(root).encode(), usedforsecurity=False).hexdigest()[:16]
+        return get_cache_dir() / "index" / f"{root.name}-{digest}.json"
+
+    def build(self) -> dict[str, ModuleInfo]:
+        """Scan the package and parse the modules that changed.
+
+        Returns:
+            Modules by relative path, sorted by path
+
+        """
+        with span("index.build", root=self.root):
+            cached = self._read_cache() if self.use_cache else {}
+            modules: dict[str, ModuleInfo] = {}
+            changed = []
+            for path, mtime_ns, size in sorted(scan_python_files(self.root)):
+                info = cached.get(path)
+                if info is None or info.mtime_ns != mtime_ns or info.size != size:
+                    info = ModuleInfo(path, module_name(self.root_name, path), mtime_ns, size)
+                    changed.append(info)
+                modules[path] = info
+
+            self._parse(changed)
+            self.parsed = len(changed)
+            self.cached = len(modules) - len(changed)
+            if self.use_cache and (changed or len(modules) != len(cached)):
+                self._write_cache(modules)
+        logger.debug(f"Indexed {len(modules)} modules, {self.parsed} parsed")
+        return modules
+
+    def _parse(self, modules: list[ModuleInfo]) -> None:
+        jobs = [(str(self.root / info.path), info.module) for info in modules]
+        workers = min(self.workers, len(jobs) // PARALLEL_THRESHOLD)
+        if workers <= 1:
+            results = _parse_chunk(jobs)
+        else:
+            size = -(-len(jobs) // (workers * 4))
+            chunks = [jobs[start : start + size] for start in range(0, len(jobs), size)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = [
+                    result for chunk in executor.map(_parse_chunk, chunks) for result in chunk
+                ]
+        for info, (classes, imports, error) in zip(modules, results, strict=True):
+            info.classes, info.imports, info.error = classes, imports, error
+
+    def _read_cache(self) -> dict[str, ModuleInfo]:
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            if (
+                data.get("version") != INDEX_CACHE_VERSION
+                or data.get("root_name") != self.root_name
+            ):
+                return {}
+            return {
+                path: ModuleInfo(
+                    path=path,
+                    module=entry["module"],
+                    mtime_ns=entry["mtime_ns"],
+                    size=entry["size"],
+                    classes=entry["classes"],
+                    imports=[(name, line) for name, line in entry["imports"]],
+                    error=entry["error"],
+                )
+                for path, entry in data["modules"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    def _write_cache(self, modules: dict[str, ModuleInfo]) -> None:
+        entries = {path: asdict(info) for path, info in modules.items()}
+        for entry in entries.values():
+            del entry["path"]
+        data = {
+            "version": INDEX_CACHE_VERSION,
+            "root": str(self.root),
+            "root_name": self.root_name,
+            "modules": entries,
+        }
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temporary_path = self.cache_path.with_suffix(f".{os.getpid()}.tmp")
+            temporary_path.write_text(json.dumps(data), encoding="utf-8")
+            temporary_path.replace(self.cache_path)
+        except OSError as error:
+            logger.debug(f"Module index not cached: {error}")
@@ -1,11 +1,15 @@
-from pathlib import Path
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import cache
 from typing import TypeVar
 
-from dishka import Provider, Scope, make_container, provide
+from dishka import Container as DishkaContainer
+from dishka import Provider, Scope, from_context, make_container, provide
 
+from src.core.manifest import GenerationManifest
 from src.core.parser import YamlParser
 from src.core.template_engine import TemplateEngine
-from src.core.utils import GenerationContext
+from src.core.utils import GenerationContext, GenerationRequest
 from src.generators import ProjectGenerator
 from src.preview.collector import PreviewCollector
 from src.schemas import ConfigModel
@@ -15,9 +19,13 @@ class MyProvider(Provider):
     """Dependency provider for project generators and configuration.
 
     This provider registers all generators and configuration objects
-    for dependency injection using the Dishka library.
+    for dependency injection using the Dishka library. Stateless services
+    with expensive setup live in the app scope, everything derived from a
+    single GenerationRequest lives in the request scope.
     """
 
+    request = from_context(provides=GenerationRequest, scope=Scope.REQUEST)
+
     @provide(scope=Scope.APP, provides=YamlParser)
     def get_parser(self) -> YamlParser:
         """Provide a YamlParser instance for the app scope.
@@ -28,103 +36,61 @@ class MyProvider(Provider):
         """
         return YamlParser()
 
-    @provide(scope=Scope.APP, provides=Path | None)
-    def get_default_file_path(self) -> Path | None:
-        """Provide a default None value for a path.
-
-        Returns:
-            Path or None
-
-        """
-        return getattr(self, "_file_path", None)
+    @provide(scope=Scope.REQUEST, provides=TemplateEngine)
+    def get_template_engine(self, request: GenerationRequest) -> TemplateEngine:
+        """Provide the template engine of the request's project.
 
-    @provide(scope=Scope.APP, provides=ConfigModel)
-    def get_config(self, parser: YamlParser, file_path: Path | None = None) -> ConfigModel:
-        """Provide a validated ConfigModel loaded from YAML configuration.
+        Engines are shared by all requests with the same template search path.
 
         Args:
-            parser: YAML parser instance
-            file_path: Optional path to a config file
+            request: Current generation request
 
         Returns:
-            Validated configuration model
+            TemplateEngine instance
 
         """
-        return parser.load(file_path)
+        return TemplateEngine.for_project(request.project_root)
 
-    def set_file_path(self, path: Path | None = None) -> None:
-        """Set the configuration path.
+    @provide(scope=Scope.REQUEST, provides=ConfigModel)
+    def get_config(self, parser: YamlParser, request: GenerationRequest) -> ConfigModel:
+        """Provide a validated ConfigModel loaded from YAML configuration.
 
         Args:
-            path: Path to a configuration file
-
-        """
-        self._file_path = path
-
-    @provide(scope=Scope.APP, provides=TemplateEngine)
-    def get_template_engine(self) -> TemplateEngine:
-        """Provide a template engine instance for the app scope.
-
-        Returns:
-            TemplateEngine instance
-
-        """
-        return TemplateEngine()
-
-    @provide(scope=Scope.APP, provides=bool)
-    def get_generator_mode(self) -> bool:
-        """Provide generation mode for the app scope.
+            parser: YAML parser instance
+            request: Current generation request
 
         Returns:
-            Current generation mode
-
-        """
-        return getattr(self, "_preview_mode", False)
-
-    def set_preview_mode(self, preview_mode: bool = False) -> None:
-        """Set preview mode value.
-
-        Args:
-            preview_mode: Whether to enable preview mode
+            Validated configuration model
 
         """
-        self._preview_mode = preview_mode
+        return parser.load(request.file_path)
 
-    def set_render_format(self, render_format: str) -> None:
-        """Set render format value.
+    @provide(scope=Scope.REQUEST, provides=PreviewCollector)
+    def get_preview_collector(
+        self, request: GenerationRequest, engine: TemplateEngine
+    ) -> PreviewCollector:
+        """Provide preview collector for the request scope.
 
         Args:
-            render_format: Format for rendering
-
-        """
-        self._render_format = render_format
-
-    @provide(scope=Scope.APP, provides=str)
-    def get_render_format(self) -> str:
-        """Provide a render format for the app scope.
-
-        Returns:
-            Current render format
-
-        """
-        return getattr(self, "_render_format", "tree")
-
-    @provide(scope=Scope.APP, provides=PreviewCollector)
-    def get_preview_collector(self) -> PreviewCollector:
-        """Provide preview collector for the app scope.
+            request: Current generation request
+            engine: Template engine
 
         Returns:
             PreviewCollector instance
 
         """
-        return PreviewCollector(render_format="tree")
+        return PreviewCollector(
+            render_format=request.render_format,
+            template_engine=engine,
+            measure=request.measure,
+        )
 
-    @provide(scope=Scope.APP, provides=ProjectGenerator)
+    @provide(scope=Scope.REQUEST, provides=ProjectGenerator)
     def get_project_generator(
         self,
         config: ConfigModel,
         engine: TemplateEngine,
-        get_generator_mode: bool,
+        request: GenerationRequest,
         preview_collector: PreviewCollector,
     ) -> ProjectGenerator:
         """Provide a ProjectGenerator instance with all dependencies injected.
@@ -132,19 +98,28 @@ class MyProvider(Provider):
         Args:
             config: Project configuration
             engine: Template engine
-            get_generator_mode: Generation mode
+            request: Current generation request
             preview_collector: Preview collector
 
         Returns:
             Configured ProjectGenerator instance
 
         """
-        if get_generator_mode:
-            return ProjectGenerator(
-                GenerationContext(config, engine, get_generator_mode, preview_collector)
+        manifest = None
+        if request.record_manifest or request.shard:
+            manifest = GenerationManifest(shard=request.shard)
+
+        return ProjectGenerator(
+            GenerationContext(
+                config=config,
+                engine=engine,
+                preview_mode=request.preview_mode,
+                preview_collector=preview_collector if request.preview_mode else None,
+                project_root=request.project_root,
+                shard=request.shard,
+                manifest=manifest,
             )
-
-        return ProjectGenerator(GenerationContext(config, engine, get_generator_mode))
+        )
 
 
 T = TypeVar("T")
@@ -154,7 +129,9 @@ class Container:
     """Dependency injection container.
 
     This class manages dependency injection using a Dishka library,
-    providing access to all registered dependencies.
+    providing access to all registered dependencies. App-scoped
+    dependencies are shared by all requests, so one container can serve
+    any number of generations in a single process.
     """
 
     def __init__(self) -> None:
@@ -163,7 +140,7 @@ class Container:
         self.di_container = make_container(self.provider)
 
     def get(self, dependency_type: type[T]) -> T:
-        """Get a dependency instance of the specified type from the container.
+        """Get an app-scoped dependency instance of the specified type.
 
         Args:
             dependency_type: Type of dependency to retrieve
@@ -175,5 +152,31 @@ class Container:
         obj: T = self.di_container.get(dependency_type)
         return obj
 
+    @contextmanager
+    def request(self, generation_request: GenerationRequest) -> Iterator[DishkaContainer]:
+        """Open a request scope for a single generation.
+
+        Args:
+            generation_request: Parameters of the generation
+
+        Yields:
+            Request-scoped container resolving config, generator and collector
+
+        """
+        with self.di_container(context={GenerationRequest: generation_request}) as request:
+            yield request
 
-container = Container()
+    def close(self) -> None:
+        """Close the container and release app-scoped dependencies."""
+        self.di_container.close()
+
+
+@cache
+def get_container() -> Container:
+    """Get the application container, building it on first use.
+
+    Returns:
+        Shared Container instance
+
+    """
+    return Container()
@@ -67,6 +67,25 @@ class YamlParseError(BaseExceptionPayload, Exception):
         return f"Configuration file could not be parsed: {self.value}"
 
 
+class ConfigValidationError(PyConstructorError):
+    """Raised when the config doesn't match the expected schema.
+
+    This exception is raised with every validation error, each pointing at
+    the position of its config entry when the source is known.
+    """
+
+    def __str__(self) -> str:
+        """Return string representation of the error.
+
+        Returns:
+            Error message listing all validation errors
+
+        """
+        errors = self.value if isinstance(self.value, list) else [self.value]
+        details = "\n".join(f"  - {error}" for error in errors)
+        return f"Configuration invalid:\n{details}"
+
+
 class StructureForPreviewNotFoundError(BaseExceptionPayload, Exception):
     """Raised when the structure for preview not found.
 
@@ -82,3 +101,83 @@ class StructureForPreviewNotFoundError(BaseExceptionPayload, Exception):
 
         """
         return f"No root node with name {self.value} found."
+
+
+class ShardingNotSupportedError(PyConstructorError):
+    """Raised when sharding is requested for a preset without bounded contexts.
+
+    Sharding partitions bounded contexts, so presets without contexts
+    can't be split across nodes.
+    """
+
+    def __str__(self) -> str:
+        """Return string representation of the error.
+
+        Returns:
+            Error message with the preset name
+
+        """
+        return f"Sharding is not supported by the {self.value} preset."
+
+
+class ManifestMergeError(PyConstructorError):
+    """Raised when shard manifests don't combine into a complete generation.
+
+    This exception is raised when shards are missing or duplicated, or when
+    units or files are generated by more than one shard.
+    """
+
+    def __str__(self) -> str:
+        """Return string representation of the error.
+
+        Returns:
+            Error message listing all problems
+
+        """
+        problems = self.value if isinstance(self.value, list) else [self.value]
+        details = "\n".join(f"  - {problem}" for problem in problems)
+        return f"Manifests could not be merged:\n{details}"
+
+
+class PresetNotFoundError(PyConstructorError):
+    """Raised when the configured preset is neither built in nor provided by a plugin."""
+
+    def __str__(self) -> str:
+        """Return string representation of the error.
+
+        Returns:
+            Error message with the preset name and the available presets
+
+        """
+        available = f" Available presets: {self.msg}." if self.msg else ""
+        return f"Unknown preset: {self.value}.{available}"
+
+
+class PluginLoadError(PyConstructorError):
+    """Raised when a plugin entry point can't be loaded.
+
+    This exception is raised when the referenced module or attribute doesn't
+    exist, or when it isn't what its entry point group expects.
+    """
+
+    def __str__(self) -> str:
+        """Return string representation of the error.
+
+        Returns:
+            Error message with the entry point value and the plugin
+
+        """
+        return f"Plugin {self.msg} could not be loaded from {self.value}"
+
+
+class LayoutNotFoundError(PyConstructorError):
+    """Raised when generated paths are needed for a preset without a layout."""
+
+    def __str__(self) -> str:
+        """Return string representation of the error.
+
+        Returns:
+            Error message with the preset name
+
+        """
+        return f"The {self.value} preset has no layout, set settings.layout to use it."
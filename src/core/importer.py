@@ -0,0 +1,279 @@
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from logging import getLogger
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from src.core.code_index import CodeIndex, ModuleInfo
+from src.generators.utils import single_form_words, singular_form
+from src.schemas.config_schema import PresetType
+
+logger = getLogger(__name__)
+
+LAYER_NAMES = frozenset(
+    {"domain", "application", "infrastructure", "interface", "interfaces", "presentation"}
+)
+CONFIG_HEADER = (
+    "# Imported from {package} by PyConstructor. https://github.com/SokolovG/PyConstructor/\n"
+)
+
+
+class _ConfigDumper(yaml.SafeDumper):
+    """Dumps component lists in flow style and everything else in block style."""
+
+
+def _represent_list(dumper: yaml.SafeDumper, data: list[Any]) -> yaml.Node:
+    flow_style = all(isinstance(item, str) for item in data)
+    return dumper.represent_sequence("tag:yaml.org,2002:seq", data, flow_style=flow_style)
+
+
+_ConfigDumper.add_representer(list, _represent_list)
+
+
+@dataclass
+class _Package:
+    """Directory of the imported package with its modules and sub-packages."""
+
+    name: str
+    init: ModuleInfo | None = None
+    modules: dict[str, ModuleInfo] = field(default_factory=dict)
+    children: dict[str, "_Package"] = field(default_factory=dict)
+
+    def leaves(self, depth: int = 0) -> list[tuple[int, "_Package"]]:
+        if not self.children:
+            return [(depth, self)]
+        return [leaf for child in self.children.values() for leaf in child.leaves(depth + 1)]
+
+
+@dataclass
+class ImportSummary:
+    """What was found in the imported package.
+
+    Attributes:
+        preset: Inferred preset name
+        modules: Number of indexed modules
+        contexts: Number of bounded contexts
+        component_types: Number of component packages
+        components: Number of components
+        skipped: Modules and packages the config can't describe
+
+    """
+
+    preset: str = PresetType.STANDARD.value
+    modules: int = 0
+    contexts: int = 0
+    component_types: int = 0
+    components: int = 0
+    skipped: list[str] = field(default_factory=list)
+
+
+class ConfigImporter:
+    """Infers a configuration from an existing package.
+
+    The package is indexed with a CodeIndex, so modules are parsed in
+    worker processes and unchanged modules come from the cache. The
+    preset is told from the depth of the package tree and from where the
+    usual layer names appear:
+
+    - simple: layer/type
+    - standard: layer/context/type, next to layer/type
+    - advanced: context/layer/type
+
+    Component types are the innermost packages, their components the
+    top-level classes of their modules. A {type}.py module holding the
+    classes means grouped components, a module per component the other
+    way round. Modules the config can't describe, e.g. next to contexts,
+    are listed as skipped.
+    """
+
+    def __init__(
+        self, package_dir: Path, workers: int | None = None, use_cache: bool = True
+    ) -> None:
+        """Initialize the importer.
+
+        Args:
+            package_dir: Root package directory of the project
+            workers: Number of parsing processes, defaults to the CPU count
+            use_cache: Whether to reuse modules parsed by previous imports
+
+        """
+        self.index = CodeIndex(package_dir, workers=workers, use_cache=use_cache)
+        self.summary = ImportSummary()
+        self._grouped_votes = 0
+        self._individual_votes = 0
+        self._init_imports = False
+
+    def import_config(self) -> dict[str, Any]:
+        """Index the package and build its configuration.
+
+        Returns:
+            Configuration data in the shape of ddd-config.yaml
+
+        """
+        modules = self.index.build()
+        self.summary = ImportSummary(modules=len(modules))
+        self._grouped_votes = self._individual_votes = 0
+        self._init_imports = False
+        root = self._build_tree(modules.values())
+
+        preset = self.detect_preset(root)
+        self.summary.preset = preset.value
+        self._skip_modules(root, "")
+        if preset == PresetType.ADVANCED:
+            layers = self._import_advanced(root)
+        else:
+            layers = self._import_layers(root, use_contexts=preset == PresetType.STANDARD)
+
+        settings = {
+            "preset": preset.value,
+            "root_name": self.index.root_name,
+            "group_components": self._grouped_votes >= self._individual_votes,
+            "init_imports": self._init_imports,
+        }
+        return {"settings": settings, "layers": layers}
+
+    def dump(self, config: dict[str, Any]) -> str:
+        """Serialize an imported configuration.
+
+        Args:
+            config: Configuration data from import_config
+
+        Returns:
+            YAML document, lists of components in flow style
+
+        """
+        header = CONFIG_HEADER.format(package=f"{self.index.root_name}/")
+        body = yaml.dump(
+            config, Dumper=_ConfigDumper, sort_keys=False, default_flow_style=False, width=100
+        )
+        return header + body
+
+    @staticmethod
+    def detect_preset(root: _Package) -> PresetType:
+        """Tell the preset from the shape of the package tree.
+
+        Args:
+            root: Root package of the tree
+
+        Returns:
+            Simple for two levels of type-like packages, advanced if layer
+            names are found below the top level rather than at it, standard
+            otherwise
+
+        """
+        leaves = root.leaves()
+        if all(depth <= 2 for depth, _ in leaves):
+            type_leaves = (package for depth, package in leaves if depth == 2)
+            if all(_is_component_type(package) for package in type_leaves):
+                return PresetType.SIMPLE
+            return PresetType.STANDARD
+
+        top_level = set(root.children)
+        second_level = {name for child in root.children.values() for name in child.children}
+        top_hits = len(top_level & LAYER_NAMES)
+        second_hits = len(second_level & LAYER_NAMES)
+        if second_hits > top_hits:
+            return PresetType.ADVANCED
+        # Without layer names, contexts outnumber the layers containing them.
+        if second_hits == top_hits == 0 and len(top_level) > len(second_level):
+            return PresetType.ADVANCED
+        return PresetType.STANDARD
+
+    def _build_tree(self, modules: Iterable[ModuleInfo]) -> _Package:
+        root = _Package(self.index.root_name)
+        for info in modules:
+            package = root
+            for part in info.package_parts:
+                package = package.children.setdefault(part, _Package(part))
+            if info.is_package:
+                package.init = info
+            else:
+                package.modules[info.path.rpartition("/")[2]] = info
+            if info.error:
+                logger.warning(f"{info.path} skipped: {info.error}")
+        return root
+
+    def _skip_modules(self, package: _Package, path: str) -> None:
+        """Record the modules of a layer or context package, the config can't describe them."""
+        self.summary.skipped.extend(f"{path}{name}" for name in package.modules)
+
+    def _import_layers(self, root: _Package, use_contexts: bool) -> dict[str, Any]:
+        layers: dict[str, Any] = {}
+        for layer_name, layer in root.children.items():
+            self._skip_modules(layer, f"{layer_name}/")
+            data: dict[str, Any] = {}
+            contexts = []
+            for name, child in layer.children.items():
+                if use_contexts and (child.children or not child.modules):
+                    contexts.append(self._import_context(name, child, f"{layer_name}/"))
+                else:
+                    data[name] = self._import_components(child, f"{layer_name}/{name}/")
+            if contexts:
+                data = {"contexts": contexts, **data}
+            # An empty layer is generated only if it holds something, even no contexts.
+            layers[layer_name] = data or {"contexts": []}
+        return layers
+
+    def _import_context(self, name: str, package: _Package, path: str) -> dict[str, Any]:
+        self.summary.contexts += 1
+        self._skip_modules(package, f"{path}{name}/")
+        context: dict[str, Any] = {"name": name}
+        for type_name, child in package.children.items():
+            context[type_name] = self._import_components(child, f"{path}{name}/{type_name}/")
+        return context
+
+    def _import_advanced(self, root: _Package) -> dict[str, Any]:
+        contexts = []
+        for name, package in root.children.items():
+            self.summary.contexts += 1
+            self._skip_modules(package, f"{name}/")
+            context: dict[str, Any] = {"name": name}
+            for layer_name, layer in package.children.items():
+                self._skip_modules(layer, f"{name}/{layer_name}/")
+                context[layer_name] = {
+                    type_name: self._import_components(child, f"{name}/{layer_name}/{type_name}/")
+                    for type_name, child in layer.children.items()
+                }
+            contexts.append(context)
+        return {"contexts": contexts}
+
+    def _import_components(self, package: _Package, path: str) -> list[str]:
+        if package.children:
+            self.summary.skipped.extend(f"{path}{name}/" for name in package.children)
+        self.summary.component_types += 1
+        exported: dict[str, int] = {}
+        if package.init is not None and package.init.imports:
+            self._init_imports = True
+            for position, (name, _) in enumerate(package.init.imports):
+                exported.setdefault(name.rpartition(".")[2], position)
+
+        component_type = package.name
+        grouped = package.modules.get(f"{component_type}.py")
+        if grouped is not None:
+            self._grouped_votes += 1
+        elif package.modules:
+            self._individual_votes += 1
+
+        components: dict[str, None] = {}
+        for module_name, info in package.modules.items():
+            if info is not grouped and not info.classes:
+                self.summary.skipped.append(f"{path}{module_name}")
+            components.update(dict.fromkeys(info.classes))
+        self.summary.components += len(components)
+        # Modules are read in path order, the __init__ imports keep the configured order.
+        return sorted(components, key=lambda name: exported.get(name, len(exported)))
+
+
+def _is_component_type(package: _Package) -> bool:
+    """Whether a package looks like the package of a component type.
+
+    Known component types are recognized by name, others by the modules
+    the generator writes: {type}.py or a module per component.
+    """
+    component_type = package.name
+    if component_type in single_form_words or f"{component_type}.py" in package.modules:
+        return True
+    suffix = f"_{singular_form(component_type).lower()}.py"
+    return any(name.endswith(suffix) for name in package.modules)
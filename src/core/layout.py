@@ -0,0 +1,231 @@
+from dataclasses import dataclass
+from pathlib import Path
+from string import Formatter
+
+PLACEHOLDERS = frozenset({"root", "layer", "context", "type"})
+
+
+@dataclass(frozen=True)
+class _Segment:
+    """One directory or package level of a pattern."""
+
+    template: str
+    fields: frozenset[str]
+
+    def format(self, values: dict[str, str | None]) -> str:
+        if self.template == "{type}":
+            return values["type"] or ""
+        return self.template.format_map(values)
+
+
+def _parse_pattern(pattern: str, separator: str) -> tuple[_Segment, ...]:
+    """Split a pattern into segments and check its placeholders.
+
+    Args:
+        pattern: Path or import pattern
+        separator: Segment separator, "/" or "."
+
+    Returns:
+        Segments of the pattern
+
+    Raises:
+        ValueError: If the pattern is malformed
+
+    """
+    segments = []
+    for template in pattern.split(separator):
+        fields = set()
+        try:
+            parsed = list(Formatter().parse(template))
+        except ValueError as error:
+            raise ValueError(f"Invalid layout pattern {pattern!r}: {error}") from error
+        for _, field_name, format_spec, conversion in parsed:
+            if field_name is None:
+                continue
+            if field_name not in PLACEHOLDERS or format_spec or conversion:
+                raise ValueError(
+                    f"Invalid placeholder {{{field_name}}} in layout pattern {pattern!r}, "
+                    f"use {', '.join(f'{{{name}}}' for name in sorted(PLACEHOLDERS))}"
+                )
+            fields.add(field_name)
+        if not template:
+            raise ValueError(f"Empty segment in layout pattern {pattern!r}")
+        segments.append(_Segment(template, frozenset(fields)))
+
+    if segments[0].template != "{root}" or any("root" in s.fields for s in segments[1:]):
+        raise ValueError(f"Layout pattern {pattern!r} must start with {{root}} and use it once")
+    if any("type" in segment.fields for segment in segments[:-1]) or (
+        "type" not in segments[-1].fields
+    ):
+        raise ValueError(f"Layout pattern {pattern!r} must end with a {{type}} segment")
+    if not any("layer" in segment.fields for segment in segments):
+        raise ValueError(f"Layout pattern {pattern!r} must contain {{layer}}")
+    return tuple(segments)
+
+
+@dataclass(frozen=True)
+class Layout:
+    """Project layout described by patterns.
+
+    Patterns are made of segments with {root}, {layer}, {context} and {type}
+    placeholders. Segments with {context} are left out for components outside
+    bounded contexts, and a pattern without {context} ignores contexts.
+
+    Attributes:
+        path: Directory pattern of a component type, e.g. "{root}/{layer}/{context}/{type}"
+        imports: Dotted package pattern of a component type, derived from the path by default
+
+    """
+
+    path: str
+    imports: str | None = None
+
+    def __post_init__(self) -> None:
+        """Check the patterns."""
+        _parse_pattern(self.path, "/")
+        if self.imports is not None:
+            _parse_pattern(self.imports, ".")
+
+    def compile(self, root_path: Path, root_name: str) -> "CompiledLayout":
+        """Compile the layout for one project.
+
+        Args:
+            root_path: Root package directory
+            root_name: Root package name used in imports
+
+        Returns:
+            Compiled layout
+
+        """
+        return CompiledLayout(self, root_path, root_name)
+
+
+class CompiledLayout:
+    """Layout bound to a project root, formatting paths and imports.
+
+    Directories and import prefixes are computed once per layer and context
+    and reused for all their component types.
+    """
+
+    def __init__(self, layout: Layout, root_path: Path, root_name: str) -> None:
+        """Compile a layout.
+
+        Args:
+            layout: Layout to compile
+            root_path: Root package directory
+            root_name: Root package name used in imports
+
+        """
+        path_segments = _parse_pattern(layout.path, "/")
+        import_segments = (
+            _parse_pattern(layout.imports, ".")
+            if layout.imports is not None
+            else tuple(path_segments)
+        )
+        self.layout = layout
+        self.root_path = root_path
+        self.root_name = root_name
+        self._packages = path_segments[1:-1]
+        self._type_segment = path_segments[-1]
+        self._import_packages = import_segments[1:-1]
+        self._import_type_segment = import_segments[-1]
+        self._scopes: dict[tuple[str | None, str | None], tuple[Path, ...]] = {}
+        self._prefixes: dict[tuple[str, str | None], tuple[tuple[Path, ...], str]] = {}
+
+    def scope_directories(self, layer: str | None, context: str | None) -> tuple[Path, ...]:
+        """Get the package directories known when entering a layer or a context.
+
+        These are the directories below the root up to the first segment
+        depending on something not entered yet, e.g. "{root}/{layer}/{context}/{type}"
+        gives the layer directory for a layer alone.
+
+        Args:
+            layer: Entered layer, None if not known yet
+            context: Entered context, None if not known yet
+
+        Returns:
+            Package directories from the outermost one
+
+        """
+        key = (layer, context)
+        directories = self._scopes.get(key)
+        if directories is None:
+            values = {"layer": layer, "context": context}
+            path = self.root_path
+            found = []
+            for segment in self._packages:
+                if any(values.get(name) is None for name in segment.fields):
+                    break
+                path = path / segment.format(values)
+                found.append(path)
+            directories = self._scopes[key] = tuple(found)
+        return directories
+
+    def _prefix(self, layer: str, context: str | None) -> tuple[tuple[Path, ...], str]:
+        key = (layer, context)
+        prefix = self._prefixes.get(key)
+        if prefix is None:
+            values = {"layer": layer, "context": context}
+            path = self.root_path
+            directories = []
+            for segment in self._packages:
+                if context is None and "context" in segment.fields:
+                    continue
+                path = path / segment.format(values)
+                directories.append(path)
+            packages = [self.root_name] + [
+                segment.format(values)
+                for segment in self._import_packages
+                if context is not None or "context" not in segment.fields
+            ]
+            prefix = self._prefixes[key] = (tuple(directories), ".".join(packages) + ".")
+        return prefix
+
+    def scope_package(self, layer: str, context: str | None) -> tuple[Path, str]:
+        """Get the package holding the component types of a layer or a context.
+
+        Args:
+            layer: Layer name
+            context: Bounded context, None outside contexts
+
+        Returns:
+            Package directory and dotted package, e.g. "src.domain.users"
+
+        """
+        directories, prefix = self._prefix(layer, context)
+        return directories[-1] if directories else self.root_path, prefix.removesuffix(".")
+
+    def component_directories(
+        self, layer: str, context: str | None, component_type: str
+    ) -> tuple[Path, ...]:
+        """Get the package directories leading to a component type.
+
+        Args:
+            layer: Layer name
+            context: Bounded context, None outside contexts
+            component_type: Component type
+
+        Returns:
+            Package directories from the outermost one, ending with the component type's
+
+        """
+        directories, _ = self._prefix(layer, context)
+        parent = directories[-1] if directories else self.root_path
+        values = {"layer": layer, "context": context, "type": component_type}
+        return (*directories, parent / self._type_segment.format(values))
+
+    def import_package(self, layer: str, context: str | None, component_type: str) -> str:
+        """Get the dotted package of a component type.
+
+        Args:
+            layer: Layer name
+            context: Bounded context, None outside contexts
+            component_type: Component type
+
+        Returns:
+            Package, e.g. "src.domain.users.entities"
+
+        """
+        _, prefix = self._prefix(layer, context)
+        values = {"layer": layer, "context": context, "type": component_type}
+        return prefix + self._import_type_segment.format(values)
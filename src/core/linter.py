@@ -0,0 +1,267 @@
+import keyword
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from src.core.layout import CompiledLayout, Layout
+from src.core.parser import SourceMap, SourcePath, locate
+from src.generators.project_generator import ProjectGenerator
+from src.generators.utils import component_module_name
+from src.schemas import ConfigModel
+from src.schemas.config_schema import ContextsLayout, ContextView, LayerView
+
+DUPLICATE_NAME = "duplicate-name"
+INVALID_IDENTIFIER = "invalid-identifier"
+MODULE_COLLISION = "module-collision"
+CASE_COLLISION = "case-collision"
+
+
+@dataclass(frozen=True)
+class LintIssue:
+    """Problem found in a configuration.
+
+    Attributes:
+        code: Kind of problem, e.g. "duplicate-name"
+        message: Description of the problem
+        path: Config path of the offending entry
+        line: One-based line of the entry, None if unknown
+        column: One-based column of the entry, None if unknown
+
+    """
+
+    code: str
+    message: str
+    path: SourcePath
+    line: int | None = None
+    column: int | None = None
+
+    def format(self, file_path: Path) -> str:
+        """Format the issue like compiler diagnostics.
+
+        Args:
+            file_path: Path of the linted config file
+
+        Returns:
+            "file:line:column: message [code]", without line and column if unknown
+
+        """
+        position = f":{self.line}:{self.column}" if self.line is not None else ""
+        return f"{file_path}{position}: {self.message} [{self.code}]"
+
+
+class ConfigLinter:
+    """Semantic checks of a validated configuration.
+
+    The config is walked once, every check looks up hash indexes of what
+    was seen so far, so linting stays linear in the number of components:
+
+    - duplicate contexts and components within their scope
+    - layer, context, component type and component names that aren't
+      valid Python identifiers
+    - components generating the same module, after camel_to_snake
+    - generated paths differing only in case, which collide on
+      case-insensitive filesystems
+
+    Paths are checked with the layout of the preset, presets without a
+    layout only get the name checks.
+    """
+
+    def __init__(self, config: ConfigModel, source_map: SourceMap | None = None) -> None:
+        """Initialize the linter.
+
+        Args:
+            config: Validated configuration model
+            source_map: Source positions of the config entries
+
+        """
+        self.config = config
+        self.source_map = source_map or {}
+        self.issues: list[LintIssue] = []
+        self._layout: CompiledLayout | None = None
+        self._files: dict[str, tuple[str, SourcePath]] = {}
+        self._folded_paths: dict[str, str] = {}
+        self._case_collisions: set[str] = set()
+        self._parents: tuple[Path, ...] = ()
+
+    def lint(self) -> list[LintIssue]:
+        """Check the configuration.
+
+        Returns:
+            Issues in configuration order
+
+        """
+        self.issues = []
+        self._files = {}
+        self._folded_paths = {}
+        self._case_collisions = set()
+        self._parents = ()
+        settings = self.config.settings
+        layout = self.get_layout()
+        self._layout = (
+            layout.compile(Path(settings.root_name), settings.root_name) if layout else None
+        )
+
+        if settings.use_contexts and settings.contexts_layout == ContextsLayout.NESTED:
+            self._lint_nested()
+        else:
+            for layer in self.config.layers.iter_layers():
+                self._lint_layer(layer, settings.use_contexts)
+        return self.issues
+
+    def get_layout(self) -> Layout | None:
+        """Get the layout the config is generated with.
+
+        Returns:
+            Layout of the settings or of the preset, None if the preset has none
+
+        """
+        settings = self.config.settings
+        if settings.layout is not None:
+            return settings.layout
+        preset_generator = ProjectGenerator.PRESET_GENERATORS.get(settings.preset_name)
+        layout: Layout | None = getattr(preset_generator, "LAYOUT", None)
+        return layout
+
+    def _lint_layer(self, layer: LayerView, use_contexts: bool) -> None:
+        path: SourcePath = ("layers", layer.name)
+        self._check_identifier(layer.name, path, "Layer")
+        self._check_scope(layer.name, None, path)
+        if use_contexts:
+            for context, context_path in self._unique_contexts(
+                layer.contexts(), (*path, "contexts")
+            ):
+                self._check_scope(layer.name, context.name, (*context_path, "name"))
+                for component_type, components in context.components():
+                    self._lint_components(
+                        (*context_path, component_type),
+                        layer.name,
+                        context.name,
+                        component_type,
+                        components,
+                    )
+        for component_type, components in layer.components():
+            if components:
+                self._lint_components(
+                    (*path, component_type), layer.name, None, component_type, components
+                )
+
+    def _lint_nested(self) -> None:
+        contexts = self.config.layers.iter_contexts()
+        for context, context_path in self._unique_contexts(contexts, ("layers", "contexts")):
+            self._check_scope(None, context.name, (*context_path, "name"))
+            for layer in context.layers():
+                layer_path = (*context_path, layer.name)
+                self._check_identifier(layer.name, layer_path, "Layer")
+                self._check_scope(layer.name, context.name, layer_path)
+                for component_type, components in layer.components():
+                    self._lint_components(
+                        (*layer_path, component_type),
+                        layer.name,
+                        context.name,
+                        component_type,
+                        components,
+                    )
+
+    def _unique_contexts(
+        self, contexts: Iterable[ContextView], path: SourcePath
+    ) -> Iterator[tuple[ContextView, SourcePath]]:
+        """Check context names and yield the contexts with their paths.
+
+        Duplicated contexts are reported and skipped.
+        """
+        seen: set[str] = set()
+        for index, context in enumerate(contexts):
+            context_path = (*path, index)
+            name_path = (*context_path, "name")
+            if context.name in seen:
+                self._report(
+                    DUPLICATE_NAME, f"Context {context.name} is defined more than once", name_path
+                )
+                continue
+            seen.add(context.name)
+            self._check_identifier(context.name, name_path, "Context")
+            yield context, context_path
+
+    def _lint_components(
+        self,
+        path: SourcePath,
+        layer: str,
+        context: str | None,
+        component_type: str,
+        components: Sequence[object],
+    ) -> None:
+        self._check_identifier(component_type, path, "Component type")
+        group_components = self.config.settings.group_components
+        directory = None
+        if self._layout is not None:
+            directories = self._layout.component_directories(layer, context, component_type)
+            # Parent directories are shared by the component types of a scope.
+            if directories[:-1] != self._parents:
+                self._parents = directories[:-1]
+                for parent in self._parents:
+                    self._check_path(parent.as_posix(), path)
+            directory = directories[-1].as_posix()
+            self._check_path(directory, path)
+            if group_components:
+                self._check_file(f"{directory}/{component_type}.py", component_type, path)
+
+        seen: set[str] = set()
+        for index, component in enumerate(components):
+            name = str(component)
+            item_path = (*path, index)
+            if name in seen:
+                self._report(
+                    DUPLICATE_NAME,
+                    f"Component {name} is listed more than once in {component_type}",
+                    item_path,
+                )
+                continue
+            seen.add(name)
+            self._check_identifier(name, item_path, "Component")
+            if directory is not None and not group_components:
+                module_name = component_module_name(name, component_type)
+                self._check_file(f"{directory}/{module_name}.py", name, item_path)
+
+    def _check_scope(self, layer: str | None, context: str | None, path: SourcePath) -> None:
+        if self._layout is not None:
+            for directory in self._layout.scope_directories(layer, context):
+                self._check_path(directory.as_posix(), path)
+
+    def _check_identifier(self, name: str, path: SourcePath, kind: str) -> None:
+        if not name.isidentifier():
+            self._report(
+                INVALID_IDENTIFIER, f"{kind} {name!r} is not a valid Python identifier", path
+            )
+        elif keyword.iskeyword(name):
+            self._report(INVALID_IDENTIFIER, f"{kind} {name!r} is a Python keyword", path)
+
+    def _check_file(self, file_path: str, name: str, path: SourcePath) -> None:
+        first = self._files.get(file_path)
+        if first is not None:
+            first_name, first_path = first
+            self._report(
+                MODULE_COLLISION,
+                f"{name} and {first_name} both generate {file_path}"
+                f"{self._position_suffix(first_path)}",
+                path,
+            )
+            return
+        self._files[file_path] = (name, path)
+        self._check_path(file_path, path)
+
+    def _check_path(self, generated_path: str, path: SourcePath) -> None:
+        first = self._folded_paths.setdefault(generated_path.casefold(), generated_path)
+        if first == generated_path or generated_path in self._case_collisions:
+            return
+        self._case_collisions.add(generated_path)
+        # Paths below a colliding directory are reported with the directory.
+        if generated_path.rpartition("/")[0] not in self._case_collisions:
+            self._report(CASE_COLLISION, f"{generated_path} and {first} differ only in case", path)
+
+    def _position_suffix(self, path: SourcePath) -> str:
+        position = locate(self.source_map, path)
+        return f" (line {position[0]})" if position else ""
+
+    def _report(self, code: str, message: str, path: SourcePath) -> None:
+        line, column = locate(self.source_map, path) or (None, None)
+        self.issues.append(LintIssue(code, message, path, line, column))
@@ -0,0 +1,253 @@
+import hashlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from src.core.exceptions import ManifestMergeError
+
+MANIFEST_VERSION = 1
+
+
+def shard_of(key: str, count: int) -> int:
+    """Get the shard a generation unit belongs to.
+
+    Uses a stable hash, so the partitioning doesn't depend on the process,
+    the Python version or the order of the config.
+
+    Args:
+        key: Generation unit key, usually a bounded context name
+        count: Total number of shards
+
+    Returns:
+        Zero-based shard index
+
+    """
+    digest = hashlib.sha1(key.encode("utf-8"), usedforsecurity=False).digest()
+    return int.from_bytes(digest[:8], "big") % count
+
+
+@dataclass(frozen=True)
+class ShardSpec:
+    """Part of the generation handled by a single node.
+
+    Attributes:
+        index: Zero-based index of the shard
+        count: Total number of shards
+
+    """
+
+    index: int
+    count: int
+
+    @classmethod
+    def parse(cls, value: str) -> "ShardSpec":
+        """Parse a shard from the INDEX/COUNT notation.
+
+        Args:
+            value: Shard definition, e.g. "0/4"
+
+        Returns:
+            Parsed shard
+
+        Raises:
+            ValueError: If the value isn't a valid shard definition
+
+        """
+        index, separator, count = value.partition("/")
+        if not separator or not index.isdigit() or not count.isdigit():
+            raise ValueError(f"Shard must look like INDEX/COUNT, got {value!r}")
+
+        shard = cls(int(index), int(count))
+        if shard.count < 1 or shard.index >= shard.count:
+            raise ValueError(f"Shard index must be between 0 and {shard.count - 1}")
+        return shard
+
+    def owns(self, key: str) -> bool:
+        """Check whether a generation unit belongs to this shard.
+
+        Args:
+            key: Generation unit key
+
+        Returns:
+            True if this shard generates the unit
+
+        """
+        return shard_of(key, self.count) == self.index
+
+    def default_manifest_name(self) -> str:
+        """Get the default file name of this shard's manifest.
+
+        Returns:
+            Manifest file name
+
+        """
+        return f"pyc-manifest.shard-{self.index}-of-{self.count}.json"
+
+
+@dataclass
+class GenerationManifest:
+    """Record of everything a generation produced.
+
+    Units are the partitioning keys (bounded contexts) a generation owned,
+    files are generated modules. Directories may be shared between shards.
+
+    Attributes:
+        shard: Shard that produced the manifest, None for a full generation
+        units: Generated unit keys
+        files: Paths of written files
+        directories: Paths of created directories
+
+    """
+
+    shard: ShardSpec | None = None
+    units: list[str] = field(default_factory=list)
+    files: list[str] = field(default_factory=list)
+    directories: list[str] = field(default_factory=list)
+
+    def record_unit(self, key: str) -> None:
+        """Record a generated unit.
+
+        Args:
+            key: Generation unit key
+
+        """
+        self.units.append(key)
+
+    def record_file(self, path: Path) -> None:
+        """Record a written file.
+
+        Args:
+            path: File path
+
+        """
+        self.files.append(str(path))
+
+    def record_directory(self, path: Path) -> None:
+        """Record a created directory.
+
+        Args:
+            path: Directory path
+
+        """
+        self.directories.append(str(path))
+
+    def to_dict(self, project_root: Path) -> dict[str, Any]:
+        """Convert the manifest to its JSON representation.
+
+        Args:
+            project_root: Directory paths are made relative to
+
+        Returns:
+            JSON-serializable manifest
+
+        """
+
+        def relative(paths: list[str]) -> list[str]:
+            return sorted({Path(path).relative_to(project_root).as_posix() for path in paths})
+
+        shard = {"index": self.shard.index, "count": self.shard.count} if self.shard else None
+        return {
+            "version": MANIFEST_VERSION,
+            "shard": shard,
+            "units": sorted(set(self.units)),
+            "files": relative(self.files),
+            "directories": relative(self.directories),
+        }
+
+    def write(self, path: Path, project_root: Path) -> None:
+        """Write the manifest as JSON.
+
+        Args:
+            path: Manifest file path
+            project_root: Directory paths are made relative to
+
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(project_root), file, indent=2)
+
+
+def load_manifest(path: Path) -> dict[str, Any]:
+    """Load a manifest written by GenerationManifest.write.
+
+    Args:
+        path: Manifest file path
+
+    Returns:
+        Manifest data
+
+    """
+    with open(path, encoding="utf-8") as file:
+        data: dict[str, Any] = json.load(file)
+    return data
+
+
+def _find_duplicates(manifests: list[dict[str, Any]], key: str) -> dict[str, list[int]]:
+    owners: dict[str, list[int]] = {}
+    for manifest in manifests:
+        shard_index = manifest["shard"]["index"]
+        for item in manifest[key]:
+            owners.setdefault(item, []).append(shard_index)
+    return {item: shards for item, shards in owners.items() if len(shards) > 1}
+
+
+def merge_manifests(
+    manifests: list[dict[str, Any]], expected: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """Combine shard manifests and verify the shards cover the generation exactly once.
+
+    Args:
+        manifests: Shard manifests
+        expected: Optional full manifest the merged result must match
+
+    Returns:
+        Merged manifest
+
+    Raises:
+        ManifestMergeError: If shards are missing, duplicated or inconsistent
+
+    """
+    problems = []
+    if not manifests:
+        raise ManifestMergeError(["No manifests given"])
+
+    if any(manifest.get("shard") is None for manifest in manifests):
+        raise ManifestMergeError(["Only shard manifests can be merged"])
+
+    counts = {manifest["shard"]["count"] for manifest in manifests}
+    if len(counts) > 1:
+        raise ManifestMergeError([f"Manifests disagree on the shard count: {sorted(counts)}"])
+
+    count = counts.pop()
+    indices = [manifest["shard"]["index"] for manifest in manifests]
+    for index in range(count):
+        if index not in indices:
+            problems.append(f"Missing shard {index}/{count}")
+        elif indices.count(index) > 1:
+            problems.append(f"Duplicate shard {index}/{count}")
+
+    for key in ("units", "files"):
+        for item, shards in sorted(_find_duplicates(manifests, key).items()):
+            problems.append(f"Duplicate {key[:-1]} {item} in shards {shards}")
+
+    merged: dict[str, Any] = {
+        "version": MANIFEST_VERSION,
+        "shard": None,
+        "units": sorted({unit for manifest in manifests for unit in manifest["units"]}),
+        "files": sorted({file for manifest in manifests for file in manifest["files"]}),
+        "directories": sorted(
+            {directory for manifest in manifests for directory in manifest["directories"]}
+        ),
+    }
+
+    if expected is not None:
+        for key in ("units", "files", "directories"):
+            merged_items, expected_items = set(merged[key]), set(expected[key])
+            for item in sorted(expected_items - merged_items):
+                problems.append(f"Missing {key[:-1]} {item}")
+            for item in sorted(merged_items - expected_items):
+                problems.append(f"Unexpected {key[:-1]} {item}")
+
+    if problems:
+        raise ManifestMergeError(problems)
+    return merged
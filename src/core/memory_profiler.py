@@ -0,0 +1,201 @@
+import os
+import sysconfig
+import threading
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from . import tracing
+from .tracing import Span, Subscriber, subscribe, unsubscribe
+
+# Spans whose boundaries get snapshots, nested spans belong to the enclosing phase.
+MEMORY_PHASES = {
+    "config.parse": "parse",
+    "config.validate": "validate",
+    "project.generate": "plan",
+    "preview.render": "display",
+}
+# Allocation sites of the profiler itself and of the import machinery aren't interesting.
+IGNORED_FILES = frozenset(
+    {
+        __file__,
+        tracing.__file__,
+        tracemalloc.__file__,
+        "<frozen importlib._bootstrap>",
+        "<frozen importlib._bootstrap_external>",
+        "<unknown>",
+    }
+)
+
+
+@dataclass
+class PhaseMemory:
+    """Memory usage of one run of a phase.
+
+    Attributes:
+        phase: Phase name
+        start: Traced memory at the start of the phase in bytes
+        end: Traced memory at the end of the phase in bytes
+        peak: Peak traced memory during the phase in bytes
+        top_sites: Allocation sites with the largest growth during the phase
+
+    """
+
+    phase: str
+    start: int
+    end: int = 0
+    peak: int = 0
+    top_sites: list[tracemalloc.StatisticDiff] = field(default_factory=list)
+
+    @property
+    def retained(self) -> int:
+        """Memory allocated during the phase and still alive at its end."""
+        return self.end - self.start
+
+
+class MemoryProfiler(Subscriber):
+    """Takes tracemalloc snapshots at the boundaries of generation phases.
+
+    For every phase the profiler records traced memory at its start and end,
+    the peak in between and the allocation sites that grew the most. Only
+    the outermost phase is measured, when phases of concurrent batch
+    generations overlap, the first one started wins.
+    """
+
+    def __init__(self, top: int = 5) -> None:
+        """Initialize the profiler.
+
+        Args:
+            top: Number of allocation sites reported per phase
+
+        """
+        self.top = top
+        self.phases: list[PhaseMemory] = []
+        self.peak = 0
+        self._lock = threading.Lock()
+        self._owner: Span | None = None
+        self._snapshot: tracemalloc.Snapshot | None = None
+        self._snapshot_size = 0
+
+    def on_start(self, span: Span) -> None:
+        """Snapshot memory when a phase starts.
+
+        Args:
+            span: Started span
+
+        """
+        phase = MEMORY_PHASES.get(span.name)
+        if phase is None:
+            return
+        with self._lock:
+            if self._owner is not None:
+                return
+            self._owner = span
+            current, peak = tracemalloc.get_traced_memory()
+            self.peak = max(self.peak, peak)
+            self.phases.append(PhaseMemory(phase, start=current))
+            self._snapshot = tracemalloc.take_snapshot()
+            # The snapshot is traced too, it's subtracted from the following measurements.
+            self._snapshot_size = tracemalloc.get_traced_memory()[0] - current
+            tracemalloc.reset_peak()
+
+    def on_end(self, span: Span) -> None:
+        """Snapshot memory when a phase ends and compare it with its start.
+
+        Args:
+            span: Ended span
+
+        """
+        with self._lock:
+            if self._owner is not span or self._snapshot is None:
+                return
+            current, peak = tracemalloc.get_traced_memory()
+            phase = self.phases[-1]
+            phase.end = current - self._snapshot_size
+            phase.peak = peak - self._snapshot_size
+            self.peak = max(self.peak, phase.peak)
+            growth = tracemalloc.take_snapshot().compare_to(self._snapshot, "lineno")
+            # Filtering the few grouped sites is much cheaper than filtering every trace.
+            phase.top_sites = [
+                site
+                for site in growth
+                if site.size_diff > 0 and site.traceback[0].filename not in IGNORED_FILES
+            ][: self.top]
+            self._owner = None
+            self._snapshot = None
+            tracemalloc.reset_peak()
+
+    @staticmethod
+    def _short_path(filename: str) -> str:
+        """Shorten paths of installed packages, the standard library and the working directory."""
+        _, marker, package_path = filename.rpartition(f"site-packages{os.sep}")
+        if marker:
+            return package_path
+        for base_dir in (sysconfig.get_paths()["stdlib"], os.getcwd()):
+            if filename.startswith(base_dir + os.sep):
+                return os.path.relpath(filename, base_dir)
+        return filename
+
+    def print_report(self) -> None:
+        """Print per-phase memory usage and top allocation sites to stderr."""
+        # Imported here, like in the phase profiler, rich isn't needed unless reporting.
+        from rich.console import Console
+        from rich.table import Table
+
+        console = Console(stderr=True)
+        table = Table(title="Memory by phase, KB")
+        table.add_column("Phase")
+        table.add_column("Start", justify="right")
+        table.add_column("Retained", justify="right")
+        table.add_column("Peak", justify="right")
+        for phase in self.phases:
+            table.add_row(
+                phase.phase,
+                f"{phase.start / 1024:.1f}",
+                f"{phase.retained / 1024:+.1f}",
+                f"{phase.peak / 1024:.1f}",
+            )
+        console.print(table)
+
+        for index, phase in enumerate(self.phases, start=1):
+            if not phase.top_sites:
+                continue
+            table = Table(title=f"Top allocation sites: {index}. {phase.phase}")
+            table.add_column("Site", overflow="fold")
+            table.add_column("Size, KB", justify="right")
+            table.add_column("Blocks", justify="right")
+            for site in phase.top_sites:
+                frame = site.traceback[0]
+                table.add_row(
+                    f"{self._short_path(frame.filename)}:{frame.lineno}",
+                    f"{site.size_diff / 1024:+.1f}",
+                    f"{site.count_diff:+d}",
+                )
+            console.print(table)
+
+        console.print(f"Peak traced memory: {self.peak / 1024:.1f} KB")
+
+
+@contextmanager
+def memory_profiling(profiler: MemoryProfiler) -> Iterator[MemoryProfiler]:
+    """Trace memory allocations of the enclosed code.
+
+    Args:
+        profiler: Memory profiler to subscribe
+
+    Yields:
+        Subscribed profiler
+
+    """
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    subscribe(profiler)
+    try:
+        yield profiler
+    finally:
+        unsubscribe(profiler)
+        profiler.peak = max(profiler.peak, tracemalloc.get_traced_memory()[1])
+        if started:
+            tracemalloc.stop()
@@ -1,11 +1,160 @@
+import gc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import pydantic
+import pydantic_core
 import yaml
+from yaml.nodes import MappingNode, Node, ScalarNode, SequenceNode
 
 from ..schemas import ConfigModel
-from .exceptions import ConfigFileNotFoundError, YamlParseError
+from .exceptions import (
+    ConfigFileNotFoundError,
+    ConfigValidationError,
+    PresetNotFoundError,
+    YamlParseError,
+)
+from .tracing import span
+
+# The libyaml based loader builds the same nodes, when PyYAML is compiled with it.
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+SourcePath = tuple[str | int, ...]
+SourceMap = dict[SourcePath, tuple[int, int]]
+
+
+def _record_names(source_map: SourceMap, path: SourcePath, node: ScalarNode) -> None:
+    """Record the positions of the names in a comma-separated scalar.
+
+    Only single-line plain and quoted scalars are split, their value is
+    their source text.
+    """
+    mark = node.start_mark
+    quoted = node.style in ("'", '"')
+    if mark.line != node.end_mark.line or not (quoted or not node.style):
+        return
+    column = mark.column + (1 if quoted else 0)
+    index = 0
+    for part in node.value.split(","):
+        name = part.strip()
+        if name:
+            offset = len(part) - len(part.lstrip())
+            source_map[(*path, index)] = (mark.line + 1, column + offset + 1)
+            index += 1
+        column += len(part) + 1
+
+
+def build_source_map(root: Node) -> SourceMap:
+    """Map config paths to the positions of their YAML nodes.
+
+    Mapping entries point at their keys, sequence items at the items.
+    The names of a comma-separated components string under "layers" get
+    their own positions, indexed like list items.
+
+    Args:
+        root: Root node of a composed YAML document
+
+    Returns:
+        One-based (line, column) by path of keys and item indexes
+
+    """
+    source_map: SourceMap = {}
+    stack: list[tuple[SourcePath, Node]] = [((), root)]
+    while stack:
+        path, node = stack.pop()
+        if isinstance(node, MappingNode):
+            for key_node, value_node in node.value:
+                child = (*path, str(key_node.value))
+                source_map[child] = (key_node.start_mark.line + 1, key_node.start_mark.column + 1)
+                if isinstance(value_node, ScalarNode):
+                    if path[:1] == ("layers",) and child[-1] != "name" and value_node.value:
+                        _record_names(source_map, child, value_node)
+                else:
+                    stack.append((child, value_node))
+        elif isinstance(node, SequenceNode):
+            for index, item_node in enumerate(node.value):
+                child = (*path, index)
+                source_map[child] = (item_node.start_mark.line + 1, item_node.start_mark.column + 1)
+                stack.append((child, item_node))
+    return source_map
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Pause cyclic garbage collection while a config is loaded.
+
+    Node trees and constructed data hold no reference cycles, collections
+    triggered by their allocations would only walk the growing tree again.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def locate(source_map: SourceMap, path: SourcePath) -> tuple[int, int] | None:
+    """Find the position of a config path, or of its closest located parent.
+
+    Args:
+        source_map: Source map of the config
+        path: Path of keys and item indexes
+
+    Returns:
+        One-based (line, column), None if no part of the path is located
+
+    """
+    while path:
+        position = source_map.get(path)
+        if position is not None:
+            return position
+        path = path[:-1]
+    return None
+
+
+def format_error(
+    details: pydantic_core.ErrorDetails, source_map: SourceMap, file_path: Path | None
+) -> str:
+    """Format a validation error with the position of its config entry.
+
+    Args:
+        details: Pydantic error details
+        source_map: Source map of the config
+        file_path: Path to YAML config
+
+    Returns:
+        "file:line:column: location: message", with the known parts
+
+    """
+    path = tuple(details["loc"])
+    position = locate(source_map, path)
+    prefix = str(file_path) if file_path else ""
+    if position is not None:
+        prefix += f"{':' if prefix else ''}{position[0]}:{position[1]}"
+    location = ".".join(map(str, path))
+    message = f"{location}: {details['msg']}" if location else details["msg"]
+    return f"{prefix}: {message}" if prefix else message
+
+
+@dataclass(frozen=True)
+class ConfigDocument:
+    """Parsed configuration file before validation.
+
+    Attributes:
+        data: Raw configuration dictionary
+        source_map: Source positions of the config entries
+        file_path: Path to the configuration file
+
+    """
+
+    data: dict[str, Any]
+    source_map: SourceMap
+    file_path: Path
 
 
 class YamlParser:
@@ -29,7 +178,27 @@ class YamlParser:
         Raises:
             ConfigFileNotFoundError: If a config file doesn't exist
             YamlParseError: If YAML parsing fails
-            ValidationError: If configuration doesn't match the expected schema
+            ConfigValidationError: If configuration doesn't match the expected schema
+
+        """
+        document = self.load_document(file_path)
+        return self.validate(document.data, document.source_map, document.file_path)
+
+    def load_document(self, file_path: Path | None = None) -> ConfigDocument:
+        """Parse the YAML configuration file and map its entries to their positions.
+
+        The file is parsed once, the source map is built from the node tree
+        the data is constructed from.
+
+        Args:
+            file_path: Path to YAML config
+
+        Returns:
+            Raw configuration with its source map
+
+        Raises:
+            ConfigFileNotFoundError: If a config file doesn't exist
+            YamlParseError: If YAML parsing fails
 
         """
         if file_path is None:
@@ -38,34 +207,84 @@ class YamlParser:
         if not file_path.exists():
             raise ConfigFileNotFoundError(f"Configuration file not found: {file_path}")
 
-        with open(file_path, encoding="utf-8") as file:
+        with (
+            open(file_path, encoding="utf-8") as file,
+            span("config.parse", path=file_path),
+            _gc_paused(),
+        ):
+            loader = SafeLoader(file)
             try:
-                raw_config: dict[str, Any] = yaml.safe_load(file)  # type: ignore[no-untyped-call]
-                if not isinstance(raw_config, dict):
-                    raw_config = {}
-                return self.validate(raw_config)
+                root = loader.get_single_node()
+                raw_config = loader.construct_document(root) if root is not None else {}
             except yaml.YAMLError as error:
                 raise YamlParseError(error) from error
+            finally:
+                loader.dispose()
+            source_map = build_source_map(root) if root is not None else {}
+
+        if not isinstance(raw_config, dict):
+            raw_config = {}
+        return ConfigDocument(raw_config, source_map, file_path)
 
-    def validate(self, config: dict) -> ConfigModel:
+    def validate(
+        self,
+        config: dict,
+        source_map: SourceMap | None = None,
+        file_path: Path | None = None,
+    ) -> ConfigModel:
         """Validate the configuration against the expected schema.
 
         Args:
             config: Raw configuration dictionary
+            source_map: Source positions of the config entries, for error positions
+            file_path: Path to YAML config, for error positions
 
         Returns:
             Validated configuration model
 
         Raises:
-            ValidationError: If configuration doesn't match the expected schema
+            ConfigValidationError: If configuration doesn't match the expected schema
 
         """
         if config is None:
             config = {}
 
         try:
-            config_model = ConfigModel.model_validate(config)
-            return config_model
+            with span("config.validate"):
+                model = ConfigModel.model_validate(config)
         except pydantic.ValidationError as error:
-            print(f"Validation error: {error}")
-            raise error
+            raise ConfigValidationError(
+                [
+                    format_error(details, source_map or {}, file_path)
+                    for details in error.errors(include_url=False)
+                ]
+            ) from error
+        self._check_preset(model, source_map, file_path)
+        return model
+
+    @staticmethod
+    def _check_preset(
+        model: ConfigModel, source_map: SourceMap | None, file_path: Path | None
+    ) -> None:
+        """Check that the preset is built in or provided by an installed plugin.
+
+        Args:
+            model: Validated configuration model
+            source_map: Source positions of the config entries, for error positions
+            file_path: Path to YAML config, for error positions
+
+        Raises:
+            ConfigValidationError: If no preset has the configured name
+
+        """
+        from ..generators.project_generator import ProjectGenerator
+
+        presets = ProjectGenerator.PRESET_GENERATORS
+        preset_name = model.settings.preset_name
+        if preset_name in presets:
+            return
+        error = PresetNotFoundError(preset_name, ", ".join(presets))
+        details = pydantic_core.ErrorDetails(
+            type="value_error", loc=("settings", "preset"), msg=str(error), input=preset_name
+        )
+        raise ConfigValidationError([format_error(details, source_map or {}, file_path)]) from error
@@ -0,0 +1,220 @@
+import hashlib
+import importlib
+import importlib.util
+import json
+import os
+import sys
+from dataclasses import asdict, dataclass, field
+from functools import cache
+from importlib.metadata import entry_points
+from logging import getLogger
+from pathlib import Path
+
+from .exceptions import PluginLoadError
+
+logger = getLogger(__name__)
+
+PRESET_GROUP = "pyconstructor.presets"
+TEMPLATE_GROUP = "pyconstructor.templates"
+PLUGIN_CACHE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class PluginSpec:
+    """Entry point of a plugin, not imported until loaded.
+
+    Attributes:
+        name: Entry point name, e.g. the preset name
+        value: Object reference, "package.module:attribute" or "package"
+        distribution: Name of the distribution declaring the entry point
+
+    """
+
+    name: str
+    value: str
+    distribution: str = ""
+
+    def load(self) -> object:
+        """Import the referenced module and get the referenced attribute.
+
+        Returns:
+            Referenced object
+
+        Raises:
+            PluginLoadError: If the module or the attribute can't be loaded
+
+        """
+        module_name, _, attribute_path = self.value.partition(":")
+        try:
+            target: object = importlib.import_module(module_name.strip())
+            for attribute in filter(None, attribute_path.strip().split(".")):
+                target = getattr(target, attribute)
+        except (ImportError, AttributeError) as error:
+            raise PluginLoadError(self.value, f"{self.name} from {self.distribution}") from error
+        return target
+
+    def package_dir(self) -> Path:
+        """Locate the directory of the referenced package without importing it.
+
+        Returns:
+            Package directory
+
+        Raises:
+            PluginLoadError: If the value isn't an importable package
+
+        """
+        try:
+            spec = importlib.util.find_spec(self.value.partition(":")[0].strip())
+        except (ImportError, ValueError) as error:
+            raise PluginLoadError(self.value, f"{self.name} from {self.distribution}") from error
+        if spec is None or not spec.submodule_search_locations:
+            raise PluginLoadError(self.value, f"{self.name} from {self.distribution}")
+        return Path(next(iter(spec.submodule_search_locations)))
+
+
+@dataclass
+class PluginIndex:
+    """Plugins declared by the installed distributions.
+
+    Attributes:
+        presets: Preset generator classes by preset name
+        templates: Template packages by plugin name
+
+    """
+
+    presets: dict[str, PluginSpec] = field(default_factory=dict)
+    templates: dict[str, PluginSpec] = field(default_factory=dict)
+
+
+def get_cache_dir() -> Path:
+    """Get the directory of on-disk caches.
+
+    Returns:
+        Cache directory under XDG_CACHE_HOME, ~/.cache by default
+
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "pyconstructor"
+
+
+def get_cache_path() -> Path:
+    """Get the path of the on-disk plugin index cache.
+
+    Returns:
+        Cache file path in the cache directory
+
+    """
+    return get_cache_dir() / "plugins.json"
+
+
+def distributions_key() -> str:
+    """Fingerprint the installed distributions without reading their metadata.
+
+    Lists the metadata directories on sys.path with their modification times,
+    which change whenever a distribution is installed, upgraded or removed.
+
+    Returns:
+        Hex digest of the installed distributions
+
+    """
+    digest = hashlib.sha1(usedforsecurity=False)
+    for path_entry in sys.path:
+        try:
+            entries = sorted(os.scandir(path_entry or "."), key=lambda entry: entry.name)
+        except OSError:
+            continue
+        digest.update(path_entry.encode())
+        for entry in entries:
+            if entry.name.endswith((".dist-info", ".egg-info")):
+                digest.update(f"{entry.name}:{entry.stat().st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def _scan_entry_points() -> PluginIndex:
+    """Read the plugin entry points of all installed distributions.
+
+    Returns:
+        Plugin index
+
+    """
+    index = PluginIndex()
+    for group, plugins in ((PRESET_GROUP, index.presets), (TEMPLATE_GROUP, index.templates)):
+        for entry_point in entry_points(group=group):
+            distribution = entry_point.dist.name if entry_point.dist else ""
+            if entry_point.name in plugins:
+                logger.warning(
+                    f"Plugin {entry_point.name} of {distribution} in {group} is shadowed by "
+                    f"{plugins[entry_point.name].distribution}"
+                )
+                continue
+            plugins[entry_point.name] = PluginSpec(
+                entry_point.name, entry_point.value, distribution
+            )
+    return index
+
+
+def _read_cache(cache_path: Path, key: str) -> PluginIndex | None:
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+        if data.get("version") != PLUGIN_CACHE_VERSION or data.get("key") != key:
+            return None
+        return PluginIndex(
+            presets={name: PluginSpec(**spec) for name, spec in data["presets"].items()},
+            templates={name: PluginSpec(**spec) for name, spec in data["templates"].items()},
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_cache(cache_path: Path, key: str, index: PluginIndex) -> None:
+    data = {
+        "version": PLUGIN_CACHE_VERSION,
+        "key": key,
+        "presets": {name: asdict(spec) for name, spec in index.presets.items()},
+        "templates": {name: asdict(spec) for name, spec in index.templates.items()},
+    }
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        temporary_path.write_text(json.dumps(data), encoding="utf-8")
+        temporary_path.replace(cache_path)
+    except OSError as error:
+        logger.debug(f"Plugin index not cached: {error}")
+
+
+@cache
+def discover_plugins() -> PluginIndex:
+    """Discover preset and template plugins of the installed distributions.
+
+    The index is cached in memory and on disk, keyed by the installed
+    distributions, so entry points are only read again after packages
+    change. No plugin module is imported.
+
+    Returns:
+        Plugin index
+
+    """
+    key = distributions_key()
+    cache_path = get_cache_path()
+    index = _read_cache(cache_path, key)
+    if index is None:
+        index = _scan_entry_points()
+        _write_cache(cache_path, key, index)
+    logger.debug(f"Plugins: {len(index.presets)} presets, {len(index.templates)} template packages")
+    return index
+
+
+def plugin_template_dirs() -> list[Path]:
+    """Get the template directories of template plugins.
+
+    Returns:
+        Directories in plugin name order, plugins that can't be located are skipped
+
+    """
+    directories = []
+    for name, spec in sorted(discover_plugins().templates.items()):
+        try:
+            directories.append(spec.package_dir())
+        except PluginLoadError as error:
+            logger.warning(f"Template plugin {name} skipped: {error}")
+    return directories
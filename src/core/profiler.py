@@ -0,0 +1,276 @@
+import cProfile
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+from .tracing import Event, Span, Subscriber, subscribe, unsubscribe
+
+PHASES = ("parse", "validate", "plan", "render", "write")
+# Spans starting a phase, other spans count towards the phase they run in.
+SPAN_PHASES = {
+    "config.parse": "parse",
+    "config.validate": "validate",
+    "project.generate": "plan",
+    "template.render": "render",
+    "file.write": "write",
+    "file.create_directory": "write",
+    "file.create_init": "write",
+}
+
+
+@dataclass
+class PhaseStats:
+    """Accumulated cost of one phase.
+
+    Attributes:
+        calls: Number of completed calls
+        wall: Exclusive wall time in seconds
+        cpu: Exclusive CPU time of the calling thread in seconds
+
+    """
+
+    calls: int = 0
+    wall: float = 0.0
+    cpu: float = 0.0
+
+
+@dataclass
+class _Frame:
+    """Phase entered and not yet left by a thread."""
+
+    phase: str
+    wall_start: float
+    cpu_start: float
+    child_wall: float = 0.0
+    child_cpu: float = 0.0
+
+
+class Profiler(Subscriber):
+    """Records wall time, CPU time and call counts per phase and bounded context.
+
+    Phases are derived from spans and nest, e.g. rendering happens during
+    planning, and every phase gets only its exclusive time, so the phase
+    totals add up to the profiled time. Bounded contexts are taken from
+    "generation.scope" events. The state of entered phases is kept per
+    thread, so concurrent batch generations can share one profiler.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty profiler."""
+        self.stats: dict[tuple[str, str | None], PhaseStats] = {}
+        self.wall_time = 0.0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def _stack(self) -> list[_Frame]:
+        stack: list[_Frame] | None = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @property
+    def context_name(self) -> str | None:
+        """Bounded context of the current thread, None outside contexts."""
+        return getattr(self._local, "context_name", None)
+
+    def on_start(self, span: Span) -> None:
+        """Enter the phase started by a span.
+
+        Args:
+            span: Started span
+
+        """
+        phase = SPAN_PHASES.get(span.name)
+        if phase is not None:
+            self._stack.append(_Frame(phase, time.perf_counter(), time.thread_time()))
+
+    def on_end(self, span: Span) -> None:
+        """Leave the phase started by a span.
+
+        Args:
+            span: Ended span
+
+        """
+        if span.name not in SPAN_PHASES:
+            return
+
+        stack = self._stack
+        frame = stack.pop()
+        wall, cpu = self._account(frame, time.perf_counter(), time.thread_time(), calls=1)
+        if stack:
+            stack[-1].child_wall += wall
+            stack[-1].child_cpu += cpu
+        else:
+            self._local.context_name = None
+
+    def on_event(self, event: Event) -> None:
+        """Switch the bounded context on scope events.
+
+        Args:
+            event: Emitted event
+
+        """
+        if event.name == "generation.scope":
+            self.set_context(event.attributes.get("context"))
+
+    def set_context(self, context_name: str | None) -> None:
+        """Attribute the following time of the current thread to a bounded context.
+
+        Time already spent in the entered phases goes to the previous context,
+        the context is reset when the thread leaves its outermost phase.
+
+        Args:
+            context_name: Bounded context, None outside contexts
+
+        """
+        if context_name == self.context_name:
+            return
+
+        wall_now, cpu_now = time.perf_counter(), time.thread_time()
+        child_wall = child_cpu = 0.0
+        for frame in reversed(self._stack):
+            frame.child_wall += child_wall
+            frame.child_cpu += child_cpu
+            child_wall, child_cpu = self._account(frame, wall_now, cpu_now, calls=0)
+            frame.wall_start, frame.cpu_start = wall_now, cpu_now
+            frame.child_wall = frame.child_cpu = 0.0
+        self._local.context_name = context_name
+
+    def _account(
+        self, frame: _Frame, wall_end: float, cpu_end: float, calls: int
+    ) -> tuple[float, float]:
+        """Add the exclusive time of a frame to the current context.
+
+        Args:
+            frame: Entered phase
+            wall_end: Wall clock at the end of the accounted interval
+            cpu_end: Thread CPU clock at the end of the accounted interval
+            calls: Number of calls to add
+
+        Returns:
+            Inclusive wall and CPU time of the interval
+
+        """
+        wall = wall_end - frame.wall_start
+        cpu = cpu_end - frame.cpu_start
+        with self._lock:
+            stats = self.stats.setdefault((frame.phase, self.context_name), PhaseStats())
+            stats.calls += calls
+            stats.wall += wall - frame.child_wall
+            stats.cpu += cpu - frame.child_cpu
+        return wall, cpu
+
+    def phase_totals(self) -> dict[str, PhaseStats]:
+        """Sum the statistics of every phase over all contexts.
+
+        Returns:
+            Statistics keyed by phase, in PHASES order
+
+        """
+        totals: dict[str, PhaseStats] = {}
+        for (phase, _), stats in sorted(self.stats.items(), key=self._phase_order):
+            total = totals.setdefault(phase, PhaseStats())
+            total.calls += stats.calls
+            total.wall += stats.wall
+            total.cpu += stats.cpu
+        return totals
+
+    def context_totals(self) -> dict[str, dict[str, PhaseStats]]:
+        """Group the statistics by bounded context.
+
+        Returns:
+            Statistics keyed by context and phase
+
+        """
+        contexts: dict[str, dict[str, PhaseStats]] = {}
+        for (phase, context_name), stats in self.stats.items():
+            if context_name is not None:
+                contexts.setdefault(context_name, {})[phase] = stats
+        return contexts
+
+    @staticmethod
+    def _phase_order(item: tuple[tuple[str, str | None], PhaseStats]) -> int:
+        phase = item[0][0]
+        return PHASES.index(phase) if phase in PHASES else len(PHASES)
+
+    def print_report(self) -> None:
+        """Print per-phase and per-context tables to stderr, keeping stdout parseable."""
+        console = Console(stderr=True)
+        totals = self.phase_totals()
+        measured = sum(stats.wall for stats in totals.values())
+
+        table = Table(title="Profile by phase")
+        table.add_column("Phase")
+        table.add_column("Calls", justify="right")
+        table.add_column("Wall, ms", justify="right")
+        table.add_column("CPU, ms", justify="right")
+        table.add_column("Share", justify="right")
+        for phase, stats in totals.items():
+            table.add_row(
+                phase,
+                str(stats.calls),
+                f"{stats.wall * 1000:.1f}",
+                f"{stats.cpu * 1000:.1f}",
+                f"{stats.wall / measured:.0%}" if measured else "-",
+            )
+        console.print(table)
+
+        contexts = self.context_totals()
+        if contexts:
+            phases = [phase for phase in totals if any(phase in ctx for ctx in contexts.values())]
+            table = Table(title="Wall time by bounded context, ms")
+            table.add_column("Context")
+            for phase in phases:
+                table.add_column(phase, justify="right")
+            table.add_column("Total", justify="right")
+            ranked = sorted(
+                contexts.items(), key=lambda item: -sum(s.wall for s in item[1].values())
+            )
+            for context_name, context_stats in ranked:
+                cells = [
+                    f"{context_stats[phase].wall * 1000:.1f}" if phase in context_stats else "-"
+                    for phase in phases
+                ]
+                total = sum(stats.wall for stats in context_stats.values())
+                table.add_row(context_name, *cells, f"{total * 1000:.1f}")
+            console.print(table)
+
+        console.print(
+            f"{self.wall_time * 1000:.1f} ms wall, {measured * 1000:.1f} ms in profiled phases"
+        )
+
+
+@contextmanager
+def profiling(profiler: Profiler, dump_path: Path | None = None) -> Iterator[Profiler]:
+    """Subscribe a profiler to the spans of the enclosed code.
+
+    Args:
+        profiler: Profiler to subscribe
+        dump_path: Optional path of a pstats file with a cProfile of the enclosed code,
+            covering the calling thread
+
+    Yields:
+        Subscribed profiler
+
+    """
+    subscribe(profiler)
+    cprofile = cProfile.Profile() if dump_path else None
+    started = time.perf_counter()
+    if cprofile:
+        cprofile.enable()
+    try:
+        yield profiler
+    finally:
+        if cprofile:
+            cprofile.disable()
+        profiler.wall_time += time.perf_counter() - started
+        unsubscribe(profiler)
+        if cprofile and dump_path:
+            cprofile.dump_stats(dump_path)
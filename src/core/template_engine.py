@@ -1,32 +1,194 @@
+import os
 import re
+import threading
+from collections.abc import Callable, Iterable, Sequence
+from logging import getLogger
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader, TemplateNotFound, select_autoescape
+from jinja2 import BaseLoader, Environment, TemplateNotFound, select_autoescape
+
+from .plugins import plugin_template_dirs
+from .tracing import span
+
+logger = getLogger(__name__)
+
+BUILTIN_TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
+PROJECT_TEMPLATES_DIR = Path(".pyc") / "templates"
+COMPONENT_TEMPLATE = "base_template.py.jinja"
+GROUPED_COMPONENT_TEMPLATE = "multi_component_template.py.jinja"
+
+
+def get_user_templates_dir() -> Path:
+    """Get the directory of the user's template overrides.
+
+    Returns:
+        Template directory under XDG_CONFIG_HOME, ~/.config by default
+
+    """
+    config_home = os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config"
+    return Path(config_home) / "pyconstructor" / "templates"
+
+
+def template_search_path(project_root: Path | None = None) -> tuple[Path, ...]:
+    """Get the template directories of a project, highest precedence first.
+
+    The project's .pyc/templates comes first, then the user's templates,
+    the template plugins and finally the bundled templates. Directories
+    that don't exist are left out.
+
+    Args:
+        project_root: Project root directory, defaults to cwd
+
+    Returns:
+        Existing template directories
+
+    """
+    project_dir = (project_root or Path.cwd()) / PROJECT_TEMPLATES_DIR
+    candidates = [project_dir, get_user_templates_dir(), *plugin_template_dirs()]
+    return (*(path.resolve() for path in candidates if path.is_dir()), BUILTIN_TEMPLATES_DIR)
+
+
+def _mtime(path: str | Path) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class IndexedLoader(BaseLoader):
+    """Template loader serving templates from an index built once.
+
+    The search path is walked when the loader is created, the first
+    directory containing a template name wins. Lookups afterwards are
+    dictionary lookups and never probe the filesystem. The modification
+    times of the walked directories and the indexed templates are kept,
+    so a long-lived process can tell when the index is out of date.
+    """
+
+    def __init__(self, search_path: Iterable[Path]) -> None:
+        """Index the templates of a search path.
+
+        Args:
+            search_path: Template directories, highest precedence first
+
+        """
+        self.search_path = tuple(search_path)
+        self.index: dict[str, Path] = {}
+        self._mtimes: dict[str, int | None] = {}
+        for directory in self.search_path:
+            for dir_path, _, file_names in os.walk(directory):
+                self._mtimes[dir_path] = _mtime(dir_path)
+                relative_dir = Path(dir_path).relative_to(directory)
+                for file_name in file_names:
+                    name = (relative_dir / file_name).as_posix()
+                    if name not in self.index:
+                        path = self.index[name] = Path(dir_path) / file_name
+                        self._mtimes[str(path)] = _mtime(path)
+
+    def is_stale(self) -> bool:
+        """Check whether templates were added, removed or edited since indexing.
+
+        Adding or removing a template changes the modification time of its
+        directory, editing one changes its own.
+
+        Returns:
+            True if the index or an indexed template is out of date
+
+        """
+        return any(_mtime(path) != mtime for path, mtime in self._mtimes.items())
+
+    def get_source(
+        self, environment: Environment, template: str
+    ) -> tuple[str, str, Callable[[], bool]]:
+        """Read the source of an indexed template.
+
+        Args:
+            environment: Jinja2 environment loading the template
+            template: Template name
+
+        Returns:
+            Source, file name and a check comparing the template's modification time
+
+        Raises:
+            TemplateNotFound: If the template isn't indexed
+
+        """
+        path = self.index.get(template)
+        if path is None:
+            raise TemplateNotFound(template)
+        mtime = _mtime(path)
+        return path.read_text(encoding="utf-8"), str(path), lambda: _mtime(path) == mtime
+
+    def list_templates(self) -> list[str]:
+        """List the indexed template names.
+
+        Returns:
+            Sorted template names
+
+        """
+        return sorted(self.index)
 
 
 class TemplateEngine:
     """Manages Jinja2 template rendering and custom filters.
 
     This class handles template loading, rendering, and provides custom filters
-    for template processing.
+    for template processing. Templates are resolved along a search path,
+    see template_search_path, indexed once when the engine is created.
     """
 
-    def __init__(self) -> None:
+    _engines: dict[tuple[Path, ...], "TemplateEngine"] = {}
+    _engines_lock = threading.Lock()
+
+    def __init__(self, search_path: Sequence[Path] | None = None) -> None:
         """Initialize the template engine with default configuration.
 
-        Sets up the Jinja2 environment with template directory and custom filters.
-        """
-        templates_dir = Path(__file__).parent.parent / "templates"
+        Sets up the Jinja2 environment with the template index and custom filters.
+
+        Args:
+            search_path: Template directories, highest precedence first,
+                the search path of the current directory by default
 
+        """
+        self.loader = IndexedLoader(template_search_path() if search_path is None else search_path)
         self.env = Environment(
-            loader=FileSystemLoader(templates_dir),
+            loader=self.loader,
             trim_blocks=True,
             lstrip_blocks=True,
             autoescape=select_autoescape(),
+            auto_reload=False,
         )
+        self._component_templates: dict[tuple[str, bool], str] = {}
         self._register_filters()
 
+    @classmethod
+    def for_project(cls, project_root: Path | None = None) -> "TemplateEngine":
+        """Get the shared template engine of a project's search path.
+
+        Projects with the same search path share one engine, so templates
+        are indexed and compiled once per search path and process. An
+        engine whose templates changed since, e.g. edited overrides in a
+        running daemon, is replaced by a new one.
+
+        Args:
+            project_root: Project root directory, defaults to cwd
+
+        Returns:
+            TemplateEngine instance
+
+        """
+        search_path = template_search_path(project_root)
+        with cls._engines_lock:
+            engine = cls._engines.get(search_path)
+            if engine is not None and engine.loader.is_stale():
+                logger.debug("Templates changed, indexing them again")
+                engine = None
+            if engine is None:
+                logger.debug(f"Template search path: {', '.join(map(str, search_path))}")
+                engine = cls._engines[search_path] = cls(search_path)
+        return engine
+
     def render(self, template_path: str, context: dict[str, Any]) -> str:
         """Render a template with the provided context.
 
@@ -38,12 +200,35 @@ class TemplateEngine:
             Rendered template as string
 
         """
-        template = self.env.get_template(template_path)
-        content: str = template.render(**context)
+        with span("template.render", template=template_path):
+            template = self.env.get_template(template_path)
+            content: str = template.render(**context)
         return content
 
+    def render_size(self, template_path: str, context: dict[str, Any]) -> int:
+        """Render a template into a discarding sink and count the output size.
+
+        The rendered chunks are encoded one by one and never joined.
+
+        Args:
+            template_path: Path to template relative to templates directory
+            context: Variables to pass to the template
+
+        Returns:
+            Size of the rendered template in bytes, UTF-8 encoded
+
+        """
+        with span("template.render", template=template_path, measure=True):
+            template = self.env.get_template(template_path)
+            return sum(len(chunk.encode()) for chunk in template.generate(**context))
+
+    def precompile(self) -> None:
+        """Load and compile all indexed templates into the environment cache."""
+        for template_name in self.env.list_templates(extensions=["jinja"]):
+            self.env.get_template(template_name)
+
     def template_exists(self, template_path: str) -> bool:
-        """Check if a template exists in the template directory.
+        """Check if a template exists on the search path.
 
         Args:
             template_path: Path to the template
@@ -52,11 +237,34 @@ class TemplateEngine:
             True if the template exists, False otherwise
 
         """
-        try:
-            self.env.get_template(template_path)
-            return True
-        except TemplateNotFound:
-            return False
+        return template_path in self.loader.index
+
+    def component_template(self, singular_type: str, grouped: bool = False) -> str:
+        """Get the template of a component type.
+
+        A type's own template, e.g. repository.py.jinja or
+        multi_repository.py.jinja for grouped components, takes precedence
+        over the generic component templates.
+
+        Args:
+            singular_type: Singular form of the component type, e.g. "repository"
+            grouped: Whether the template renders all components of the type
+
+        Returns:
+            Template name
+
+        """
+        key = (singular_type, grouped)
+        template_path = self._component_templates.get(key)
+        if template_path is None:
+            name = singular_type.lower()
+            own_template = f"multi_{name}.py.jinja" if grouped else f"{name}.py.jinja"
+            if self.template_exists(own_template):
+                template_path = own_template
+            else:
+                template_path = GROUPED_COMPONENT_TEMPLATE if grouped else COMPONENT_TEMPLATE
+            self._component_templates[key] = template_path
+        return template_path
 
     def get_template_dir(self, layer_name: str = "") -> str:
         """Get the path to template directory for a specific layer.
@@ -95,7 +303,8 @@ class TemplateEngine:
         self.env.filters["article"] = self._get_article
         self.env.filters["camel_to_snake"] = self.camel_to_snake
 
-    def camel_to_snake(self, component_name: str) -> str:
+    @staticmethod
+    def camel_to_snake(component_name: str) -> str:
         """Convert camelCase or PascalCase string to snake_case.
 
         Args:
@@ -0,0 +1,283 @@
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+
+class Span:
+    """Timed operation reported to subscribers when it starts and ends.
+
+    Attributes:
+        name: Dotted operation name, e.g. "template.render"
+        attributes: Details of the operation, e.g. the template path
+        start: Start time in perf_counter nanoseconds
+        end: End time in perf_counter nanoseconds, 0 while running
+        thread_id: Identifier of the thread running the operation
+
+    """
+
+    __slots__ = ("name", "attributes", "start", "end", "thread_id", "_subscribers")
+
+    def __init__(self, name: str, attributes: dict[str, Any]) -> None:
+        """Initialize the span.
+
+        Args:
+            name: Dotted operation name
+            attributes: Details of the operation
+
+        """
+        self.name = name
+        self.attributes = attributes
+        self.start = 0
+        self.end = 0
+        self.thread_id = threading.get_ident()
+        # Subscribers seen on start also get the end, even if the registry changes meanwhile.
+        self._subscribers = _subscribers
+
+    def __enter__(self) -> "Span":
+        """Start the span."""
+        self.start = time.perf_counter_ns()
+        for subscriber in self._subscribers:
+            subscriber.on_start(self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """End the span."""
+        self.end = time.perf_counter_ns()
+        for subscriber in reversed(self._subscribers):
+            subscriber.on_end(self)
+
+    @property
+    def duration(self) -> int:
+        """Duration in nanoseconds."""
+        return self.end - self.start
+
+
+class Event:
+    """Instant event reported to subscribers.
+
+    Attributes:
+        name: Dotted event name, e.g. "generation.scope"
+        attributes: Details of the event
+        timestamp: Time in perf_counter nanoseconds
+        thread_id: Identifier of the thread emitting the event
+
+    """
+
+    __slots__ = ("name", "attributes", "timestamp", "thread_id")
+
+    def __init__(self, name: str, attributes: dict[str, Any]) -> None:
+        """Initialize the event.
+
+        Args:
+            name: Dotted event name
+            attributes: Details of the event
+
+        """
+        self.name = name
+        self.attributes = attributes
+        self.timestamp = time.perf_counter_ns()
+        self.thread_id = threading.get_ident()
+
+
+class Subscriber:
+    """Receiver of spans and events, all methods do nothing by default.
+
+    Methods are called in the thread running the operation.
+    """
+
+    def on_start(self, span: Span) -> None:
+        """Handle a started span.
+
+        Args:
+            span: Started span
+
+        """
+
+    def on_end(self, span: Span) -> None:
+        """Handle an ended span.
+
+        Args:
+            span: Ended span
+
+        """
+
+    def on_event(self, event: Event) -> None:
+        """Handle an instant event.
+
+        Args:
+            event: Emitted event
+
+        """
+
+
+class _NoopSpan:
+    """Span used while nobody subscribes, entering and leaving it does nothing."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+_NOOP_SPAN = _NoopSpan()
+# Replaced as a whole on every change, so readers never need the lock.
+_subscribers: tuple[Subscriber, ...] = ()
+_subscribers_lock = threading.Lock()
+
+
+def span(name: str, **attributes: object) -> Span | _NoopSpan:
+    """Create a span for the enclosed operation.
+
+    Costs a single check when no subscriber is attached.
+
+    Args:
+        name: Dotted operation name
+        **attributes: Details of the operation
+
+    Returns:
+        Context manager reporting the operation to subscribers
+
+    """
+    if not _subscribers:
+        return _NOOP_SPAN
+    return Span(name, attributes)
+
+
+def emit(name: str, **attributes: object) -> None:
+    """Report an instant event to subscribers.
+
+    Args:
+        name: Dotted event name
+        **attributes: Details of the event
+
+    """
+    if not _subscribers:
+        return
+    event = Event(name, attributes)
+    for subscriber in _subscribers:
+        subscriber.on_event(event)
+
+
+def subscribe(subscriber: Subscriber) -> None:
+    """Attach a subscriber to all spans and events of the process.
+
+    Args:
+        subscriber: Subscriber to attach
+
+    """
+    global _subscribers
+    with _subscribers_lock:
+        _subscribers = (*_subscribers, subscriber)
+
+
+def unsubscribe(subscriber: Subscriber) -> None:
+    """Detach a subscriber.
+
+    Args:
+        subscriber: Attached subscriber
+
+    """
+    global _subscribers
+    with _subscribers_lock:
+        _subscribers = tuple(item for item in _subscribers if item is not subscriber)
+
+
+class ChromeTraceExporter(Subscriber):
+    """Collects spans and events in the Chrome trace event format.
+
+    The written file can be opened in chrome://tracing or ui.perfetto.dev.
+    Spans become complete ("X") events and events become instant ("i")
+    events, both timestamped in microseconds since the exporter was created.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty trace."""
+        self.origin = time.perf_counter_ns()
+        self.pid = os.getpid()
+        self.trace_events: list[dict[str, Any]] = []
+
+    def on_end(self, span: Span) -> None:
+        """Record an ended span.
+
+        Args:
+            span: Ended span
+
+        """
+        self.trace_events.append(
+            {
+                "name": span.name,
+                "cat": span.name.split(".", 1)[0],
+                "ph": "X",
+                "ts": (span.start - self.origin) / 1000,
+                "dur": span.duration / 1000,
+                "pid": self.pid,
+                "tid": span.thread_id,
+                "args": span.attributes,
+            }
+        )
+
+    def on_event(self, event: Event) -> None:
+        """Record an instant event.
+
+        Args:
+            event: Emitted event
+
+        """
+        self.trace_events.append(
+            {
+                "name": event.name,
+                "cat": event.name.split(".", 1)[0],
+                "ph": "i",
+                "s": "t",
+                "ts": (event.timestamp - self.origin) / 1000,
+                "pid": self.pid,
+                "tid": event.thread_id,
+                "args": event.attributes,
+            }
+        )
+
+    def write(self, path: Path) -> None:
+        """Write the trace as JSON.
+
+        Args:
+            path: Output file path
+
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(
+                {"traceEvents": self.trace_events, "displayTimeUnit": "ms"}, file, default=str
+            )
+
+
+@contextmanager
+def chrome_trace(path: Path) -> Iterator[ChromeTraceExporter]:
+    """Trace the enclosed code into a Chrome trace file.
+
+    Args:
+        path: Output file path, written when the block ends
+
+    Yields:
+        Subscribed exporter
+
+    """
+    exporter = ChromeTraceExporter()
+    subscribe(exporter)
+    try:
+        yield exporter
+    finally:
+        unsubscribe(exporter)
+        exporter.write(path)
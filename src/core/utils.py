@@ -1,5 +1,7 @@
 from dataclasses import dataclass
+from pathlib import Path
 
+from src.core.manifest import GenerationManifest, ShardSpec
 from src.core.template_engine import TemplateEngine
 from src.preview.collector import PreviewCollector
 from src.schemas import ConfigModel
@@ -17,6 +19,9 @@ class GenerationContext:
         engine: Template engine for rendering
         preview_collector: Collector for preview mode
         preview_mode: Whether generation is in preview mode
+        project_root: Directory where the project is generated, defaults to cwd
+        shard: Part of the bounded contexts to generate, None for all of them
+        manifest: Optional record of generated units, files and directories
 
     """
 
@@ -24,3 +29,33 @@ class GenerationContext:
     engine: TemplateEngine
     preview_mode: bool
     preview_collector: PreviewCollector | None = None
+    project_root: Path | None = None
+    shard: ShardSpec | None = None
+    manifest: GenerationManifest | None = None
+
+
+@dataclass(frozen=True)
+class GenerationRequest:
+    """Parameters of a single generation run.
+
+    Each request gets its own config, generator and preview collector
+    from the request scope of the dependency container.
+
+    Attributes:
+        file_path: Optional path to a config file, defaults to ddd-config.yaml in cwd
+        preview_mode: Whether generation is in preview mode
+        render_format: Format for rendering the preview
+        project_root: Directory where the project is generated, defaults to cwd
+        shard: Part of the bounded contexts to generate, None for all of them
+        record_manifest: Whether to record a manifest, always enabled for shards
+        measure: Whether preview renders templates to measure their size and time
+
+    """
+
+    file_path: Path | None = None
+    preview_mode: bool = False
+    render_format: str = "tree"
+    project_root: Path | None = None
+    shard: ShardSpec | None = None
+    record_manifest: bool = False
+    measure: bool = False
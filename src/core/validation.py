@@ -0,0 +1,185 @@
+import json
+import os
+import time
+import xml.etree.ElementTree as ET
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+
+from src.core.exceptions import ConfigValidationError
+from src.core.parser import YamlParser
+
+REPORT_VERSION = 1
+
+
+@dataclass
+class ValidationResult:
+    """Outcome of validating a single config file.
+
+    Attributes:
+        config_path: Path to the configuration file
+        duration: Wall time of the validation in seconds
+        errors: Error messages, empty if the config is valid
+        index: Position of the config in the validated paths
+
+    """
+
+    config_path: Path
+    duration: float
+    errors: list[str] = field(default_factory=list)
+    index: int = 0
+
+    @property
+    def success(self) -> bool:
+        """Whether the config is valid."""
+        return not self.errors
+
+
+def validate_config(config_path: Path, strict: bool = False, index: int = 0) -> ValidationResult:
+    """Validate a config file, and lint it in strict mode.
+
+    Runs in worker processes, so every failure is returned, never raised.
+
+    Args:
+        config_path: Path to the configuration file
+        strict: Whether to lint the validated configuration
+        index: Position of the config in the validated paths
+
+    Returns:
+        Result of the validation
+
+    """
+    started = time.perf_counter()
+    parser = YamlParser()
+    try:
+        document = parser.load_document(config_path)
+        config = parser.validate(document.data, document.source_map, config_path)
+        errors = []
+        if strict:
+            from src.core.linter import ConfigLinter
+
+            issues = ConfigLinter(config, document.source_map).lint()
+            errors = [issue.format(config_path) for issue in issues]
+    except ConfigValidationError as error:
+        errors = list(error.value) if isinstance(error.value, list) else [str(error)]
+    except Exception as error:
+        errors = [str(error)]
+    return ValidationResult(config_path, time.perf_counter() - started, errors, index)
+
+
+class BatchValidator:
+    """Validates many config files in a process pool.
+
+    Validation is CPU bound, so configs are spread over processes rather
+    than threads. A single config or worker is validated in-process.
+    """
+
+    def __init__(self, workers: int | None = None, strict: bool = False) -> None:
+        """Initialize the batch validator.
+
+        Args:
+            workers: Number of worker processes, defaults to the CPU count
+            strict: Whether to lint the validated configurations
+
+        """
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.strict = strict
+
+    def validate(self, config_paths: Iterable[Path]) -> Iterator[ValidationResult]:
+        """Validate configs, yielding results as they finish.
+
+        Args:
+            config_paths: Paths to configuration files
+
+        Yields:
+            Results in completion order, their index gives the order of the paths
+
+        """
+        paths = list(config_paths)
+        workers = min(self.workers, len(paths))
+        if workers <= 1:
+            for index, config_path in enumerate(paths):
+                yield validate_config(config_path, self.strict, index)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(validate_config, config_path, self.strict, index)
+                for index, config_path in enumerate(paths)
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+
+
+def write_json_report(
+    results: list[ValidationResult], report_path: Path, total_duration: float
+) -> None:
+    """Write validation results as JSON.
+
+    Args:
+        results: Validation results in the order of the validated paths
+        report_path: Path of the report file
+        total_duration: Wall time of the whole validation in seconds
+
+    """
+    failed = sum(not result.success for result in results)
+    document = {
+        "version": REPORT_VERSION,
+        "created": datetime.now(UTC).isoformat(timespec="seconds"),
+        "summary": {
+            "total": len(results),
+            "passed": len(results) - failed,
+            "failed": failed,
+            "duration": round(total_duration, 6),
+        },
+        "results": [
+            {
+                "config": str(result.config_path),
+                "valid": result.success,
+                "duration": round(result.duration, 6),
+                "errors": result.errors,
+            }
+            for result in results
+        ],
+    }
+    report_path.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+
+
+def write_junit_report(
+    results: list[ValidationResult], report_path: Path, total_duration: float
+) -> None:
+    """Write validation results as JUnit XML, one test case per config.
+
+    Args:
+        results: Validation results in the order of the validated paths
+        report_path: Path of the report file
+        total_duration: Wall time of the whole validation in seconds
+
+    """
+    failed = sum(not result.success for result in results)
+    suites = ET.Element("testsuites")
+    suite = ET.SubElement(
+        suites,
+        "testsuite",
+        name="pyc validate",
+        tests=str(len(results)),
+        failures=str(failed),
+        errors="0",
+        time=f"{total_duration:.3f}",
+        timestamp=datetime.now(UTC).isoformat(timespec="seconds"),
+    )
+    for result in results:
+        case = ET.SubElement(
+            suite,
+            "testcase",
+            classname="pyc.validate",
+            name=str(result.config_path),
+            time=f"{result.duration:.3f}",
+        )
+        if not result.success:
+            failure = ET.SubElement(case, "failure", message=result.errors[0])
+            failure.text = "\n".join(result.errors)
+    ET.indent(suites)
+    ET.ElementTree(suites).write(report_path, encoding="utf-8", xml_declaration=True)
@@ -0,0 +1,10 @@
+"""Warm background server for PyConstructor commands.
+
+This module provides a Unix socket daemon that keeps heavy dependencies
+imported and templates compiled, and a thin client used by the CLI to
+forward commands to it.
+"""
+
+from .client import DaemonClient, DaemonResponse, get_socket_path
+
+__all__ = ["DaemonClient", "DaemonResponse", "get_socket_path"]
@@ -0,0 +1,158 @@
+import json
+import os
+import socket
+import tempfile
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+
+SOCKET_ENV_VAR = "PYC_DAEMON_SOCKET"
+DISABLE_ENV_VAR = "PYC_NO_DAEMON"
+CONNECT_TIMEOUT = 0.5
+
+# Set while the daemon executes a request, so commands never forward to themselves.
+inside_daemon: ContextVar[bool] = ContextVar("inside_daemon", default=False)
+
+
+def get_socket_path() -> Path:
+    """Get the path of the daemon Unix socket.
+
+    The path can be overridden with the PYC_DAEMON_SOCKET environment variable.
+
+    Returns:
+        Path to the daemon socket
+
+    """
+    override = os.environ.get(SOCKET_ENV_VAR)
+    if override:
+        return Path(override)
+
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "pyconstructor.sock"
+
+    # The temp dir is shared, the socket lives in a directory only its owner can access.
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return Path(tempfile.gettempdir()) / f"pyconstructor-{uid}" / "daemon.sock"
+
+
+def is_private(path: Path) -> bool:
+    """Check whether a file belongs to the current user and nobody else can access it.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        True if the file exists, is owned by the current user and grants
+        no group or other permissions
+
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return False
+    if hasattr(os, "getuid") and stat.st_uid != os.getuid():
+        return False
+    return not stat.st_mode & 0o077
+
+
+@dataclass
+class DaemonResponse:
+    """Result of a command executed by the daemon.
+
+    Attributes:
+        exit_code: Exit code of the command
+        stdout: Captured standard output
+        stderr: Captured standard error
+
+    """
+
+    exit_code: int
+    stdout: str = ""
+    stderr: str = ""
+
+
+class DaemonClient:
+    """Thin client forwarding commands to a running daemon.
+
+    All failures to reach the daemon are reported as a missing response,
+    so callers can fall back to in-process execution.
+    """
+
+    def __init__(self, socket_path: Path | None = None) -> None:
+        """Initialize the client.
+
+        Args:
+            socket_path: Path to the daemon socket, defaults to get_socket_path()
+
+        """
+        self.socket_path = socket_path or get_socket_path()
+
+    def is_enabled(self) -> bool:
+        """Check whether forwarding to the daemon is possible at all.
+
+        Returns:
+            True if the platform supports Unix sockets, forwarding isn't disabled
+            and the socket file exists. A socket of another user, or one others
+            can connect to, is never used, it would receive the commands
+
+        """
+        if inside_daemon.get() or os.environ.get(DISABLE_ENV_VAR):
+            return False
+        if not hasattr(socket, "AF_UNIX"):
+            return False
+        return is_private(self.socket_path)
+
+    def request(self, command: str, args: list[str] | None = None) -> DaemonResponse | None:
+        """Execute a command in the daemon.
+
+        Args:
+            command: CLI command name (run, validate, preview, ...)
+            args: Command line arguments for the command
+
+        Returns:
+            Daemon response or None if the daemon isn't available
+
+        """
+        if not self.is_enabled():
+            return None
+
+        payload = {"command": command, "args": args or [], "cwd": str(Path.cwd())}
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+                conn.settimeout(CONNECT_TIMEOUT)
+                conn.connect(str(self.socket_path))
+                conn.settimeout(None)
+                conn.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+                with conn.makefile("rb") as stream:
+                    line = stream.readline()
+        except OSError:
+            return None
+
+        if not line:
+            return None
+
+        data = json.loads(line)
+        return DaemonResponse(
+            exit_code=data.get("exit_code", 1),
+            stdout=data.get("stdout", ""),
+            stderr=data.get("stderr", ""),
+        )
+
+    def ping(self) -> bool:
+        """Check whether the daemon is running and responsive.
+
+        Returns:
+            True if the daemon answered
+
+        """
+        return self.request("ping") is not None
+
+    def shutdown(self) -> bool:
+        """Ask the daemon to stop.
+
+        Returns:
+            True if the daemon acknowledged the request
+
+        """
+        return self.request("shutdown") is not None
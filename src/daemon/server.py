@@ -0,0 +1,145 @@
+import io
+import json
+import os
+import socketserver
+import threading
+from contextlib import redirect_stderr, redirect_stdout
+from logging import getLogger
+from pathlib import Path
+from stat import S_ISVTX
+from typing import Any
+
+import click
+
+from src.core.dependencies import get_container
+from src.core.template_engine import TemplateEngine
+from src.daemon.client import DaemonClient, inside_daemon
+
+logger = getLogger(__name__)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Handle a single newline-delimited JSON request."""
+
+    server: "DaemonServer"
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as error:
+            response: dict[str, Any] = {"exit_code": 2, "stderr": f"Invalid request: {error}\n"}
+        else:
+            response = self.server.execute(request)
+
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """Unix socket server executing CLI commands in a warm process.
+
+    Requests are handled one at a time, because each command runs in the
+    working directory of the client that sent it.
+    """
+
+    FORWARDED_COMMANDS = frozenset({"run", "validate", "preview"})
+
+    def __init__(self, socket_path: Path) -> None:
+        """Bind the server to the socket.
+
+        Args:
+            socket_path: Path of the Unix socket to listen on
+
+        Raises:
+            RuntimeError: If another daemon already listens on the socket, or
+                other users could replace the socket in its directory
+
+        """
+        self.socket_path = socket_path
+        self._check_directory(socket_path.parent)
+        if socket_path.exists():
+            if DaemonClient(socket_path).ping():
+                raise RuntimeError(f"Daemon is already running on {socket_path}")
+            socket_path.unlink()
+
+        super().__init__(str(socket_path), _RequestHandler)
+        # Clients only connect to sockets nobody else can access.
+        os.chmod(socket_path, 0o600)
+
+    @staticmethod
+    def _check_directory(directory: Path) -> None:
+        """Create the socket directory, make sure no other user controls it."""
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        stat = directory.stat()
+        owners = {0, os.getuid()} if hasattr(os, "getuid") else {stat.st_uid}
+        # Like in /tmp, the sticky bit stops others from replacing the socket.
+        writable_by_others = stat.st_mode & 0o022 and not stat.st_mode & S_ISVTX
+        if stat.st_uid not in owners or writable_by_others:
+            raise RuntimeError(f"Socket directory {directory} is controlled by another user")
+
+    def warm_up(self) -> None:
+        """Import all command dependencies, build the container and compile the templates."""
+        import src.generators  # noqa: F401
+        import src.preview.collector  # noqa: F401
+
+        get_container()
+        TemplateEngine.for_project().precompile()
+        logger.debug("Daemon warm-up completed")
+
+    def execute(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Execute a single client request.
+
+        Args:
+            request: Decoded request with command, args and cwd keys
+
+        Returns:
+            Response with exit code and captured output
+
+        """
+        command = request.get("command")
+        if command == "ping":
+            return {"exit_code": 0, "stdout": "pong\n"}
+        if command == "shutdown":
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {"exit_code": 0}
+        if command not in self.FORWARDED_COMMANDS:
+            return {"exit_code": 2, "stderr": f"Unsupported daemon command: {command}\n"}
+
+        from src.main import cli
+
+        stdout, stderr = io.StringIO(), io.StringIO()
+        exit_code = 0
+        previous_cwd = os.getcwd()
+        token = inside_daemon.set(True)
+        try:
+            os.chdir(request.get("cwd") or previous_cwd)
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                try:
+                    result = cli.main(
+                        args=[command, *request.get("args", [])],
+                        prog_name="pyc",
+                        standalone_mode=False,
+                    )
+                    if isinstance(result, int):
+                        exit_code = result
+                except click.ClickException as error:
+                    error.show()
+                    exit_code = error.exit_code
+                except SystemExit as error:
+                    exit_code = error.code if isinstance(error.code, int) else 1
+                except Exception as error:
+                    click.secho(f"Error: {error}", fg="red", err=True)
+                    exit_code = 1
+        finally:
+            inside_daemon.reset(token)
+            os.chdir(previous_cwd)
+
+        return {"exit_code": exit_code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+    def server_close(self) -> None:
+        """Close the server and remove the socket file."""
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
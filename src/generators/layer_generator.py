@@ -1,14 +1,21 @@
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
 from logging import getLogger
 from pathlib import Path
 
+from src.core.manifest import GenerationManifest
 from src.core.template_engine import TemplateEngine
+from src.core.tracing import span
 from src.generators.utils import (
     FileOperations,
     ImportPathGenerator,
     StandardImportPathGenerator,
-    single_form_words,
+    component_module_name,
+    singular_form,
 )
 from src.preview.collector import PreviewCollector
+from src.schemas.config_schema import component_names
 
 logger = getLogger(__name__)
 
@@ -18,6 +25,8 @@ class LayerGenerator:
 
     This class is responsible for generating Python files for specific components
     within existing directories, supporting both individual and grouped component generation.
+    A generator holds no per-context state, the bounded context is passed per call,
+    so one generator serves every context of its layer.
     """
 
     def __init__(
@@ -27,9 +36,9 @@ class LayerGenerator:
         layer_name: str = "",
         group_components: bool = True,
         init_imports: bool = False,
-        context_name: str | None = None,
         import_path_generator: ImportPathGenerator | None = None,
         preview_collector: PreviewCollector | None = None,
+        manifest: GenerationManifest | None = None,
     ) -> None:
         """Initialize layer generator.
 
@@ -39,12 +48,12 @@ class LayerGenerator:
             layer_name: Layer name for namespace/imports
             group_components: Whether to group components in single files
             init_imports: Whether to generate imports in __init__.py
-            context_name: Name of context
             import_path_generator: Import path generator instance
             preview_collector: Preview collector for dry generation
+            manifest: Record of written files
 
         """
-        self.file_ops = FileOperations(template_engine, preview_collector)
+        self.file_ops = FileOperations(template_engine, preview_collector, manifest)
         self.template_engine = template_engine
         self.preview_collector = preview_collector
         self.layer_name = layer_name
@@ -52,7 +61,6 @@ class LayerGenerator:
         self.group_components = group_components
         self.init_imports = init_imports
         self.root_name = root_name
-        self.context_name = context_name if context_name else ""
         self.import_path_generator = import_path_generator or StandardImportPathGenerator()
 
     def generate_component(self, path: Path, component_type: str, component_name: str) -> str:
@@ -67,54 +75,76 @@ class LayerGenerator:
             Name of the generated module
 
         """
-        singular_type = single_form_words.get(component_type, component_type.rstrip("s"))
-        snake_name = self.template_engine.camel_to_snake(component_name)
-
-        suffix = singular_type.lower()
-        if snake_name.lower().endswith(f"_{suffix}"):
-            file_name = f"{snake_name}.py"
-            module_name = snake_name
-        else:
-            file_name = f"{snake_name}_{singular_type.lower()}.py"
-            module_name = f"{snake_name}_{singular_type.lower()}"
+        singular_type = singular_form(component_type)
+        module_name = component_module_name(component_name, component_type)
 
-        file_path = path / file_name
-        if self.preview_collector:
-            self.preview_collector.add_file(file_path)
-        else:
-            template_path = "base_template.py.jinja"
-            content = self.template_engine.render(
-                template_path,
-                {
-                    "name": component_name,
-                    "type": singular_type,
-                },
-            )
-
-            self.file_ops.write_file(file_path, content)
+        file_path = path / f"{module_name}.py"
+        template_path = self.template_engine.component_template(singular_type)
+        self.file_ops.render_file(
+            file_path,
+            template_path,
+            {
+                "name": component_name,
+                "type": singular_type,
+            },
+        )
         return module_name
 
     def generate_components(
-        self, component_dir: Path, component_type: str, components: list[str] | str
+        self,
+        component_dir: Path,
+        component_type: str,
+        components: Sequence[str] | str | None,
+        context_name: str | None = None,
     ) -> dict[str, str]:
         """Generate all components of a specific type.
 
         Args:
             component_dir: Directory where to create components
             component_type: Type of components
-            components: List of component names or comma-separated string
+            components: Component names or comma-separated string
+            context_name: Bounded context of the components, None outside contexts
 
         Returns:
             Dictionary mapping component names to their module names
 
         """
-        if components is None:
-            return {}
+        with span(
+            "layer.generate_components",
+            layer=self.layer_name,
+            context=context_name,
+            component_type=component_type,
+        ):
+            return self._generate_components(
+                component_dir, component_type, components, context_name or ""
+            )
 
+    def _generate_components(
+        self,
+        component_dir: Path,
+        component_type: str,
+        components: Sequence[str] | str | None,
+        context_name: str,
+    ) -> dict[str, str]:
+        """Generate all components of a specific type, see generate_components.
+
+        Args:
+            component_dir: Directory where to create components
+            component_type: Type of components
+            components: Component names or comma-separated string
+            context_name: Bounded context of the components, empty outside contexts
+
+        Returns:
+            Dictionary mapping component names to their module names
+
+        """
         if isinstance(components, str):
-            if not components.strip():
-                return {}
-            components = [comp.strip() for comp in components.split(",")]
+            components = component_names(components)
+        if not components:
+            return {}
+
+        if self.preview_collector:
+            self.preview_collector.add_components(len(components))
 
         generated_modules = {}
 
@@ -131,6 +161,7 @@ class LayerGenerator:
             init_path = self.file_ops.get_init_path(component_dir)
             self._generate_init_imports(
                 init_path=init_path,
+                context_name=context_name,
                 component_type=component_type,
                 components=components,
                 generated_modules=generated_modules,
@@ -139,7 +170,7 @@ class LayerGenerator:
         return generated_modules
 
     def _generate_grouped_components(
-        self, path: Path, component_type: str, components: list[str]
+        self, path: Path, component_type: str, components: Sequence[str]
     ) -> None:
         """Generate all components in a single file.
 
@@ -151,35 +182,32 @@ class LayerGenerator:
         """
         file_name = f"{component_type}.py"
         file_path = path / file_name
-        if self.preview_collector:
-            self.preview_collector.add_file(file_path)
-            return None
-
-        template_path = "multi_component_template.py.jinja"
+        single_form = singular_form(component_type)
+        template_path = self.template_engine.component_template(single_form, grouped=True)
 
-        content = self.template_engine.render(
+        self.file_ops.render_file(
+            file_path,
             template_path,
             {
                 "component_type": component_type,
                 "components": components,
-                "single_form": single_form_words.get(component_type, component_type.rstrip("s")),
+                "single_form": single_form,
             },
         )
 
-        self.file_ops.write_file(file_path, content)
-        return None
-
     def _generate_init_imports(
         self,
         init_path: Path,
+        context_name: str,
         component_type: str,
-        components: list[str],
+        components: Sequence[str],
         generated_modules: dict[str, str],
     ) -> None:
         """Generate __init__.py with import for components.
 
         Args:
             init_path: Path to the __init__.py file
+            context_name: Bounded context of the components, empty outside contexts
             component_type: Type of components
             components: List of component names
             generated_modules: Dictionary of generated module names
@@ -191,14 +219,15 @@ class LayerGenerator:
             import_path = self.import_path_generator.generate_import_path(
                 self.root_name,
                 self.layer_name,
-                self.context_name,
+                context_name,
                 component_type,
                 module_name,
                 component,
             )
             imports.append(import_path)
         template_path = "init.py.jinja"
-        content = self.template_engine.render(
+        self.file_ops.render_file(
+            init_path,
             template_path,
             {
                 "imports": imports,
@@ -206,4 +235,104 @@ class LayerGenerator:
             },
         )
 
-        self.file_ops.write_file(init_path, content)
+
+@dataclass(frozen=True)
+class LayerGeneratorSpec:
+    """Everything a layer generator is built from, the key of LayerGeneratorPool.
+
+    Attributes:
+        layer_name: Layer name
+        root_name: Root package name for imports
+        group_components: Whether to group components in single files
+        init_imports: Whether to generate imports in __init__.py
+        import_path_generator: Import path generator, None for the standard one.
+            Generators are compared by identity, share one instance per generation
+
+    """
+
+    layer_name: str
+    root_name: str
+    group_components: bool
+    init_imports: bool
+    import_path_generator: ImportPathGenerator | None = None
+
+
+class LayerGeneratorPool:
+    """Bounded LRU pool of layer generators of a single generation.
+
+    Generators are keyed by their full spec and shared by all contexts of a
+    layer. All of them write to the same preview collector and manifest.
+    """
+
+    DEFAULT_MAX_SIZE = 64
+
+    def __init__(
+        self,
+        template_engine: TemplateEngine,
+        preview_collector: PreviewCollector | None = None,
+        manifest: GenerationManifest | None = None,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            template_engine: Template engine of the generators
+            preview_collector: Preview collector for dry generation
+            manifest: Record of written files
+            max_size: Maximum number of pooled generators, the least recently used is evicted
+
+        """
+        self.template_engine = template_engine
+        self.preview_collector = preview_collector
+        self.manifest = manifest
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._generators: OrderedDict[LayerGeneratorSpec, LayerGenerator] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._generators)
+
+    def __str__(self) -> str:
+        return (
+            f"{len(self)}/{self.max_size} generators, {self.hits} hits, "
+            f"{self.misses} misses, {self.hit_rate:.0%} hit rate"
+        )
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of requests served by a pooled generator."""
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else 0.0
+
+    def get(self, spec: LayerGeneratorSpec) -> LayerGenerator:
+        """Get a pooled generator for a spec, creating it if needed.
+
+        Args:
+            spec: Generator spec
+
+        Returns:
+            Layer generator built from the spec
+
+        """
+        generator = self._generators.get(spec)
+        if generator is not None:
+            self.hits += 1
+            self._generators.move_to_end(spec)
+            return generator
+
+        self.misses += 1
+        generator = LayerGenerator(
+            template_engine=self.template_engine,
+            root_name=spec.root_name,
+            layer_name=spec.layer_name,
+            group_components=spec.group_components,
+            init_imports=spec.init_imports,
+            import_path_generator=spec.import_path_generator,
+            preview_collector=self.preview_collector,
+            manifest=self.manifest,
+        )
+        self._generators[spec] = generator
+        if len(self._generators) > self.max_size:
+            self._generators.popitem(last=False)
+        return generator
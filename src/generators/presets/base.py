@@ -2,13 +2,17 @@ from abc import ABC, abstractmethod
 from logging import getLogger
 from pathlib import Path
 
+from src.core.tracing import emit
 from src.core.utils import GenerationContext
-from src.generators.layer_generator import LayerGenerator
+from src.generators.layer_generator import (
+    LayerGenerator,
+    LayerGeneratorPool,
+    LayerGeneratorSpec,
+)
 from src.generators.utils import (
     FileOperations,
     ImportPathGenerator,
 )
-from src.preview.collector import PreviewCollector
 from src.schemas import ConfigModel
 
 logger = getLogger(__name__)
@@ -17,6 +21,8 @@ logger = getLogger(__name__)
 class AbstractPresetGenerator(ABC):
     """Base class for preset-specific generators."""
 
+    SUPPORTS_SHARDING = False
+
     def __init__(
         self,
         context: GenerationContext,
@@ -57,8 +63,10 @@ class BasePresetGenerator(AbstractPresetGenerator):
         super().__init__(context)
         self.context = context
         self.template_engine = context.engine
-        self.layer_generators: dict[str, LayerGenerator] = {}
-        self.file_ops = FileOperations(context.engine, context.preview_collector)
+        self.layer_generators = LayerGeneratorPool(
+            context.engine, context.preview_collector, context.manifest
+        )
+        self.file_ops = FileOperations(context.engine, context.preview_collector, context.manifest)
 
     def _get_layer_generator(
         self,
@@ -66,40 +74,57 @@ class BasePresetGenerator(AbstractPresetGenerator):
         root_name: str,
         group_components: bool,
         init_imports: bool,
-        context_name: str | None = None,
         import_path_generator: ImportPathGenerator | None = None,
-        preview_collector: PreviewCollector | None = None,
     ) -> LayerGenerator:
-        """Get or create a layer generator for the given layer.
+        """Get a pooled layer generator for the given layer.
+
+        The generator is shared by all contexts of the layer, pass the
+        context to its generate_components.
 
         Args:
             layer_name: Layer name
             root_name: Root package name
             group_components: Whether to group components
             init_imports: Whether to generate imports
-            context_name: Name context
-            import_path_generator: What kind of imports
-            preview_collector: Preview collector for dry generation
+            import_path_generator: What kind of imports, None for the standard ones
 
         Returns:
             Configured LayerGenerator instance
 
         """
-        cache_key = f"{layer_name}_{root_name}_{group_components}_{init_imports}"
-        logger.debug(f"cache_key - {cache_key}")
-        if cache_key not in self.layer_generators:
-            self.layer_generators[cache_key] = LayerGenerator(
-                template_engine=self.template_engine,
-                root_name=root_name,
-                preview_collector=preview_collector,
-                layer_name=layer_name,
-                group_components=group_components,
-                init_imports=init_imports,
-                context_name=context_name,
-                import_path_generator=import_path_generator,
-            )
-        logger.debug(f"layer_generator - {self.layer_generators[cache_key].layer_name}")
-        return self.layer_generators[cache_key]
+        spec = LayerGeneratorSpec(
+            layer_name, root_name, group_components, init_imports, import_path_generator
+        )
+        return self.layer_generators.get(spec)
+
+    def claim_unit(self, key: str) -> bool:
+        """Check whether the current shard generates a unit and record it if so.
+
+        Args:
+            key: Generation unit key, usually a bounded context name
+
+        Returns:
+            True if the unit should be generated
+
+        """
+        shard = self.context.shard
+        if shard is not None and not shard.owns(key):
+            return False
+        if self.context.manifest:
+            self.context.manifest.record_unit(key)
+        return True
+
+    def enter_scope(self, layer_name: str | None, context_name: str | None = None) -> None:
+        """Attribute the following preview nodes and profiled time to a layer and a context.
+
+        Args:
+            layer_name: Current layer, None outside layers
+            context_name: Current context, None outside contexts
+
+        """
+        if self.context.preview_collector:
+            self.context.preview_collector.set_scope(layer_name, context_name)
+        emit("generation.scope", layer=layer_name, context=context_name)
 
     def create_layer_dir(self, root_path: Path, layer_name: str) -> Path:
         """Create a directory for a layer.
@@ -0,0 +1,195 @@
+from collections.abc import Iterable
+from logging import getLogger
+from pathlib import Path
+
+from src.core.layout import CompiledLayout, Layout
+from src.core.utils import GenerationContext
+from src.generators.presets.base import BasePresetGenerator
+from src.generators.utils import LayoutImportPathGenerator
+from src.schemas import ConfigModel
+from src.schemas.config_schema import ContextsLayout
+
+logger = getLogger(__name__)
+
+
+class LayoutPresetGenerator(BasePresetGenerator):
+    """Preset generator placing components according to a layout.
+
+    The config is walked in the shape given by its settings: layers without
+    contexts, contexts inside layers (flat) or layers inside contexts
+    (nested). Where packages and imports go is decided by the layout only,
+    the preset's LAYOUT unless the config sets its own.
+
+    Empty component types outside contexts are skipped, inside contexts
+    they still get their package.
+    """
+
+    LAYOUT = Layout("{root}/{layer}/{context}/{type}")
+
+    def __init__(self, context: GenerationContext) -> None:
+        """Initialize the layout preset generator.
+
+        Args:
+            context: Project configuration
+
+        """
+        super().__init__(context)
+        self._created: set[Path] = set()
+
+    def get_layout(self, config: ConfigModel) -> Layout:
+        """Get the layout of a project.
+
+        Args:
+            config: Project configuration model
+
+        Returns:
+            Layout from the config settings, the preset's default otherwise
+
+        """
+        return config.settings.layout or self.LAYOUT
+
+    def generate(self, root_path: Path, config: ConfigModel, preview_mode: bool) -> None:
+        """Generate the project structure following the layout.
+
+        Args:
+            root_path: Path to the project root directory
+            config: Project configuration model containing settings and layer definitions
+            preview_mode: Special mode for dry generation
+
+        """
+        logger.debug(f"Starting {config.settings.preset_name} preset generation...")
+
+        layout = self.get_layout(config).compile(root_path, config.settings.root_name)
+        logger.debug(f"Layout - {layout.layout}")
+        self._created = set()
+        import_path_generator = LayoutImportPathGenerator(layout)
+
+        settings = config.settings
+        if settings.use_contexts and settings.contexts_layout == ContextsLayout.NESTED:
+            self._generate_nested(layout, config, import_path_generator)
+        else:
+            self._generate_flat(layout, config, import_path_generator, settings.use_contexts)
+
+        logger.debug(f"Layer generator pool: {self.layer_generators}")
+        logger.debug(
+            f"{settings.preset_name.capitalize()} preset generation completed successfully"
+        )
+
+    def _generate_flat(
+        self,
+        layout: CompiledLayout,
+        config: ConfigModel,
+        import_path_generator: LayoutImportPathGenerator,
+        use_contexts: bool,
+    ) -> None:
+        """Walk layers, their contexts and then their components outside contexts.
+
+        Contexts are sharded by name, so a context lands on the same shard in
+        every layer. Components outside contexts are sharded per layer.
+
+        Args:
+            layout: Compiled layout
+            config: Project configuration model
+            import_path_generator: Import path generator of the layout
+            use_contexts: Whether to generate the contexts of the layers
+
+        """
+        for layer in config.layers.iter_layers():
+            if not layer:
+                continue
+
+            self.enter_scope(layer.name)
+            self.create_packages(layout.scope_directories(layer.name, None))
+            layer_generator = self._get_layer_generator(
+                layer_name=layer.name,
+                root_name=config.settings.root_name,
+                group_components=config.settings.group_components,
+                init_imports=config.settings.init_imports,
+                import_path_generator=import_path_generator,
+            )
+
+            if use_contexts:
+                for context in layer.contexts():
+                    if not self.claim_unit(context.name):
+                        continue
+
+                    self.enter_scope(layer.name, context.name)
+                    self.create_packages(layout.scope_directories(layer.name, context.name))
+                    for component_type, components in context.components():
+                        component_dir = self.create_packages(
+                            layout.component_directories(layer.name, context.name, component_type)
+                        )
+                        layer_generator.generate_components(
+                            component_dir, component_type, components, context.name
+                        )
+
+                if not layer.has_components() or not self.claim_unit(f"layer:{layer.name}"):
+                    continue
+                self.enter_scope(layer.name)
+
+            for component_type, components in layer.components():
+                if not components:
+                    continue
+
+                component_dir = self.create_packages(
+                    layout.component_directories(layer.name, None, component_type)
+                )
+                layer_generator.generate_components(component_dir, component_type, components)
+
+    def _generate_nested(
+        self,
+        layout: CompiledLayout,
+        config: ConfigModel,
+        import_path_generator: LayoutImportPathGenerator,
+    ) -> None:
+        """Walk top-level contexts, their layers and the layers' components.
+
+        Args:
+            layout: Compiled layout
+            config: Project configuration model
+            import_path_generator: Import path generator of the layout
+
+        """
+        for context in config.layers.iter_contexts():
+            if not self.claim_unit(context.name):
+                continue
+
+            self.enter_scope(None, context.name)
+            self.create_packages(layout.scope_directories(None, context.name))
+
+            for layer in context.layers():
+                self.enter_scope(layer.name, context.name)
+                layer_generator = self._get_layer_generator(
+                    layer_name=layer.name,
+                    root_name=config.settings.root_name,
+                    group_components=config.settings.group_components,
+                    init_imports=config.settings.init_imports,
+                    import_path_generator=import_path_generator,
+                )
+
+                self.create_packages(layout.scope_directories(layer.name, context.name))
+                for component_type, components in layer.components():
+                    component_dir = self.create_packages(
+                        layout.component_directories(layer.name, context.name, component_type)
+                    )
+                    layer_generator.generate_components(
+                        component_dir, component_type, components, context.name
+                    )
+
+    def create_packages(self, directories: Iterable[Path]) -> Path:
+        """Create package directories with their __init__.py files, once per generation.
+
+        Args:
+            directories: Package directories from the outermost one
+
+        Returns:
+            The innermost directory
+
+        """
+        directory = Path()
+        for directory in directories:
+            if directory not in self._created:
+                self._created.add(directory)
+                self.file_ops.create_directory(directory)
+                self.file_ops.create_init_file(directory)
+        return directory
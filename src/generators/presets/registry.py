@@ -0,0 +1,70 @@
+from collections.abc import Iterator, Mapping
+
+from src.core.exceptions import PluginLoadError
+from src.core.plugins import PluginSpec, discover_plugins
+from src.generators.presets.base import AbstractPresetGenerator
+
+
+class PresetRegistry(Mapping[str, type[AbstractPresetGenerator]]):
+    """Preset generators by preset name.
+
+    Built-in presets are always available. Presets of plugins, declared in
+    the "pyconstructor.presets" entry point group, are discovered only when
+    a name isn't built in, and their modules are imported only when their
+    preset is selected. Plugins can't replace built-in presets.
+    """
+
+    def __init__(self, builtins: Mapping[str, type[AbstractPresetGenerator]]) -> None:
+        """Initialize the registry.
+
+        Args:
+            builtins: Built-in preset generators by preset name
+
+        """
+        self._builtins = dict(builtins)
+        self._loaded: dict[str, type[AbstractPresetGenerator]] = {}
+
+    def _plugins(self) -> dict[str, PluginSpec]:
+        return {
+            name: spec
+            for name, spec in discover_plugins().presets.items()
+            if name not in self._builtins
+        }
+
+    def __getitem__(self, name: str) -> type[AbstractPresetGenerator]:
+        """Get a preset generator, importing its plugin on first use.
+
+        Args:
+            name: Preset name
+
+        Returns:
+            Preset generator class
+
+        Raises:
+            KeyError: If no preset has the name
+            PluginLoadError: If the plugin can't be imported or isn't a preset generator
+
+        """
+        generator = self._builtins.get(name) or self._loaded.get(name)
+        if generator is not None:
+            return generator
+
+        spec = self._plugins().get(name)
+        if spec is None:
+            raise KeyError(name)
+        loaded = spec.load()
+        if not (isinstance(loaded, type) and issubclass(loaded, AbstractPresetGenerator)):
+            raise PluginLoadError(spec.value, f"{name} from {spec.distribution} (not a preset)")
+        self._loaded[name] = loaded
+        return loaded
+
+    def __contains__(self, name: object) -> bool:
+        """Check whether a preset exists without importing its plugin."""
+        return name in self._builtins or name in self._plugins()
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the names of built-in and plugin presets."""
+        return iter({**self._builtins, **self._plugins()})
+
+    def __len__(self) -> int:
+        return len({**self._builtins, **self._plugins()})
@@ -1,47 +1,11 @@
-from logging import getLogger
-from pathlib import Path
+from src.core.layout import Layout
+from src.generators.presets.layout import LayoutPresetGenerator
 
-from src.generators.presets.base import BasePresetGenerator
-from src.schemas import ConfigModel
 
-logger = getLogger(__name__)
+class SimplePresetGenerator(LayoutPresetGenerator):
+    """Generator for the simple preset without contexts.
 
+    Component types are placed directly in their layers.
+    """
 
-class SimplePresetGenerator(BasePresetGenerator):
-    """Generator for the simple preset without contexts."""
-
-    def generate(self, root_path: Path, config: ConfigModel, preview_mode: bool) -> None:
-        """Generate simple project structure without contexts organized by layers.
-
-        Args:
-            root_path: Path to the project root directory
-            config: Project configuration model containing settings and layer definitions
-            preview_mode: Special mode for dry generation
-
-        """
-        logger.debug("Starting simple preset generation...")
-
-        layers_data = config.layers.model_dump()
-        for layer_name, layer_config in layers_data.items():
-            if not layer_config:
-                continue
-
-            layer_path = self.create_layer_dir(root_path, layer_name)
-
-            for component_type, components in layer_config.items():
-                if not components:
-                    continue
-
-                component_dir = self.create_component_dir(layer_path, component_type)
-
-                layer_generator = self._get_layer_generator(
-                    layer_name=layer_name,
-                    root_name=config.settings.root_name,
-                    group_components=config.settings.group_components,
-                    init_imports=config.settings.init_imports,
-                    preview_collector=self.context.preview_collector,
-                )
-
-                layer_generator.generate_components(component_dir, component_type, components)
-
-        logger.debug("Simple preset generation completed successfully")
+    LAYOUT = Layout("{root}/{layer}/{type}")
@@ -1,13 +1,15 @@
 from logging import getLogger
 from pathlib import Path
 
+from ..core.exceptions import PresetNotFoundError, ShardingNotSupportedError
+from ..core.tracing import span
 from ..core.utils import GenerationContext
 from .presets import (
     AdvancedPresetGenerator,
     SimplePresetGenerator,
     StandardPresetGenerator,
 )
-from .presets.base import AbstractPresetGenerator
+from .presets.registry import PresetRegistry
 from .utils import FileOperations
 
 logger = getLogger(__name__)
@@ -21,11 +23,13 @@ class ProjectGenerator:
     architectural presets.
     """
 
-    PRESET_GENERATORS: dict[str, type[AbstractPresetGenerator]] = {
-        "simple": SimplePresetGenerator,
-        "standard": StandardPresetGenerator,
-        "advanced": AdvancedPresetGenerator,
-    }
+    PRESET_GENERATORS = PresetRegistry(
+        {
+            "simple": SimplePresetGenerator,
+            "standard": StandardPresetGenerator,
+            "advanced": AdvancedPresetGenerator,
+        }
+    )
 
     def __init__(self, context: GenerationContext) -> None:
         """Initialize the project generator.
@@ -36,13 +40,20 @@ class ProjectGenerator:
         """
         self.context = context
         if self.context.preview_mode:
-            self.file_ops = FileOperations(context.engine, context.preview_collector)
+            self.file_ops = FileOperations(
+                context.engine, context.preview_collector, context.manifest
+            )
         else:
-            self.file_ops = FileOperations(context.engine)
+            self.file_ops = FileOperations(context.engine, manifest=context.manifest)
 
-        preset_type = self.context.config.settings.preset
-        preset_generator_class = self.PRESET_GENERATORS.get(preset_type, StandardPresetGenerator)
+        preset_name = self.context.config.settings.preset_name
+        try:
+            preset_generator_class = self.PRESET_GENERATORS[preset_name]
+        except KeyError:
+            raise PresetNotFoundError(preset_name, ", ".join(self.PRESET_GENERATORS)) from None
         logger.debug(f"Set preset - {preset_generator_class}")
+        if self.context.shard and not preset_generator_class.SUPPORTS_SHARDING:
+            raise ShardingNotSupportedError(preset_name)
 
         self.preset_generator = preset_generator_class(self.context)
 
@@ -54,9 +65,14 @@ class ProjectGenerator:
         """
         logger.debug("Project generator starting...")
 
-        project_root = Path.cwd()
+        project_root = self.context.project_root or Path.cwd()
         root_name = self.context.config.settings.root_name
         root_path = project_root / root_name
-        self.file_ops.create_directory(root_path)
-        self.file_ops.create_init_file(root_path)
-        self.preset_generator.generate(root_path, self.context.config, self.context.preview_mode)
+        preset_name = self.context.config.settings.preset_name
+        with span("project.generate", preset=preset_name, root=root_path):
+            self.file_ops.create_directory(root_path)
+            self.file_ops.create_init_file(root_path)
+            with span("preset.generate", preset=preset_name):
+                self.preset_generator.generate(
+                    root_path, self.context.config, self.context.preview_mode
+                )
@@ -1,7 +1,12 @@
+import time
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import Any
 
+from src.core.layout import CompiledLayout
+from src.core.manifest import GenerationManifest
 from src.core.template_engine import TemplateEngine
+from src.core.tracing import span
 from src.preview.collector import PreviewCollector
 
 single_form_words = {
@@ -25,6 +30,37 @@ single_form_words = {
 }
 
 
+def singular_form(component_type: str) -> str:
+    """Get the singular form of a component type.
+
+    Args:
+        component_type: Component type, e.g. "repositories"
+
+    Returns:
+        Singular form, e.g. "repository"
+
+    """
+    return single_form_words.get(component_type, component_type.rstrip("s"))
+
+
+def component_module_name(component_name: str, component_type: str) -> str:
+    """Get the module name of a component generated in its own file.
+
+    Args:
+        component_name: Component name, e.g. "UserService"
+        component_type: Component type, e.g. "services"
+
+    Returns:
+        Snake case name with the singular type as suffix, e.g. "user_service"
+
+    """
+    suffix = singular_form(component_type).lower()
+    snake_name = TemplateEngine.camel_to_snake(component_name)
+    if snake_name.lower().endswith(f"_{suffix}"):
+        return snake_name
+    return f"{snake_name}_{suffix}"
+
+
 class FileOperations:
     """Base class for all code generators.
 
@@ -34,6 +70,7 @@ class FileOperations:
     Attributes:
         template_engine: Template engine instance for rendering code templates
         preview_collector: Optional collector for dry generation
+        manifest: Optional record of created directories and written files
 
     """
 
@@ -41,16 +78,19 @@ class FileOperations:
         self,
         template_engine: TemplateEngine,
         preview_collector: PreviewCollector | None = None,
+        manifest: GenerationManifest | None = None,
     ) -> None:
         """Initialize the base generator with a template engine.
 
         Args:
             template_engine: Engine instance for rendering templates
             preview_collector: Collector for dry generation
+            manifest: Record of created directories and written files
 
         """
         self.template_engine = template_engine
         self.preview_collector = preview_collector
+        self.manifest = manifest
 
     def create_directory(self, path: Path) -> Path:
         """Create a directory if it doesn't exist.
@@ -62,10 +102,13 @@ class FileOperations:
             Created path object
 
         """
-        if self.preview_collector:
-            self.preview_collector.add_directory(path)
-        else:
-            path.mkdir(exist_ok=True, parents=True)
+        with span("file.create_directory", path=path):
+            if self.manifest:
+                self.manifest.record_directory(path)
+            if self.preview_collector:
+                self.preview_collector.add_directory(path)
+            else:
+                path.mkdir(exist_ok=True, parents=True)
         return path
 
     def create_init_file(self, path: Path) -> None:
@@ -76,11 +119,12 @@ class FileOperations:
 
         """
         init_file = path / "__init__.py"
-        if self.preview_collector:
-            self.preview_collector.add_init_file(init_file)
-        else:
-            if not init_file.exists():
-                init_file.touch()
+        with span("file.create_init", path=init_file):
+            if self.preview_collector:
+                self.preview_collector.add_init_file(init_file)
+            else:
+                if not init_file.exists():
+                    init_file.touch()
 
     def get_init_path(self, path: Path) -> Path:
         """Return a path to init file.
@@ -95,6 +139,29 @@ class FileOperations:
         init_file = path / "__init__.py"
         return init_file
 
+    def render_file(self, path: Path, template_path: str, context: dict[str, Any]) -> None:
+        """Render a template into a file.
+
+        In preview mode templates are skipped, unless the preview collector
+        measures them. Then the template is rendered into a discarding sink
+        and its size and render time are recorded on the preview node.
+
+        Args:
+            path: Path where to write the file
+            template_path: Path to template relative to templates directory
+            context: Variables to pass to the template
+
+        """
+        if not self.preview_collector:
+            self.write_file(path, self.template_engine.render(template_path, context))
+            return
+
+        self.write_file(path, "")
+        if self.preview_collector.measure:
+            started = time.perf_counter()
+            size = self.template_engine.render_size(template_path, context)
+            self.preview_collector.add_render_cost(path, size, time.perf_counter() - started)
+
     def write_file(self, path: Path, content: str) -> None:
         """Write content to a file.
 
@@ -103,11 +170,14 @@ class FileOperations:
             content: Content to write to the file
 
         """
-        if self.preview_collector:
-            self.preview_collector.add_file(path)
-        else:
-            with open(path, "w") as file:
-                file.write(content)
+        with span("file.write", path=path):
+            if self.manifest:
+                self.manifest.record_file(path)
+            if self.preview_collector:
+                self.preview_collector.add_file(path)
+            else:
+                with open(path, "w") as file:
+                    file.write(content)
 
 
 class ImportPathGenerator(ABC):
@@ -229,3 +299,46 @@ class AdvancedImportPathGenerator(ImportPathGenerator):
             f"from {root_name}.{layer_name}.{component_type}.{module_name} import {component_name}"  # noqa
         )
         return import_string
+
+
+class LayoutImportPathGenerator(ImportPathGenerator):
+    """Import path generator following a compiled layout.
+
+    The package prefix of every layer and context is computed once by the
+    layout, only the module and the component are formatted per import.
+    """
+
+    def __init__(self, layout: CompiledLayout) -> None:
+        """Initialize the generator.
+
+        Args:
+            layout: Compiled layout of the project
+
+        """
+        self.layout = layout
+
+    def generate_import_path(
+        self,
+        root_name: str,
+        layer_name: str,
+        context_name: str,
+        component_type: str,
+        module_name: str,
+        component_name: str,
+    ) -> str:
+        """Generate an import path from the layout's import pattern.
+
+        Args:
+            root_name: Root package name, the layout's own root name is used
+            layer_name: Architecture layer name
+            context_name: Business context name, empty outside contexts
+            component_type: Type of component
+            module_name: Name of the module file
+            component_name: Name of the component to import
+
+        Returns:
+            Complete import statement string
+
+        """
+        package = self.layout.import_package(layer_name, context_name or None, component_type)
+        return f"from {package}.{module_name} import {component_name}"
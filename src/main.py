@@ -1,35 +1,202 @@
+import functools
+import json
 import logging
 import shutil
+import subprocess
 import sys
+from collections.abc import Callable
+from contextlib import ExitStack
+from contextvars import ContextVar
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import click
-import pydantic
-
-from .core.dependencies import container
-from .core.exceptions import ConfigFileNotFoundError, YamlParseError
-from .core.parser import YamlParser
-from .generators import ProjectGenerator
-from .preview.collector import PreviewCollector
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="[%(levelname)s] %(name)s: %(message)s",
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-    ],
-)
 
+from .daemon import DaemonClient
+
+if TYPE_CHECKING:
+    from .core.manifest import ShardSpec
+
+# Heavy dependencies (pydantic, dishka, jinja2, rich) are imported inside the
+# commands that need them, so `pyc --help` and `pyc init` start instantly.
 
 logger = logging.getLogger(__name__)
 
 
+# Preview formats whose stdout must contain nothing but the rendered structure.
+MACHINE_READABLE_FORMATS = ("json", "ndjson")
+
+# Cleared while a command is profiled, the daemon would measure its own warm process.
+daemon_forwarding: ContextVar[bool] = ContextVar("daemon_forwarding", default=True)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class _CurrentStderrHandler(logging.StreamHandler):
+    """Stream handler writing to sys.stderr as it is when a record is emitted.
+
+    Diagnostics stay out of stdout, e.g. out of preview --format json. The
+    daemon redirects stderr while it executes a forwarded command, the
+    records of the command have to reach its client as well.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.stream = sys.stderr
+        super().emit(record)
+
+
+def configure_logging() -> None:
+    """Configure logging for CLI commands."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="[%(levelname)s] %(name)s: %(message)s",
+        handlers=[
+            _CurrentStderrHandler(),
+        ],
+    )
+
+
+def forward_to_daemon(command: str, args: list[str]) -> bool:
+    """Execute a command in the running daemon, if there is one.
+
+    Args:
+        command: Command name
+        args: Command line arguments for the command
+
+    Returns:
+        True if the daemon executed the command, False to run it in-process
+
+    """
+    if not daemon_forwarding.get():
+        return False
+
+    response = DaemonClient().request(command, args)
+    if response is None:
+        return False
+
+    click.echo(response.stdout, nl=False)
+    click.echo(response.stderr, nl=False, err=True)
+    if response.exit_code:
+        sys.exit(response.exit_code)
+    return True
+
+
+def parse_shard(
+    ctx: click.Context, param: click.Parameter, value: str | None
+) -> "ShardSpec | None":
+    """Parse the --shard option.
+
+    Args:
+        ctx: Click context
+        param: Parsed parameter
+        value: Raw option value
+
+    Returns:
+        Parsed shard or None
+
+    """
+    if value is None:
+        return None
+
+    from .core.manifest import ShardSpec
+
+    try:
+        return ShardSpec.parse(value)
+    except ValueError as error:
+        raise click.BadParameter(str(error)) from error
+
+
+def profile_options(command: F) -> F:  # noqa: UP047
+    """Add --profile, --profile-dump, --memory-report and --trace options to a command.
+
+    A profiled or traced command always runs in-process. Profiling prints
+    wall time, CPU time and call counts per phase and per bounded context
+    when the command ends, the memory report prints tracemalloc statistics
+    per phase and tracing writes spans as a Chrome trace.
+
+    Args:
+        command: Command callback
+
+    Returns:
+        Callback with profiling options
+
+    """
+
+    @click.option(
+        "--profile",
+        is_flag=True,
+        help="Print time and call counts per phase (parse, validate, plan, render, write).",
+    )
+    @click.option(
+        "--profile-dump",
+        type=click.Path(dir_okay=False),
+        help="Also write a cProfile pstats file of the command. Implies --profile.",
+    )
+    @click.option(
+        "--memory-report",
+        is_flag=True,
+        help="Print peak memory and top allocation sites per phase, using tracemalloc.",
+    )
+    @click.option(
+        "--trace",
+        "trace_path",
+        type=click.Path(dir_okay=False),
+        help="Write a Chrome trace JSON file, viewable in chrome://tracing or Perfetto.",
+    )
+    @functools.wraps(command)
+    def wrapper(
+        *args: object,
+        profile: bool,
+        profile_dump: str | None,
+        memory_report: bool,
+        trace_path: str | None,
+        **kwargs: object,
+    ) -> object:
+        if not profile and not profile_dump and not memory_report and not trace_path:
+            return command(*args, **kwargs)
+
+        token = daemon_forwarding.set(False)
+        try:
+            with ExitStack() as stack:
+                if trace_path:
+                    from .core.tracing import chrome_trace
+
+                    stack.enter_context(chrome_trace(Path(trace_path)))
+                    stack.callback(click.echo, f"Trace written to {trace_path}", err=True)
+                if profile or profile_dump:
+                    from .core.profiler import Profiler, profiling
+
+                    profiler = Profiler()
+                    if profile_dump:
+                        message = f"cProfile stats written to {profile_dump}"
+                        stack.callback(click.echo, message, err=True)
+                    stack.callback(profiler.print_report)
+                    stack.enter_context(
+                        profiling(profiler, Path(profile_dump) if profile_dump else None)
+                    )
+                if memory_report:
+                    # Load the generation machinery first, so the report shows generation
+                    # and tracemalloc snapshots don't hold every imported module.
+                    from .core import dependencies  # noqa: F401
+                    from .core.memory_profiler import MemoryProfiler, memory_profiling
+
+                    memory_profiler = MemoryProfiler()
+                    stack.callback(memory_profiler.print_report)
+                    stack.enter_context(memory_profiling(memory_profiler))
+                return command(*args, **kwargs)
+        finally:
+            daemon_forwarding.reset(token)
+
+    return wrapper  # type: ignore[return-value]
+
+
 @click.group()
 def cli() -> None:
     """Entry point for the PyConstructor command-line tool app.
 
     This is the main command group that provides access to all available commands.
     """
+    configure_logging()
 
 
 @click.command()
@@ -73,47 +240,87 @@ def init(preset: str, force: bool) -> None:
 
 @click.command()
 @click.option("-f", "--file", help="Path to YAML file.")
-def validate(file: str | None = None) -> None:
-    """Validate the YAML configuration file.
+@click.option(
+    "--strict",
+    is_flag=True,
+    help="Also check names, duplicates and collisions of generated modules and paths.",
+)
+@click.option("-w", "--workers", type=int, help="Number of validation processes for many configs.")
+@click.option("--report", "report_path", help="Write a report of all validated configs.")
+@click.option(
+    "--report-format",
+    type=click.Choice(["junit", "json"]),
+    help="Report format, JUnit XML for .xml reports and JSON otherwise by default.",
+)
+@profile_options
+@click.argument("configs", nargs=-1)
+def validate(
+    file: str | None = None,
+    strict: bool = False,
+    workers: int | None = None,
+    report_path: str | None = None,
+    report_format: str | None = None,
+    configs: tuple[str, ...] = (),
+) -> None:
+    """Validate the YAML configuration file, or many config files and glob patterns.
 
     Args:
         file: Optional path to the configuration file
+        strict: Whether to lint the validated configuration
+        workers: Number of validation processes for many configs
+        report_path: Optional path of a report of all validated configs
+        report_format: Report format, junit or json
+        configs: Config paths or glob patterns, validated concurrently
 
     """
+    if configs or report_path:
+        paths = configs or (file or "ddd-config.yaml",)
+        validate_many(paths, strict, workers, report_path, report_format)
+        return
+
+    daemon_args = ["--file", file] if file else []
+    if forward_to_daemon("validate", daemon_args + (["--strict"] if strict else [])):
+        return
+
+    from .core.dependencies import get_container
+    from .core.exceptions import ConfigFileNotFoundError, ConfigValidationError, YamlParseError
+    from .core.parser import YamlParser
+
     click.echo("Starting validation...")
-    parser = container.get(YamlParser)
+    parser = get_container().get(YamlParser)
+    file_path = Path(file) if file else Path.cwd() / YamlParser.DEFAULT_CONFIG_FILENAME
     try:
-        if file:
-            file_path = Path(file)
-            parser.load(file_path)
-        else:
-            parser.load()
+        document = parser.load_document(file_path)
+        config = parser.validate(document.data, document.source_map, file_path)
+        if strict:
+            from .core.linter import ConfigLinter
+
+            issues = ConfigLinter(config, document.source_map).lint()
+            for issue in issues:
+                click.secho(f"✗ {issue.format(file_path)}", fg="red", err=True, color=True)
+            if issues:
+                click.secho(f"✗ {len(issues)} issue(s) found", fg="red", err=True, color=True)
+                sys.exit(1)
         click.secho(
             "✓ Configuration validated successfully",
             fg="green",
             color=True,
         )
-    except YamlParseError as error:
+        return
+    except (YamlParseError, ConfigFileNotFoundError) as error:
         click.secho(
             f"✗ {error}",
             fg="red",
             err=True,
             color=True,
         )
-    except ConfigFileNotFoundError as error:
+    except ConfigValidationError as error:
         click.secho(
             f"✗ {error}",
             fg="red",
             err=True,
             color=True,
         )
-    except pydantic.ValidationError as error:
-        click.secho(
-            f"✗ Configuration invalid: {error}",
-            fg="red",
-            err=True,
-            color=True,
-        )
         click.secho(
             "Hint: Check the documentation for correct configuration format",
             fg="red",
@@ -122,17 +329,120 @@ def validate(file: str | None = None) -> None:
         )
     except Exception as error:
         click.secho(f"✗ Error: {error}", fg="red", err=True)
+    sys.exit(1)
+
+
+def validate_many(
+    configs: tuple[str, ...],
+    strict: bool,
+    workers: int | None,
+    report_path: str | None,
+    report_format: str | None,
+) -> None:
+    """Validate many config files concurrently, printing results as they finish.
+
+    Runs in-process, never in the daemon, since it starts its own worker processes.
+
+    Args:
+        configs: Config paths or glob patterns
+        strict: Whether to lint the validated configurations
+        workers: Number of validation processes
+        report_path: Optional path of a report of all validated configs
+        report_format: Report format, junit or json
+
+    """
+    import time
+
+    from .core.batch import expand_config_paths
+    from .core.validation import BatchValidator, write_json_report, write_junit_report
+
+    config_paths = expand_config_paths(configs)
+    click.echo(f"Validating {len(config_paths)} configs...")
+
+    started = time.perf_counter()
+    results = []
+    for result in BatchValidator(workers=workers, strict=strict).validate(config_paths):
+        results.append(result)
+        if result.success:
+            click.secho(f"✓ {result.config_path}", fg="green")
+            continue
+        click.secho(f"✗ {result.config_path}", fg="red", err=True)
+        for error in result.errors:
+            click.secho(f"    {error}", fg="red", err=True)
+    total_duration = time.perf_counter() - started
+    results.sort(key=lambda result: result.index)
+
+    failed = sum(not result.success for result in results)
+    click.secho(
+        f"{len(results) - failed} valid, {failed} invalid, {total_duration:.2f}s",
+        fg="red" if failed else "green",
+    )
+
+    if report_path:
+        report_file = Path(report_path)
+        if (report_format or ("junit" if report_file.suffix == ".xml" else "json")) == "junit":
+            write_junit_report(results, report_file, total_duration)
+        else:
+            write_json_report(results, report_file, total_duration)
+        click.echo(f"Report written to {report_file}")
+
+    if failed:
+        sys.exit(1)
 
 
 @click.command()
 @click.option("-f", "--file", help="Path to YAML file.")
-def preview(file: str | None = None) -> None:
+@click.option(
+    "--format",
+    "render_format",
+    type=click.Choice(["tree", "stream", "json", "ndjson"]),
+    default="tree",
+    show_default=True,
+    help="Preview renderer. 'stream' writes very large trees line by line, "
+    "'json' and 'ndjson' write the structure and statistics to stdout.",
+)
+@click.option(
+    "-m",
+    "--measure",
+    is_flag=True,
+    help="Render templates without writing them and report the heaviest contexts and modules.",
+)
+@click.option(
+    "--top",
+    type=click.IntRange(min=1),
+    default=10,
+    show_default=True,
+    help="Number of contexts and modules in the measure report.",
+)
+@profile_options
+def preview(
+    file: str | None = None,
+    render_format: str = "tree",
+    measure: bool = False,
+    top: int = 10,
+) -> None:
     """Preview the project structure without generating files.
 
     Args:
         file: Optional path to the configuration file
+        render_format: Name of the preview renderer
+        measure: Whether to measure rendered sizes and times
+        top: Number of entries in the measure report
 
     """
+    args = ["--format", render_format, "--top", str(top)]
+    if file:
+        args += ["--file", file]
+    if measure:
+        args.append("--measure")
+    if forward_to_daemon("preview", args):
+        return
+
+    from .core.dependencies import get_container
+    from .core.utils import GenerationRequest
+    from .generators import ProjectGenerator
+    from .preview.collector import PreviewCollector
+
     try:
         path = Path(file) if file else None
 
@@ -140,15 +450,24 @@ def preview(file: str | None = None) -> None:
             click.secho(f"Error: Config file not found: {file}", fg="red", err=True)
             return
 
-        click.echo("Project generation started.", color=True)
+        if render_format not in MACHINE_READABLE_FORMATS:
+            click.echo("Project generation started.", color=True)
+
+        generation_request = GenerationRequest(
+            file_path=path, preview_mode=True, render_format=render_format, measure=measure
+        )
+        with get_container().request(generation_request) as request:
+            generator: ProjectGenerator = request.get(ProjectGenerator)
+            generator.generate()
+
+            collector: PreviewCollector = request.get(PreviewCollector)
+            collector.display()
 
-        container.provider.set_file_path(path)
-        container.provider.set_preview_mode(preview_mode=True)
-        generator: ProjectGenerator = container.get(ProjectGenerator)
-        generator.generate()
+            # Machine-readable formats already carry the measurements in node metadata.
+            if measure and render_format not in MACHINE_READABLE_FORMATS:
+                from .preview.report import print_measure_report
 
-        collector: PreviewCollector = container.get(PreviewCollector)
-        collector.display()
+                print_measure_report(collector, top)
 
     except Exception as error:
         click.secho(f"Error: {error}", fg="red", err=True)
@@ -156,10 +475,59 @@ def preview(file: str | None = None) -> None:
 
 @click.command()
 @click.option("-f", "--file", help="Path to YAML file.")
-def run(file: str | None = None) -> None:
+@click.option("-b", "--batch", is_flag=True, help="Generate one project per config file.")
+@click.option("-w", "--workers", type=int, help="Number of concurrent batch generations.")
+@click.option(
+    "-o",
+    "--output-dir",
+    help="Batch output directory, one sub-directory per config. Defaults to the config's dir.",
+)
+@click.option(
+    "--shard",
+    callback=parse_shard,
+    help="Generate only shard INDEX/COUNT (zero-based) of the bounded contexts.",
+)
+@click.option("-m", "--manifest", "manifest_path", help="Write a manifest of generated files.")
+@profile_options
+@click.argument("configs", nargs=-1)
+def run(
+    file: str | None = None,
+    batch: bool = False,
+    workers: int | None = None,
+    output_dir: str | None = None,
+    shard: "ShardSpec | None" = None,
+    manifest_path: str | None = None,
+    configs: tuple[str, ...] = (),
+) -> None:
     """Generate the project structure based on configuration."""
+    if batch or configs:
+        if shard or manifest_path:
+            raise click.UsageError("--shard and --manifest can't be combined with --batch.")
+        run_batch(configs, workers, output_dir)
+        return
+
+    args = ["--file", file] if file else []
+    if shard:
+        args += ["--shard", f"{shard.index}/{shard.count}"]
+    if manifest_path:
+        args += ["--manifest", manifest_path]
+    if forward_to_daemon("run", args):
+        return
+
+    from .core.dependencies import get_container
+    from .core.exceptions import (
+        ConfigFileNotFoundError,
+        ConfigValidationError,
+        PresetNotFoundError,
+        YamlParseError,
+    )
+    from .core.parser import YamlParser
+    from .core.utils import GenerationRequest
+    from .generators import ProjectGenerator
+
     try:
         path = Path(file) if file else None
+        container = get_container()
         parser = container.get(YamlParser)
 
         if path and not path.exists():
@@ -172,30 +540,293 @@ def run(file: str | None = None) -> None:
                 parser.load(file_path)
             else:
                 parser.load()
-        except (
-            YamlParseError,
-            ConfigFileNotFoundError,
-            pydantic.ValidationError,
-        ) as error:
+        except (YamlParseError, ConfigFileNotFoundError) as error:
             click.secho(f"✗ {error}", fg="red", err=True)
             return
+        except ConfigValidationError as error:
+            click.secho(f"✗ {error}", fg="red", err=True)
+            sys.exit(1)
 
         click.echo("Project generation started.", color=True)
 
-        container.provider.set_file_path(path)
-        generator = container.get(ProjectGenerator)
-        generator.generate()
+        generation_request = GenerationRequest(
+            file_path=path, shard=shard, record_manifest=bool(manifest_path)
+        )
+        with container.request(generation_request) as request:
+            generator: ProjectGenerator = request.get(ProjectGenerator)
+            generator.generate()
+
+        manifest = generator.context.manifest
+        if manifest is not None:
+            default_name = shard.default_manifest_name() if shard else "pyc-manifest.json"
+            manifest_file = Path(manifest_path or default_name)
+            manifest.write(manifest_file, Path.cwd())
+            click.echo(f"Manifest written to {manifest_file}")
 
         click.secho("Project generation completed successfully.", fg="green")
 
+    except PresetNotFoundError as error:
+        click.secho(f"Error: {error}", fg="red", err=True)
+        sys.exit(1)
     except Exception as error:
         click.secho(f"Error: {error}", fg="red", err=True)
 
 
+@click.command("merge-manifests")
+@click.argument("manifests", nargs=-1, required=True)
+@click.option("-f", "--file", help="Path to YAML file the merged manifest must match.")
+@click.option("-o", "--output", default="pyc-manifest.json", help="Merged manifest path.")
+def merge_manifests(manifests: tuple[str, ...], file: str | None, output: str) -> None:
+    """Combine shard manifests and verify nothing is missing or duplicated.
+
+    Args:
+        manifests: Paths to shard manifests
+        file: Optional path to the configuration file
+        output: Path of the merged manifest
+
+    """
+    from .core import manifest as manifest_module
+    from .core.dependencies import get_container
+    from .core.exceptions import ManifestMergeError
+    from .core.utils import GenerationRequest
+    from .generators import ProjectGenerator
+
+    try:
+        shard_manifests = [manifest_module.load_manifest(Path(path)) for path in manifests]
+
+        expected = None
+        if file:
+            generation_request = GenerationRequest(
+                file_path=Path(file), preview_mode=True, record_manifest=True
+            )
+            with get_container().request(generation_request) as request:
+                generator: ProjectGenerator = request.get(ProjectGenerator)
+                generator.generate()
+            expected = generator.context.manifest.to_dict(Path.cwd())  # type: ignore[union-attr]
+
+        merged = manifest_module.merge_manifests(shard_manifests, expected)
+    except ManifestMergeError as error:
+        click.secho(f"✗ {error}", fg="red", err=True)
+        sys.exit(1)
+    except Exception as error:
+        click.secho(f"✗ Error: {error}", fg="red", err=True)
+        sys.exit(1)
+
+    with open(output, "w", encoding="utf-8") as output_file:
+        json.dump(merged, output_file, indent=2)
+    click.secho(
+        f"✓ Merged {len(shard_manifests)} manifests: {len(merged['units'])} units, "
+        f"{len(merged['files'])} files -> {output}",
+        fg="green",
+    )
+
+
+def run_batch(configs: tuple[str, ...], workers: int | None, output_dir: str | None) -> None:
+    """Generate many projects from many configs in one process.
+
+    Args:
+        configs: Config paths or glob patterns
+        workers: Number of concurrent generations
+        output_dir: Optional directory for generated projects
+
+    """
+    if not configs:
+        click.secho("✗ No config files given for batch mode.", fg="red", err=True)
+        sys.exit(2)
+
+    args = ["--batch", *configs]
+    if workers:
+        args += ["--workers", str(workers)]
+    if output_dir:
+        args += ["--output-dir", output_dir]
+    if forward_to_daemon("run", args):
+        return
+
+    import time
+
+    from .core.batch import BatchGenerator, expand_config_paths, print_batch_report
+
+    config_paths = expand_config_paths(configs)
+    click.echo(f"Batch generation started for {len(config_paths)} configs.")
+
+    started = time.perf_counter()
+    generator = BatchGenerator(workers=workers, output_dir=Path(output_dir) if output_dir else None)
+    results = generator.generate(config_paths)
+    print_batch_report(results, time.perf_counter() - started)
+
+    if not all(result.success for result in results):
+        sys.exit(1)
+
+
+@click.command()
+@click.option("-f", "--file", help="Path to YAML file.")
+@click.option(
+    "-r",
+    "--root",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Generated root package directory, defaults to root_name in the current directory.",
+)
+@click.option("-w", "--workers", type=int, help="Number of parsing processes.")
+@click.option("--no-cache", is_flag=True, help="Parse every module, ignoring the module cache.")
+def lint(file: str | None, root: Path | None, workers: int | None, no_cache: bool) -> None:
+    """Check that imports of the generated project respect its layers and contexts.
+
+    Args:
+        file: Optional path to the configuration file
+        root: Generated root package directory
+        workers: Number of parsing processes
+        no_cache: Whether to parse every module, ignoring the module cache
+
+    """
+    from .core.boundaries import BoundaryLinter
+    from .core.exceptions import PyConstructorError, YamlParseError
+    from .core.parser import YamlParser
+
+    try:
+        config = YamlParser().load(Path(file) if file else None)
+        root_path = root or Path(config.settings.root_name)
+        if not root_path.is_dir():
+            click.secho(f"✗ Root package not found: {root_path}", fg="red", err=True)
+            sys.exit(1)
+        linter = BoundaryLinter(config, root_path, workers=workers, use_cache=not no_cache)
+        violations = linter.lint()
+    except (PyConstructorError, YamlParseError) as error:
+        click.secho(f"✗ {error}", fg="red", err=True)
+        sys.exit(1)
+
+    index = linter.index
+    modules = (
+        f"{index.parsed + index.cached} modules ({index.parsed} parsed, {index.cached} cached)"
+    )
+    for violation in violations:
+        click.secho(f"✗ {violation.format(root_path)}", fg="red", err=True)
+    if violations:
+        click.secho(f"✗ {len(violations)} violation(s) in {modules}", fg="red", err=True)
+        sys.exit(1)
+    click.secho(f"✓ No boundary violations in {modules}", fg="green")
+
+
+@click.command("import")
+@click.argument("package_dir", type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.option("-o", "--output", default="ddd-config.yaml", help="Path of the generated config.")
+@click.option("-f", "--force", is_flag=True, help="Overwrite existing config file.")
+@click.option("-w", "--workers", type=int, help="Number of parsing processes.")
+@click.option("--no-cache", is_flag=True, help="Parse every module, ignoring the module cache.")
+def import_project(
+    package_dir: Path, output: str, force: bool, workers: int | None, no_cache: bool
+) -> None:
+    """Generate a configuration from an existing package.
+
+    Args:
+        package_dir: Root package directory, its name becomes the root_name
+        output: Path of the generated config
+        force: Whether to overwrite an existing config file
+        workers: Number of parsing processes
+        no_cache: Whether to parse every module, ignoring the module cache
+
+    """
+    from .core.importer import ConfigImporter
+
+    config_path = Path(output)
+    if config_path.exists() and not force:
+        click.secho(
+            "✗ Config file already exists. Use --force to overwrite.",
+            fg="red",
+            err=True,
+        )
+        sys.exit(1)
+
+    importer = ConfigImporter(package_dir, workers=workers, use_cache=not no_cache)
+    try:
+        config = importer.import_config()
+        config_path.write_text(importer.dump(config), encoding="utf-8")
+    except OSError as error:
+        click.secho(f"✗ Failed to import {package_dir}: {error}", fg="red", err=True)
+        sys.exit(1)
+
+    summary = importer.summary
+    click.echo(
+        f"Indexed {summary.modules} modules: {importer.index.parsed} parsed, "
+        f"{importer.index.cached} cached."
+    )
+    for skipped in summary.skipped:
+        click.secho(f"⚠ Not described by the config: {skipped}", fg="yellow")
+    click.secho(
+        f"✓ Imported {summary.preset} config: {summary.contexts} contexts, "
+        f"{summary.component_types} component types, {summary.components} components "
+        f"-> {config_path}",
+        fg="green",
+    )
+
+
+@click.command()
+@click.option("-s", "--socket", "socket_path", help="Path to the daemon Unix socket.")
+@click.option("--background", is_flag=True, help="Start the daemon as a detached process.")
+@click.option("--stop", is_flag=True, help="Stop the running daemon.")
+@click.option("--status", is_flag=True, help="Check whether the daemon is running.")
+def daemon(socket_path: str | None, background: bool, stop: bool, status: bool) -> None:
+    """Run a warm background server for run, validate and preview commands.
+
+    Args:
+        socket_path: Optional path to the daemon socket
+        background: Whether to detach the daemon from the terminal
+        stop: Whether to stop the running daemon
+        status: Whether to only report the daemon status
+
+    """
+    client = DaemonClient(Path(socket_path) if socket_path else None)
+
+    if status:
+        if client.ping():
+            click.secho(f"✓ Daemon is running on {client.socket_path}", fg="green")
+        else:
+            click.secho("✗ Daemon is not running", fg="yellow")
+        return
+
+    if stop:
+        if client.shutdown():
+            click.secho("✓ Daemon stopped", fg="green")
+        else:
+            click.secho("✗ Daemon is not running", fg="yellow")
+        return
+
+    if background:
+        subprocess.Popen(  # noqa: S603
+            [sys.executable, "-m", "src.main", "daemon", "--socket", str(client.socket_path)],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        click.secho(f"✓ Daemon starting on {client.socket_path}", fg="green")
+        return
+
+    from .daemon.server import DaemonServer
+
+    try:
+        server = DaemonServer(client.socket_path)
+    except (OSError, RuntimeError) as error:
+        click.secho(f"✗ Failed to start daemon: {error}", fg="red", err=True)
+        return
+
+    with server:
+        server.warm_up()
+        click.secho(f"✓ Daemon listening on {client.socket_path}", fg="green")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    click.echo("Daemon stopped.")
+
+
 cli.add_command(run)
 cli.add_command(init)
 cli.add_command(validate)
 cli.add_command(preview)
+cli.add_command(daemon)
+cli.add_command(merge_manifests)
+cli.add_command(import_project)
+cli.add_command(lint)
 
 if __name__ == "__main__":
     cli()
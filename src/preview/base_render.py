@@ -1,15 +1,23 @@
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 
 from ..core.template_engine import TemplateEngine
-from .objects import PreviewNode
+from .objects import PreviewNode, PreviewStatistics
 
 
 class BaseAbstractPreviewRender(ABC):
-    def __init__(self, preview_data: dict, root_node: PreviewNode | None = None) -> None:
+    def __init__(
+        self,
+        preview_data: Mapping[str, PreviewNode],
+        root_node: PreviewNode | None = None,
+        template_engine: TemplateEngine | None = None,
+        stats: PreviewStatistics | None = None,
+    ) -> None:
         """Init data."""
         self.data = preview_data
         self.root_node = root_node
-        self.template_engine = TemplateEngine()
+        self.template_engine = template_engine or TemplateEngine()
+        self.stats = stats or PreviewStatistics()
 
     @abstractmethod
     def render(self) -> None:
@@ -1,51 +1,96 @@
+import os
+from collections.abc import Iterator, Mapping
 from logging import getLogger
 from pathlib import Path
 
 from src.core.exceptions import StructureForPreviewNotFoundError
+from src.core.template_engine import TemplateEngine
+from src.core.tracing import span
 from src.preview.base_render import BaseAbstractPreviewRender
-from src.preview.objects import ComponentType, PreviewNode
+from src.preview.json_render import JsonPreviewRender, NdjsonPreviewRender
+from src.preview.objects import ComponentType, PreviewNode, PreviewStatistics
+from src.preview.stream_render import StreamTreePreviewRender
 from src.preview.tree_render import TreePreviewRender
 
 logger = getLogger(__name__)
 
 
+class PreviewNodeIndex(Mapping[str, PreviewNode]):
+    """Read-only view of collected nodes keyed by their path.
+
+    Paths aren't stored, lookups walk the tree segment by segment instead.
+    """
+
+    def __init__(self, collector: "PreviewCollector") -> None:
+        """Initialize the view.
+
+        Args:
+            collector: Collector owning the nodes
+
+        """
+        self.collector = collector
+
+    def __getitem__(self, path: str) -> PreviewNode:
+        node = self.collector.find(Path(path))
+        if node is None:
+            raise KeyError(path)
+        return node
+
+    def __iter__(self) -> Iterator[str]:
+        for node in self.collector.all_nodes:
+            yield self.collector.get_path(node)
+
+    def __len__(self) -> int:
+        return len(self.collector.all_nodes)
+
+
 class PreviewCollector:
     """Collects information about project structure for preview mode."""
 
     RENDER_TYPES: dict[str, type[BaseAbstractPreviewRender]] = {
         "tree": TreePreviewRender,
+        "stream": StreamTreePreviewRender,
+        "json": JsonPreviewRender,
+        "ndjson": NdjsonPreviewRender,
     }
 
-    def __init__(self, render_format: str | None = None) -> None:
+    def __init__(
+        self,
+        render_format: str | None = None,
+        template_engine: TemplateEngine | None = None,
+        measure: bool = False,
+    ) -> None:
         """Initialize collector.
 
         Args:
             render_format: Format for rendering
+            template_engine: Shared template engine for the renderer
+            measure: Whether generators render templates to measure their size
 
         """
         self.display_type = render_format if render_format else "tree"
         self.root_node: PreviewNode | None = None
-        self.nodes: dict[str, PreviewNode] = {}
-        self.renderer = self.RENDER_TYPES[self.display_type](self.nodes)
+        self.all_nodes: list[PreviewNode] = []
+        self._implicit: set[int] = set()
+        self.top_nodes: dict[str, PreviewNode] = {}
+        self.nodes = PreviewNodeIndex(self)
+        self.measure = measure
+        self.stats = PreviewStatistics(measured=measure)
+        self.renderer = self.RENDER_TYPES[self.display_type](
+            self.nodes, template_engine=template_engine, stats=self.stats
+        )
 
     def add_directory(self, path: Path) -> None:
         """Add directory to preview structure.
 
+        The first added directory becomes the root of the preview.
+
         Args:
             path: Directory path
 
         """
-        path_str = str(path)
-
-        node = PreviewNode(name=path.name, type=ComponentType.DIRECTORY, path=path_str)
-        self.nodes[path_str] = node
-
-        parent_path = str(path.parent)
-        if parent_path in self.nodes:
-            parent_node = self.nodes[parent_path]
-            if node not in parent_node.children:
-                parent_node.children.append(node)
-        elif self.root_node is None:
+        node = self._insert(path, ComponentType.DIRECTORY)
+        if self.root_node is None:
             self.root_node = node
 
     def add_file(self, path: Path, file_type: ComponentType = ComponentType.FILE) -> None:
@@ -56,15 +101,147 @@ class PreviewCollector:
             file_type: Type of file
 
         """
-        path_str = str(path)
+        self._insert(path, file_type)
 
-        node = PreviewNode(name=path.name, type=file_type, path=path_str)
+    def _insert(self, path: Path, node_type: ComponentType) -> PreviewNode:
+        """Insert a node, creating missing parent directories on demand.
+
+        Children are indexed by name, so every insert costs one dict
+        lookup per path segment, regardless of the number of siblings.
+
+        Args:
+            path: Node path
+            node_type: Type of the node
+
+        Returns:
+            Inserted node, or the existing node with the same path
+
+        """
+        *parent_parts, name = path.parts
+        siblings = self.top_nodes
+        parent: PreviewNode | None = None
+        for part in parent_parts:
+            node = siblings.get(part) if parent is None else parent.get_child(part)
+            if node is None:
+                node = self._create_node(part, ComponentType.DIRECTORY, parent, implicit=True)
+            parent = node
+
+        existing = siblings.get(name) if parent is None else parent.get_child(name)
+        if existing is not None:
+            if existing.index in self._implicit:
+                self._implicit.discard(existing.index)
+                self.stats.count_node(existing)
+            return existing
+        return self._create_node(name, node_type, parent)
+
+    def _create_node(
+        self,
+        name: str,
+        node_type: ComponentType,
+        parent: PreviewNode | None,
+        implicit: bool = False,
+    ) -> PreviewNode:
+        """Create a node and attach it to its parent.
+
+        Implicit parents, e.g. the directories above the project root, are
+        only counted in statistics once they are added themselves, so the
+        statistics don't depend on where the project is generated.
+
+        Args:
+            name: Node name
+            node_type: Type of the node
+            parent: Parent node, None for top-level nodes
+            implicit: Whether the node is a parent created for a descendant
+
+        Returns:
+            Created node
+
+        """
+        node = PreviewNode(
+            name=name,
+            type=node_type,
+            index=len(self.all_nodes),
+            parent=parent.index if parent is not None else -1,
+        )
+        self.all_nodes.append(node)
+        if implicit:
+            self._implicit.add(node.index)
+        else:
+            self.stats.count_node(node)
+        if parent is None:
+            self.top_nodes[node.name] = node
+        else:
+            parent.add_child(node)
+        return node
 
-        parent_path = str(path.parent)
-        if parent_path in self.nodes:
-            parent_node = self.nodes[parent_path]
-            if node not in parent_node.children:
-                parent_node.children.append(node)
+    def find(self, path: Path) -> PreviewNode | None:
+        """Find a node by its path.
+
+        Args:
+            path: Node path
+
+        Returns:
+            Node or None if it wasn't collected
+
+        """
+        node: PreviewNode | None = None
+        for part in path.parts:
+            node = self.top_nodes.get(part) if node is None else node.get_child(part)
+            if node is None:
+                return None
+        return node
+
+    def get_path(self, node: PreviewNode) -> str:
+        """Rebuild the full path of a node from its parent indices.
+
+        Args:
+            node: Collected node
+
+        Returns:
+            Full path as string
+
+        """
+        names = [node.name]
+        while node.parent >= 0:
+            node = self.all_nodes[node.parent]
+            names.append(node.name)
+        return os.path.join(*reversed(names))
+
+    def set_scope(self, layer_name: str | None, context_name: str | None = None) -> None:
+        """Set the layer and context counting the following nodes in statistics.
+
+        Args:
+            layer_name: Current layer, None outside layers
+            context_name: Current context, None outside contexts
+
+        """
+        self.stats.set_scope(layer_name, context_name)
+
+    def add_components(self, number: int) -> None:
+        """Count declared components in statistics.
+
+        Args:
+            number: Number of components
+
+        """
+        self.stats.count_components(number)
+
+    def add_render_cost(self, path: Path, size: int, render_time: float) -> None:
+        """Record the rendered size and render time of a module.
+
+        A module rendered again replaces its previous size, as the file
+        would be overwritten, while render times add up.
+
+        Args:
+            path: Module path
+            size: Rendered size in bytes
+            render_time: Render time in seconds
+
+        """
+        metadata = self._insert(path, ComponentType.FILE).metadata
+        self.stats.count_render_cost(size - metadata.get("bytes", 0), render_time)
+        metadata["bytes"] = size
+        metadata["render_time"] = metadata.get("render_time", 0.0) + render_time
 
     def add_init_file(self, path: Path) -> None:
         """Add __init__.py a file to preview structure.
@@ -81,4 +258,5 @@ class PreviewCollector:
             raise StructureForPreviewNotFoundError()
         self.renderer.root_node = self.root_node
 
-        self.renderer.render()
+        with span("preview.render", format=self.display_type, nodes=len(self.all_nodes)):
+            self.renderer.render()
@@ -0,0 +1,151 @@
+import json
+import sys
+from collections.abc import Iterator
+from typing import Any, TextIO
+
+from src.preview.base_render import BaseAbstractPreviewRender
+from src.preview.objects import ComponentType, PreviewNode
+
+
+def node_fields(node: PreviewNode) -> dict[str, Any]:
+    """Get the serialized fields of a node, without its children.
+
+    Args:
+        node: Preview node
+
+    Returns:
+        Name, type and metadata of the node, if any
+
+    """
+    fields: dict[str, Any] = {"name": node.name, "type": node.type.value}
+    if node.has_metadata:
+        fields["metadata"] = node.metadata
+    return fields
+
+
+class JsonPreviewRender(BaseAbstractPreviewRender):
+    """Renderer writing the structure as one JSON document to stdout.
+
+    The document is written piece by piece while walking the tree, so it is
+    never held in memory as a whole. Directories have a "children" list,
+    statistics follow the tree under the "stats" key.
+    """
+
+    output: TextIO | None = None
+
+    def render(self) -> None:
+        """Write the JSON document."""
+        output = self.output or sys.stdout
+        for chunk in self.iter_chunks(self.root_node):  # type: ignore
+            output.write(chunk)
+        output.write("\n")
+
+    def iter_chunks(self, root: PreviewNode) -> Iterator[str]:
+        """Iterate over the pieces of the JSON document.
+
+        Args:
+            root: Root node of the tree
+
+        Yields:
+            Consecutive pieces of the document
+
+        """
+        yield '{"root": '
+        yield from self._open(root)
+        # Each stack entry holds the children left to write for one open directory.
+        stack: list[tuple[Iterator[PreviewNode], bool]] = []
+        if root.type == ComponentType.DIRECTORY:
+            stack.append((iter(root.children.values()), True))
+        while stack:
+            children, first = stack[-1]
+            node = next(children, None)
+            if node is None:
+                stack.pop()
+                yield "]}"
+                continue
+            if not first:
+                yield ", "
+            else:
+                stack[-1] = (children, False)
+
+            yield from self._open(node)
+            if node.type == ComponentType.DIRECTORY:
+                stack.append((iter(node.children.values()), True))
+        yield f', "stats": {json.dumps(self.stats.to_dict())}}}'
+
+    @staticmethod
+    def _open(node: PreviewNode) -> Iterator[str]:
+        """Write a node, leaving the children list of a directory open.
+
+        Args:
+            node: Preview node
+
+        Yields:
+            Serialized node
+
+        """
+        serialized = json.dumps(node_fields(node))
+        if node.type == ComponentType.DIRECTORY:
+            yield f'{serialized[:-1]}, "children": ['
+        else:
+            yield serialized
+
+
+class NdjsonPreviewRender(BaseAbstractPreviewRender):
+    """Renderer writing one JSON object per line to stdout.
+
+    Node lines have the "node" kind and a slash-separated path, statistics
+    lines follow with the "stats" kind and the "total", "layer" or
+    "context" scope.
+    """
+
+    output: TextIO | None = None
+
+    def render(self) -> None:
+        """Write node and statistics lines."""
+        output = self.output or sys.stdout
+        for line in self.iter_lines(self.root_node):  # type: ignore
+            output.write(line)
+
+    def iter_lines(self, root: PreviewNode) -> Iterator[str]:
+        """Iterate over the lines, nodes depth first, then statistics.
+
+        Args:
+            root: Root node of the tree
+
+        Yields:
+            JSON lines, each ending with a newline
+
+        """
+        yield self._node_line(root, root.name)
+        stack: list[tuple[Iterator[PreviewNode], str]] = [(iter(root.children.values()), root.name)]
+        while stack:
+            children, parent_path = stack[-1]
+            node = next(children, None)
+            if node is None:
+                stack.pop()
+                continue
+            path = f"{parent_path}/{node.name}"
+            yield self._node_line(node, path)
+            if node.children:
+                stack.append((iter(node.children.values()), path))
+
+        measured = self.stats.measured
+        yield self._stats_line("total", None, self.stats.total.to_dict(measured))
+        for name, counts in self.stats.layers.items():
+            yield self._stats_line("layer", name, counts.to_dict(measured))
+        for name, counts in self.stats.contexts.items():
+            yield self._stats_line("context", name, counts.to_dict(measured))
+
+    @staticmethod
+    def _node_line(node: PreviewNode, path: str) -> str:
+        fields = node_fields(node)
+        fields["path"] = path
+        return json.dumps({"kind": "node", **fields}) + "\n"
+
+    @staticmethod
+    def _stats_line(scope: str, name: str | None, counts: dict[str, Any]) -> str:
+        line: dict[str, Any] = {"kind": "stats", "scope": scope}
+        if name is not None:
+            line["name"] = name
+        return json.dumps({**line, **counts}) + "\n"
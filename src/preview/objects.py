@@ -1,5 +1,9 @@
+import sys
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import Enum
+from types import MappingProxyType
+from typing import Any
 
 
 class ComponentType(str, Enum):
@@ -14,24 +18,211 @@ class ComponentType(str, Enum):
     INIT = "init"
 
 
-@dataclass
 class PreviewNode:
     """Node in the preview structure tree.
 
     This class represents a single node in the preview structure tree,
-    which can be a directory, file, layer, or init file.
+    which can be a directory, file, layer, or init file. Nodes are slotted
+    and store only their interned name and the index of their parent, so
+    the full path is rebuilt by the collector when needed. Children and
+    metadata are allocated on first use.
 
     Attributes:
         name: Name of the component
         type: Type of the component
-        path: Full path to the component
-        children: List of child nodes
-        metadata: Additional metadata for the node
+        index: Index of the node in its collector
+        parent: Index of the parent node, -1 for top-level nodes
+
+    """
+
+    __slots__ = ("name", "type", "index", "parent", "_children", "_metadata")
+
+    def __init__(
+        self,
+        name: str,
+        type: ComponentType,  # noqa: A002
+        index: int = 0,
+        parent: int = -1,
+    ) -> None:
+        """Initialize the node.
+
+        Args:
+            name: Name of the component
+            type: Type of the component
+            index: Index of the node in its collector
+            parent: Index of the parent node
+
+        """
+        self.name = sys.intern(name)
+        self.type = type
+        self.index = index
+        self.parent = parent
+        self._children: dict[str, PreviewNode] | None = None
+        self._metadata: dict[str, Any] | None = None
+
+    def __repr__(self) -> str:
+        """Return a short representation of the node."""
+        return f"PreviewNode(name={self.name!r}, type={self.type.value!r})"
+
+    @property
+    def children(self) -> Mapping[str, "PreviewNode"]:
+        """Child nodes keyed by name, in insertion order."""
+        return self._children if self._children is not None else _NO_CHILDREN
+
+    def get_child(self, name: str) -> "PreviewNode | None":
+        """Get a child node by name.
+
+        Args:
+            name: Child name
+
+        Returns:
+            Child node or None
+
+        """
+        return self._children.get(name) if self._children is not None else None
+
+    def add_child(self, child: "PreviewNode") -> None:
+        """Add a child node.
+
+        Args:
+            child: Node to add
+
+        """
+        if self._children is None:
+            self._children = {}
+        self._children[child.name] = child
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        """Additional metadata for the node, allocated on first access."""
+        if self._metadata is None:
+            self._metadata = {}
+        return self._metadata
+
+    @property
+    def has_metadata(self) -> bool:
+        """Whether any metadata was attached to the node."""
+        return bool(self._metadata)
+
+
+_NO_CHILDREN: Mapping[str, PreviewNode] = MappingProxyType({})
+
+
+@dataclass
+class ScopeCounts:
+    """Numbers of collected items in one part of the project.
+
+    Attributes:
+        directories: Number of directories
+        modules: Number of Python modules, including __init__.py files
+        components: Number of declared components
+        bytes: Size of measured rendered modules
+        render_time: Render time of measured modules in seconds
 
     """
 
-    name: str
-    type: ComponentType
-    path: str
-    children: list["PreviewNode"] = field(default_factory=list)
-    metadata: dict = field(default_factory=dict)
+    directories: int = 0
+    modules: int = 0
+    components: int = 0
+    bytes: int = 0
+    render_time: float = 0.0
+
+    def to_dict(self, measured: bool = False) -> dict[str, Any]:
+        """Convert counts to a dictionary.
+
+        Args:
+            measured: Whether to include render size and time
+
+        """
+        counts: dict[str, Any] = {
+            "directories": self.directories,
+            "modules": self.modules,
+            "components": self.components,
+        }
+        if measured:
+            counts["bytes"] = self.bytes
+            counts["render_time"] = self.render_time
+        return counts
+
+
+@dataclass
+class PreviewStatistics:
+    """Aggregate counts of the previewed structure per layer and per context.
+
+    Presets set the current scope before generating a layer or a context,
+    every collected node and component is counted in the total and in the
+    buckets of the current scope.
+
+    Attributes:
+        total: Counts for the whole project
+        layers: Counts keyed by layer name
+        contexts: Counts keyed by context name
+        measured: Whether templates were rendered to measure their size
+
+    """
+
+    total: ScopeCounts = field(default_factory=ScopeCounts)
+    layers: dict[str, ScopeCounts] = field(default_factory=dict)
+    contexts: dict[str, ScopeCounts] = field(default_factory=dict)
+    measured: bool = False
+    _scope: tuple[ScopeCounts, ...] = field(default=(), init=False, repr=False)
+
+    def set_scope(self, layer_name: str | None, context_name: str | None = None) -> None:
+        """Set the layer and context receiving the following counts.
+
+        Args:
+            layer_name: Current layer, None outside layers
+            context_name: Current context, None outside contexts
+
+        """
+        scope = []
+        if layer_name is not None:
+            scope.append(self.layers.setdefault(layer_name, ScopeCounts()))
+        if context_name is not None:
+            scope.append(self.contexts.setdefault(context_name, ScopeCounts()))
+        self._scope = tuple(scope)
+
+    def count_node(self, node: PreviewNode) -> None:
+        """Count a newly collected node.
+
+        Args:
+            node: Collected node
+
+        """
+        if node.type == ComponentType.DIRECTORY:
+            for counts in (self.total, *self._scope):
+                counts.directories += 1
+        elif node.name.endswith(".py"):
+            for counts in (self.total, *self._scope):
+                counts.modules += 1
+
+    def count_components(self, number: int) -> None:
+        """Count declared components.
+
+        Args:
+            number: Number of components
+
+        """
+        for counts in (self.total, *self._scope):
+            counts.components += number
+
+    def count_render_cost(self, size: int, render_time: float) -> None:
+        """Count the size and render time of a measured module.
+
+        Args:
+            size: Rendered size in bytes
+            render_time: Render time in seconds
+
+        """
+        for counts in (self.total, *self._scope):
+            counts.bytes += size
+            counts.render_time += render_time
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert statistics to a dictionary."""
+        measured = self.measured
+        return {
+            "total": self.total.to_dict(measured),
+            "layers": {name: counts.to_dict(measured) for name, counts in self.layers.items()},
+            "contexts": {name: counts.to_dict(measured) for name, counts in self.contexts.items()},
+        }
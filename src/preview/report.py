@@ -0,0 +1,56 @@
+import heapq
+import os
+
+from rich.console import Console
+from rich.table import Table
+
+from src.preview.collector import PreviewCollector
+
+
+def print_measure_report(collector: PreviewCollector, top: int = 10) -> None:
+    """Print the heaviest contexts and modules of a measured preview.
+
+    Args:
+        collector: Collector filled by a preview with measuring enabled
+        top: Number of contexts and modules to show
+
+    """
+    console = Console()
+    contexts = heapq.nlargest(top, collector.stats.contexts.items(), key=lambda item: item[1].bytes)
+    if contexts:
+        table = Table(title=f"Top {len(contexts)} heaviest contexts")
+        table.add_column("Context")
+        table.add_column("Modules", justify="right")
+        table.add_column("Size, KB", justify="right")
+        table.add_column("Render, ms", justify="right")
+        for name, counts in contexts:
+            table.add_row(
+                name,
+                str(counts.modules),
+                f"{counts.bytes / 1024:.1f}",
+                f"{counts.render_time * 1000:.1f}",
+            )
+        console.print(table)
+
+    # Modules are shown relative to the directory containing the project root.
+    root = collector.root_node
+    base_dir = os.path.dirname(collector.get_path(root)) if root else os.curdir
+    measured_nodes = (node for node in collector.all_nodes if node.has_metadata)
+    modules = heapq.nlargest(top, measured_nodes, key=lambda node: node.metadata["bytes"])
+    table = Table(title=f"Top {len(modules)} heaviest modules")
+    table.add_column("Module")
+    table.add_column("Size, KB", justify="right")
+    table.add_column("Render, ms", justify="right")
+    for node in modules:
+        table.add_row(
+            os.path.relpath(collector.get_path(node), base_dir),
+            f"{node.metadata['bytes'] / 1024:.1f}",
+            f"{node.metadata['render_time'] * 1000:.1f}",
+        )
+    console.print(table)
+
+    total = collector.stats.total
+    console.print(
+        f"{total.modules} modules, {total.bytes / 1024:.1f} KB rendered "
+        f"in {total.render_time * 1000:.1f} ms"
+    )
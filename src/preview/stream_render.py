@@ -0,0 +1,70 @@
+import sys
+from collections.abc import Iterator
+from typing import TextIO
+
+from src.preview.base_render import BaseAbstractPreviewRender
+from src.preview.objects import PreviewNode
+
+BRANCH = "├── "
+LAST_BRANCH = "└── "
+PIPE = "│   "
+SPACE = "    "
+# Placeholder rendered into the structure.md template to split it around the tree.
+CONTENT_MARKER = "\x00content\x00"
+
+
+class StreamTreePreviewRender(BaseAbstractPreviewRender):
+    """Tree renderer writing lines as soon as they are produced.
+
+    Walks the tree iteratively with an explicit stack, so neither the depth
+    nor the size of the tree is limited by the recursion limit or by memory.
+    Produces the same text as TreePreviewRender for trees that fit into
+    the terminal width.
+    """
+
+    echo = True
+
+    def render(self) -> None:
+        """Write the tree to structure.md and, if echo is enabled, to stdout."""
+        template = self.template_engine.render("structure.md.jinja", {"content": CONTENT_MARKER})
+        header, _, footer = template.partition(CONTENT_MARKER)
+        stdout: TextIO | None = sys.stdout if self.echo else None
+
+        with open("structure.md", "w") as f:
+            f.write(header)
+            for line in self.iter_lines(self.root_node):  # type: ignore
+                f.write(line)
+                if stdout is not None:
+                    stdout.write(line)
+            f.write(footer)
+
+    @staticmethod
+    def iter_lines(root: PreviewNode) -> Iterator[str]:
+        """Iterate over the lines of the tree, depth first.
+
+        Args:
+            root: Root node of the tree
+
+        Yields:
+            Lines with box-drawing guides, each ending with a newline
+
+        """
+        yield f"{root.name}\n"
+        # Each stack entry holds the children left to visit at one level and their guide prefix.
+        stack: list[tuple[Iterator[PreviewNode], int, str]] = [
+            (iter(root.children.values()), len(root.children), "")
+        ]
+        while stack:
+            children, remaining, prefix = stack[-1]
+            if not remaining:
+                stack.pop()
+                continue
+            node = next(children)
+            remaining -= 1
+            stack[-1] = (children, remaining, prefix)
+
+            is_last = remaining == 0
+            yield f"{prefix}{LAST_BRANCH if is_last else BRANCH}{node.name}\n"
+            if node.children:
+                child_prefix = prefix + (SPACE if is_last else PIPE)
+                stack.append((iter(node.children.values()), len(node.children), child_prefix))
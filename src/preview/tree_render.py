@@ -19,7 +19,7 @@ class TreePreviewRender(BaseAbstractPreviewRender):
     def _build_tree(self, node: PreviewNode) -> Tree:
         tree = Tree(node.name)
 
-        for child in node.children:
+        for child in node.children.values():
             child_tree = self._build_tree(child)
             tree.add(child_tree)
 
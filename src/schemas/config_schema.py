@@ -1,7 +1,12 @@
+from collections.abc import Iterator, Mapping, Sequence
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from src.core.layout import Layout
+
+DEFAULT_CONTEXT_NAME = "default"
 
 
 class PresetType(str, Enum):
@@ -32,7 +37,8 @@ class Settings(BaseModel):
     including preset type, context organization, and layer names.
     """
 
-    preset: PresetType = PresetType.STANDARD
+    # Names of plugin presets are kept as strings.
+    preset: PresetType | str = Field(default=PresetType.STANDARD, union_mode="left_to_right")
 
     use_contexts: bool = True
     contexts_layout: ContextsLayout = ContextsLayout.FLAT
@@ -40,6 +46,154 @@ class Settings(BaseModel):
     init_imports: bool = False
 
     root_name: str = "src"
+    layout: Layout | None = None
+
+    @property
+    def preset_name(self) -> str:
+        """Name of the preset, built in or provided by a plugin."""
+        return self.preset.value if isinstance(self.preset, PresetType) else self.preset
+
+    @field_validator("layout", mode="before")
+    @classmethod
+    def parse_layout(cls, value: object) -> object:
+        """Accept a path pattern alone as a layout.
+
+        Args:
+            value: Layout mapping with path and imports patterns, or a path pattern
+
+        Returns:
+            Layout mapping
+
+        """
+        if isinstance(value, str):
+            return {"path": value}
+        return value
+
+
+def component_names(value: object) -> Sequence[str]:
+    """Normalize the components of a component type.
+
+    Args:
+        value: Configured components: a list of names, a comma-separated string or nothing
+
+    Returns:
+        Component names, the configured list itself when it is one
+
+    """
+    if not value:
+        return ()
+    if isinstance(value, str):
+        return tuple(name.strip() for name in value.split(",") if name.strip())
+    return value if isinstance(value, Sequence) else ()
+
+
+def _as_mapping(value: object) -> Mapping[str, Any]:
+    return value if isinstance(value, Mapping) else {}
+
+
+class LayerView:
+    """Read-only view of a layer in the configuration.
+
+    Wraps the configured data without copying it. Layer-level components and
+    contexts of the standard preset are iterated separately.
+
+    Attributes:
+        name: Layer name
+
+    """
+
+    __slots__ = ("name", "_data")
+
+    def __init__(self, name: str, data: Mapping[str, Any]) -> None:
+        """Initialize the view.
+
+        Args:
+            name: Layer name
+            data: Configured layer data
+
+        """
+        self.name = name
+        self._data = data
+
+    def __bool__(self) -> bool:
+        """Whether anything is configured in the layer."""
+        return bool(self._data)
+
+    def components(self) -> Iterator[tuple[str, Sequence[str]]]:
+        """Iterate over component types configured outside of contexts.
+
+        Yields:
+            Component type and its component names, empty types included
+
+        """
+        for component_type, value in self._data.items():
+            if component_type != "contexts":
+                yield component_type, component_names(value)
+
+    def has_components(self) -> bool:
+        """Check whether any component type outside of contexts has components.
+
+        Returns:
+            True if the layer has components outside of contexts
+
+        """
+        return any(value for key, value in self._data.items() if key != "contexts")
+
+    def contexts(self) -> Iterator["ContextView"]:
+        """Iterate over the bounded contexts of the layer.
+
+        Yields:
+            Contexts in configuration order
+
+        """
+        for context_data in self._data.get("contexts") or ():
+            yield ContextView(_as_mapping(context_data))
+
+
+class ContextView:
+    """Read-only view of a bounded context in the configuration.
+
+    A context of the standard preset holds component types, a context of
+    the advanced preset holds layers.
+
+    Attributes:
+        name: Context name, "default" if not configured
+
+    """
+
+    __slots__ = ("name", "_data")
+
+    def __init__(self, data: Mapping[str, Any]) -> None:
+        """Initialize the view.
+
+        Args:
+            data: Configured context data
+
+        """
+        self.name = str(data.get("name") or DEFAULT_CONTEXT_NAME)
+        self._data = data
+
+    def components(self) -> Iterator[tuple[str, Sequence[str]]]:
+        """Iterate over the component types of the context.
+
+        Yields:
+            Component type and its component names, empty types included
+
+        """
+        for component_type, value in self._data.items():
+            if component_type != "name":
+                yield component_type, component_names(value)
+
+    def layers(self) -> Iterator[LayerView]:
+        """Iterate over the layers nested in the context.
+
+        Yields:
+            Layers in configuration order
+
+        """
+        for layer_name, value in self._data.items():
+            if layer_name != "name":
+                yield LayerView(layer_name, _as_mapping(value))
 
 
 class LayerConfig(BaseModel):
@@ -81,6 +235,28 @@ class LayerConfig(BaseModel):
         """
         return self.model_dump()
 
+    def iter_layers(self) -> Iterator[LayerView]:
+        """Iterate over the configured layers without copying them.
+
+        Returns:
+            Read-only views of the layers in configuration order
+
+        """
+        return (
+            LayerView(layer_name, _as_mapping(value))
+            for layer_name, value in (self.model_extra or {}).items()
+        )
+
+    def iter_contexts(self) -> Iterator[ContextView]:
+        """Iterate over the top-level contexts of the nested layout without copying them.
+
+        Returns:
+            Read-only views of the contexts in configuration order
+
+        """
+        contexts = (self.model_extra or {}).get("contexts") or ()
+        return (ContextView(_as_mapping(context_data)) for context_data in contexts)
+
 
 class ConfigModel(BaseModel):
     """The main configuration model.
@@ -24,6 +24,28 @@ IMPORT_DATA = (
 DEFAULT_SIMPLE_CONFIG_FILENAME = "ddd-config.yaml"
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--run-perf",
+        action="store_true",
+        help="Run performance regression checks against the committed baseline",
+    )
+    parser.addoption(
+        "--update-perf-baseline",
+        action="store_true",
+        help="Record the measurements of performance checks as the new baseline",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    if config.getoption("--run-perf") or config.getoption("--update-perf-baseline"):
+        return
+    skip_perf = pytest.mark.skip(reason="performance checks need --run-perf")
+    for item in items:
+        if "perf" in item.keywords:
+            item.add_marker(skip_perf)
+
+
 @pytest.fixture
 def yaml_parser() -> YamlParser:
     return YamlParser()
@@ -0,0 +1,146 @@
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from src.core.batch import BatchGenerator, expand_config_paths
+from src.core.dependencies import Container
+from src.main import cli
+
+CONFIG = """settings:
+  preset: "standard"
+  root_name: "{root_name}"
+
+layers:
+  domain:
+    contexts:
+      - name: user
+        entities: User
+"""
+
+
+def write_configs(config_dir: Path, names: list[str]) -> list[Path]:
+    config_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for name in names:
+        path = config_dir / f"{name}.yaml"
+        path.write_text(CONFIG.format(root_name=name))
+        paths.append(path)
+    return paths
+
+
+class TestBatchGenerator:
+
+    def test_generate_next_to_configs(self, tmp_path: Path) -> None:
+        paths = [
+            *write_configs(tmp_path / "billing", ["billing"]),
+            *write_configs(tmp_path / "orders", ["orders"]),
+        ]
+
+        results = BatchGenerator(Container(), workers=2).generate(paths)
+
+        assert [result.success for result in results] == [True, True]
+        assert (tmp_path / "billing" / "billing" / "domain" / "user").is_dir()
+        assert (tmp_path / "orders" / "orders" / "domain" / "user").is_dir()
+
+    def test_generate_into_output_dir(self, tmp_path: Path) -> None:
+        paths = write_configs(tmp_path / "configs", ["first", "second", "third"])
+        output_dir = tmp_path / "out"
+
+        results = BatchGenerator(Container(), workers=3, output_dir=output_dir).generate(paths)
+
+        assert [result.config_path for result in results] == paths
+        for name in ("first", "second", "third"):
+            assert (output_dir / name / name / "domain" / "user" / "entities").is_dir()
+
+    def test_same_named_configs_get_separate_roots(self, tmp_path: Path) -> None:
+        paths = []
+        for service, entity in (("a", "Alpha"), ("b", "Beta")):
+            config_dir = tmp_path / "services" / service
+            config_dir.mkdir(parents=True)
+            paths.append(config_dir / "ddd-config.yaml")
+            paths[-1].write_text(CONFIG.format(root_name="src").replace("User", entity))
+        output_dir = tmp_path / "out"
+
+        results = BatchGenerator(Container(), workers=2, output_dir=output_dir).generate(paths)
+
+        assert [result.project_root for result in results] == [output_dir / "a", output_dir / "b"]
+        assert [result.success for result in results] == [True, True]
+        for service, entity in (("a", "Alpha"), ("b", "Beta")):
+            entities = output_dir / service / "src" / "domain" / "user" / "entities"
+            assert f"class {entity}" in (entities / "entities.py").read_text()
+
+    def test_shared_output_root_fails(self, tmp_path: Path) -> None:
+        [path] = write_configs(tmp_path, ["billing"])
+        output_dir = tmp_path / "out"
+
+        results = BatchGenerator(Container(), workers=2, output_dir=output_dir).generate(
+            [path, path]
+        )
+
+        assert [result.success for result in results] == [False, False]
+        assert "is shared with another config" in (results[0].error or "")
+        assert not output_dir.exists()
+
+    def test_shared_root_package_next_to_configs_fails(self, tmp_path: Path) -> None:
+        paths = []
+        for name, entity in (("a", "Alpha"), ("b", "Beta")):
+            paths.append(tmp_path / "configs" / f"{name}.yaml")
+            paths[-1].parent.mkdir(exist_ok=True)
+            paths[-1].write_text(CONFIG.format(root_name="src").replace("User", entity))
+        paths.extend(write_configs(tmp_path / "configs", ["billing"]))
+
+        results = BatchGenerator(Container(), workers=3).generate(paths)
+
+        assert [result.success for result in results] == [False, False, True]
+        assert "is shared with another config" in (results[0].error or "")
+        assert not (tmp_path / "configs" / "src").exists()
+        assert (tmp_path / "configs" / "billing" / "domain").is_dir()
+
+    def test_failed_config_does_not_stop_batch(self, tmp_path: Path) -> None:
+        paths = write_configs(tmp_path, ["valid"])
+        paths.append(tmp_path / "missing.yaml")
+
+        results = BatchGenerator(Container(), workers=2).generate(paths)
+
+        assert results[0].success is True
+        assert results[1].success is False
+        assert "not found" in (results[1].error or "")
+
+    def test_expand_config_paths(self, tmp_path: Path) -> None:
+        paths = write_configs(tmp_path, ["b", "a"])
+
+        expanded = expand_config_paths([str(tmp_path / "*.yaml"), str(paths[0])])
+
+        assert expanded == [tmp_path / "a.yaml", tmp_path / "b.yaml"]
+
+    def test_batch_command(self, tmp_path: Path) -> None:
+        write_configs(tmp_path / "configs", ["first", "second"])
+        runner = CliRunner()
+
+        result = runner.invoke(
+            cli,
+            [
+                "run",
+                "--batch",
+                str(tmp_path / "configs" / "*.yaml"),
+                "--output-dir",
+                str(tmp_path / "out"),
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "2 succeeded, 0 failed" in result.output
+        assert (tmp_path / "out" / "second" / "second" / "domain").is_dir()
+
+    def test_batch_command_rejects_shard_and_manifest(self, tmp_path: Path) -> None:
+        write_configs(tmp_path / "configs", ["first"])
+        runner = CliRunner()
+
+        for option in (["--shard", "0/2"], ["--manifest", str(tmp_path / "manifest.json")]):
+            result = runner.invoke(
+                cli, ["run", "--batch", str(tmp_path / "configs" / "*.yaml"), *option]
+            )
+
+            assert result.exit_code == 2, result.output
+            assert "can't be combined with --batch" in result.output
+        assert not (tmp_path / "configs" / "first").exists()
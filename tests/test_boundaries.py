@@ -0,0 +1,179 @@
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from src.core.batch import BatchGenerator
+from src.core.boundaries import (
+    CONTEXT_BOUNDARY,
+    LAYER_BOUNDARY,
+    PARSE_ERROR,
+    BoundaryLinter,
+)
+from src.core.dependencies import Container
+from src.core.exceptions import LayoutNotFoundError
+from src.core.parser import YamlParser
+from src.main import cli
+
+STANDARD_CONFIG = """settings:
+  preset: "standard"
+  root_name: "app"
+  init_imports: true
+
+layers:
+  domain:
+    contexts:
+      - name: users
+        entities: User
+      - name: billing
+        entities: Invoice
+  application:
+    contexts:
+      - name: users
+        services: UserService
+  infrastructure:
+    repositories: UserRepository
+  common:
+    utils: Clock
+"""
+
+ADVANCED_CONFIG = """settings:
+  preset: "advanced"
+  root_name: "app"
+  group_components: false
+
+layers:
+  contexts:
+    - name: users
+      domain:
+        entities: User
+      infrastructure:
+        repositories: UserRepository
+    - name: billing
+      domain:
+        entities: Invoice
+"""
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
+def generate(project_dir: Path, config: str) -> Path:
+    project_dir.mkdir(parents=True, exist_ok=True)
+    config_path = project_dir / "ddd-config.yaml"
+    config_path.write_text(config)
+    [result] = BatchGenerator(Container(), workers=1).generate([config_path])
+    assert result.success, result.error
+    return config_path
+
+
+def add_imports(module: Path, *imports: str) -> None:
+    module.write_text(module.read_text().rstrip("\n") + "\n" + "\n".join(imports) + "\n")
+
+
+def lint(config_path: Path) -> BoundaryLinter:
+    config = YamlParser().load(config_path)
+    return BoundaryLinter(config, config_path.parent / "app")
+
+
+class TestBoundaryLinter:
+
+    @pytest.mark.parametrize("config", [STANDARD_CONFIG, ADVANCED_CONFIG])
+    def test_generated_project_is_clean(self, tmp_path: Path, config: str) -> None:
+        config_path = generate(tmp_path, config)
+
+        assert lint(config_path).lint() == []
+
+    def test_layer_boundaries(self, tmp_path: Path) -> None:
+        config_path = generate(tmp_path, STANDARD_CONFIG)
+        root = tmp_path / "app"
+        add_imports(
+            root / "domain" / "users" / "entities" / "entities.py",
+            "from app.infrastructure.repositories.repositories import UserRepository",
+            "from app.common.utils import Clock",
+        )
+        add_imports(
+            root / "application" / "users" / "services" / "services.py",
+            "from app.domain.users.entities import User",
+        )
+        add_imports(root / "common" / "utils" / "utils.py", "from ...domain.users import entities")
+
+        violations = lint(config_path).lint()
+
+        assert [(v.code, v.path) for v in violations] == [
+            (LAYER_BOUNDARY, "common/utils/utils.py"),
+            (LAYER_BOUNDARY, "domain/users/entities/entities.py"),
+        ]
+        assert violations[1].message == (
+            "Layer domain must not import infrastructure "
+            "(app.infrastructure.repositories.repositories.UserRepository)"
+        )
+        assert violations[1].line is not None
+
+    def test_context_boundaries(self, tmp_path: Path) -> None:
+        config_path = generate(tmp_path, ADVANCED_CONFIG)
+        root = tmp_path / "app"
+        add_imports(
+            root / "users" / "infrastructure" / "repositories" / "user_repository.py",
+            "from app.users.domain.entities.user_entity import User",
+            "from app.billing.domain.entities import Invoice",
+        )
+
+        violations = lint(config_path).lint()
+
+        assert [(v.code, v.message) for v in violations] == [
+            (
+                CONTEXT_BOUNDARY,
+                "Context users must not import billing (app.billing.domain.entities.Invoice)",
+            )
+        ]
+
+    def test_parse_errors(self, tmp_path: Path) -> None:
+        config_path = generate(tmp_path, STANDARD_CONFIG)
+        add_imports(tmp_path / "app" / "domain" / "users" / "entities" / "entities.py", "import (")
+
+        violations = lint(config_path).lint()
+
+        assert [v.code for v in violations] == [PARSE_ERROR]
+
+    def test_relint_parses_changed_modules_only(self, tmp_path: Path) -> None:
+        config_path = generate(tmp_path, STANDARD_CONFIG)
+        lint(config_path).lint()
+        add_imports(
+            tmp_path / "app" / "domain" / "billing" / "entities" / "entities.py",
+            "from app.domain.users.entities import User",
+        )
+
+        linter = lint(config_path)
+        violations = linter.lint()
+
+        assert linter.index.parsed == 1
+        assert [v.code for v in violations] == [CONTEXT_BOUNDARY]
+
+    def test_preset_without_layout(self, tmp_path: Path) -> None:
+        config = YamlParser().load(generate(tmp_path, STANDARD_CONFIG))
+        config.settings.preset = "custom"
+
+        with pytest.raises(LayoutNotFoundError):
+            BoundaryLinter(config, tmp_path / "app").lint()
+
+
+class TestLintCommand:
+
+    def test_lint(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        generate(tmp_path, STANDARD_CONFIG)
+        monkeypatch.chdir(tmp_path)
+
+        clean = CliRunner().invoke(cli, ["lint"])
+        add_imports(
+            tmp_path / "app" / "domain" / "users" / "entities" / "entities.py",
+            "import app.application.users.services",
+        )
+        dirty = CliRunner().invoke(cli, ["lint"])
+
+        assert clean.exit_code == 0, clean.output
+        assert "No boundary violations" in clean.output
+        assert dirty.exit_code == 1
+        assert "Layer domain must not import application" in dirty.output
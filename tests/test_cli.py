@@ -58,6 +58,39 @@ class TestCli:
             assert "Configuration validated successfully" in result.output
             assert result.exit_code == 0
 
+    def test_validate_strict(self) -> None:
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            runner.invoke(cli, ["init", "--preset", "standard"])
+            result = runner.invoke(cli, ["validate", "--strict"])
+            assert "Configuration validated successfully" in result.output
+            assert result.exit_code == 0
+
+            Path("ddd-config.yaml").write_text("layers:\n  domain:\n    entities: User, User\n")
+            result = runner.invoke(cli, ["validate", "--strict"])
+            assert "ddd-config.yaml:3:21: Component User is listed more than once" in result.output
+            assert "1 issue(s) found" in result.output
+            assert result.exit_code == 1
+
+    def test_validate_misspelled_preset(self) -> None:
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            Path("ddd-config.yaml").write_text(
+                "settings:\n  preset: standrd\nlayers:\n  domain:\n    entities: User\n"
+            )
+            for args in (["validate"], ["validate", "--strict"]):
+                result = runner.invoke(cli, args)
+                assert "ddd-config.yaml:2:3: settings.preset: Unknown preset: standrd" in (
+                    result.output
+                )
+                assert "Configuration validated successfully" not in result.output
+                assert result.exit_code == 1
+
+            result = runner.invoke(cli, ["run"])
+            assert "Unknown preset: standrd" in result.output
+            assert result.exit_code == 1
+            assert not Path("src").exists()
+
     def test_validate_command_with_missing_file(self) -> None:
         runner = CliRunner()
         with runner.isolated_filesystem():
@@ -134,7 +167,7 @@ class TestCli:
             Path("invalid.yaml").write_text("invalid: yaml: content: [")
 
             result = runner.invoke(cli, ["validate", "--file", "invalid.yaml"])
-            assert result.exit_code == 0
+            assert result.exit_code == 1
             assert "Configuration file could not be parsed" in result.output
 
             result = runner.invoke(cli, ["run", "--file", "invalid.yaml"])
@@ -0,0 +1,108 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from src.core.code_index import CodeIndex, module_name, parse_module
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_dir))
+    return cache_dir
+
+
+def write_package(root: Path) -> None:
+    (root / "domain" / "users").mkdir(parents=True)
+    (root / "__init__.py").write_text("")
+    (root / "domain" / "__init__.py").write_text("")
+    (root / "domain" / "users" / "__init__.py").write_text("from .entities import User\n")
+    (root / "domain" / "users" / "entities.py").write_text(
+        "from ..events import Created\nimport json\n\n\nclass User:\n    pass\n\n\nclass Admin(User):\n"
+        "    pass\n"
+    )
+    (root / "domain" / "events.py").write_text("class Created:\n    pass\n")
+
+
+class TestCodeIndex:
+
+    def test_module_name(self) -> None:
+        assert module_name("src", "domain/users/entities.py") == "src.domain.users.entities"
+        assert module_name("src", "domain/__init__.py") == "src.domain"
+
+    def test_parse_module_resolves_relative_imports(self, tmp_path: Path) -> None:
+        write_package(tmp_path / "src")
+        file_path = tmp_path / "src" / "domain" / "users" / "entities.py"
+
+        classes, imports, error = parse_module(str(file_path), "src.domain.users.entities")
+
+        assert error is None
+        assert classes == ["User", "Admin"]
+        assert imports == [("src.domain.events.Created", 1), ("json", 2)]
+
+    def test_parse_module_reports_syntax_errors(self, tmp_path: Path) -> None:
+        file_path = tmp_path / "broken.py"
+        file_path.write_text("class Broken(:\n")
+
+        classes, imports, error = parse_module(str(file_path), "broken")
+
+        assert (classes, imports) == ([], [])
+        assert error is not None and error.startswith("SyntaxError")
+
+    def test_build(self, tmp_path: Path) -> None:
+        write_package(tmp_path / "src")
+
+        modules = CodeIndex(tmp_path / "src").build()
+
+        assert list(modules) == [
+            "__init__.py",
+            "domain/__init__.py",
+            "domain/events.py",
+            "domain/users/__init__.py",
+            "domain/users/entities.py",
+        ]
+        package = modules["domain/users/__init__.py"]
+        assert package.is_package
+        assert package.module == "src.domain.users"
+        assert package.imports == [("src.domain.users.entities.User", 1)]
+
+    def test_rebuild_parses_changed_modules_only(self, tmp_path: Path) -> None:
+        root = tmp_path / "src"
+        write_package(root)
+        CodeIndex(root).build()
+
+        index = CodeIndex(root)
+        index.build()
+        assert (index.parsed, index.cached) == (0, 5)
+
+        events = root / "domain" / "events.py"
+        events.write_text("class Created:\n    pass\n\n\nclass Deleted:\n    pass\n")
+        os.utime(events, ns=(0, events.stat().st_mtime_ns + 1_000_000))
+        (root / "domain" / "users" / "entities.py").unlink()
+        modules = index.build()
+
+        assert (index.parsed, index.cached) == (1, 3)
+        assert modules["domain/events.py"].classes == ["Created", "Deleted"]
+        assert "domain/users/entities.py" not in modules
+
+    def test_build_without_cache(self, tmp_path: Path, cache_home: Path) -> None:
+        write_package(tmp_path / "src")
+
+        index = CodeIndex(tmp_path / "src", use_cache=False)
+        index.build()
+        index.build()
+
+        assert index.parsed == 5
+        assert not cache_home.exists()
+
+    def test_build_in_worker_processes(self, tmp_path: Path) -> None:
+        root = tmp_path / "src"
+        root.mkdir()
+        for number in range(200):
+            (root / f"module_{number}.py").write_text(f"class Component{number}:\n    pass\n")
+
+        modules = CodeIndex(root, workers=2).build()
+
+        assert modules["module_7.py"].classes == ["Component7"]
+        assert len(modules) == 200
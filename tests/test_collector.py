@@ -0,0 +1,62 @@
+from pathlib import Path
+
+from src.preview.collector import PreviewCollector
+from src.preview.objects import ComponentType
+
+
+class TestPreviewCollector:
+
+    def test_children_keep_insertion_order(self) -> None:
+        collector = PreviewCollector()
+        root = Path("app")
+        collector.add_directory(root)
+        for name in ("b.py", "a.py", "c.py"):
+            collector.add_file(root / name)
+
+        assert list(collector.nodes["app"].children) == ["b.py", "a.py", "c.py"]
+
+    def test_duplicate_inserts_are_ignored(self) -> None:
+        collector = PreviewCollector()
+        root = Path("app")
+        collector.add_directory(root)
+        collector.add_directory(root / "domain")
+        collector.add_directory(root / "domain")
+        collector.add_init_file(root / "domain" / "__init__.py")
+        collector.add_init_file(root / "domain" / "__init__.py")
+
+        domain = collector.nodes[str(root / "domain")]
+        assert list(collector.nodes["app"].children) == ["domain"]
+        assert list(domain.children) == ["__init__.py"]
+        assert domain.children["__init__.py"].type == ComponentType.INIT
+
+    def test_parents_created_on_demand(self) -> None:
+        collector = PreviewCollector()
+        root = Path("app")
+        collector.add_directory(root)
+        collector.add_file(root / "domain" / "entities" / "user.py")
+        collector.add_directory(root / "domain" / "entities")
+
+        entities = collector.nodes[str(root / "domain" / "entities")]
+        assert collector.root_node is collector.nodes["app"]
+        assert list(collector.nodes["app"].children) == ["domain"]
+        assert entities.type == ComponentType.DIRECTORY
+        assert list(entities.children) == ["user.py"]
+
+    def test_file_before_root(self) -> None:
+        collector = PreviewCollector()
+        collector.add_file(Path("app") / "main.py")
+        collector.add_directory(Path("app"))
+
+        assert collector.root_node is not None
+        assert collector.root_node.name == "app"
+        assert list(collector.root_node.children) == ["main.py"]
+
+    def test_many_siblings(self) -> None:
+        collector = PreviewCollector()
+        root = Path("app")
+        collector.add_directory(root)
+        for index in range(10_000):
+            collector.add_file(root / f"module_{index}.py")
+            collector.add_file(root / f"module_{index}.py")
+
+        assert len(collector.nodes["app"].children) == 10_000
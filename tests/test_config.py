@@ -2,7 +2,13 @@ from pathlib import Path
 
 from src.core.parser import YamlParser
 from src.schemas import ConfigModel
-from src.schemas.config_schema import LayerConfig, PresetType, Settings, ContextsLayout
+from src.schemas.config_schema import (
+    LayerConfig,
+    PresetType,
+    Settings,
+    ContextsLayout,
+    component_names,
+)
 
 
 class TestConfigModel:
@@ -45,3 +51,47 @@ class TestConfigModel:
         )
         assert advanced_config.settings.use_contexts is True
         assert advanced_config.settings.contexts_layout == ContextsLayout.NESTED
+
+
+class TestLayerConfigIteration:
+
+    def test_iter_layers_and_contexts(self) -> None:
+        raw = {
+            "domain": {
+                "contexts": [{"name": "user", "entities": ["User"], "events": None}, {}],
+                "services": "Auth, Mail",
+            },
+            "common": None,
+        }
+        layers = list(LayerConfig.model_validate(raw).iter_layers())
+
+        assert [(layer.name, bool(layer)) for layer in layers] == [
+            ("domain", True),
+            ("common", False),
+        ]
+        domain = layers[0]
+        assert list(domain.components()) == [("services", ("Auth", "Mail"))]
+        assert domain.has_components()
+        contexts = list(domain.contexts())
+        assert [context.name for context in contexts] == ["user", "default"]
+        assert list(contexts[0].components()) == [("entities", ["User"]), ("events", ())]
+
+    def test_iteration_does_not_copy_or_mutate(self) -> None:
+        entities = ["User"]
+        context = {"name": "user", "domain": {"entities": entities}}
+        config = LayerConfig.model_validate({"contexts": [context]})
+
+        (context_view,) = config.iter_contexts()
+        ((layer_name, components),) = [
+            (layer.name, names) for layer in context_view.layers() for _, names in layer.components()
+        ]
+
+        assert layer_name == "domain"
+        assert components is entities
+        assert config.model_extra["contexts"][0] == {"name": "user", "domain": {"entities": entities}}
+
+    def test_component_names(self) -> None:
+        assert component_names(None) == ()
+        assert component_names("") == ()
+        assert component_names("User, ,Order") == ("User", "Order")
+        assert component_names(["User"]) == ["User"]
@@ -0,0 +1,155 @@
+import logging
+import os
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from src.core.parser import YamlParser
+from src.daemon import DaemonClient
+from src.daemon.client import get_socket_path
+from src.daemon.server import DaemonServer
+from src.main import cli, configure_logging
+
+SIMPLE_CONFIG = """settings:
+  preset: "simple"
+  root_name: "{root_name}"
+
+layers:
+  domain:
+    entities: User
+"""
+
+
+@pytest.fixture
+def daemon_socket(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    monkeypatch.delenv("PYC_NO_DAEMON", raising=False)
+    socket_path = tmp_path / "pyc.sock"
+    server = DaemonServer(socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield socket_path
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+class TestDaemon:
+
+    def test_client_without_daemon(self, tmp_path: Path) -> None:
+        client = DaemonClient(tmp_path / "missing.sock")
+        assert client.request("validate") is None
+        assert client.ping() is False
+
+    def test_ping(self, daemon_socket: Path) -> None:
+        assert DaemonClient(daemon_socket).ping() is True
+
+    def test_unsupported_command(self, daemon_socket: Path) -> None:
+        response = DaemonClient(daemon_socket).request("init")
+        assert response is not None
+        assert response.exit_code == 2
+
+    def test_validate_in_client_cwd(self, daemon_socket: Path, tmp_path: Path) -> None:
+        project_dir = tmp_path / "project"
+        project_dir.mkdir()
+        (project_dir / "ddd-config.yaml").write_text(SIMPLE_CONFIG.format(root_name="app"))
+
+        original_cwd = Path.cwd()
+        os.chdir(project_dir)
+        try:
+            response = DaemonClient(daemon_socket).request("validate")
+        finally:
+            os.chdir(original_cwd)
+
+        assert response is not None
+        assert response.exit_code == 0
+        assert "Configuration validated successfully" in response.stdout
+
+    def test_runs_do_not_share_config(self, daemon_socket: Path, tmp_path: Path) -> None:
+        client = DaemonClient(daemon_socket)
+        original_cwd = Path.cwd()
+        os.chdir(tmp_path)
+        try:
+            for root_name in ("first_app", "second_app"):
+                Path("ddd-config.yaml").write_text(SIMPLE_CONFIG.format(root_name=root_name))
+                response = client.request("run")
+                assert response is not None
+                assert "Project generation completed successfully" in response.stdout
+        finally:
+            os.chdir(original_cwd)
+
+        assert (tmp_path / "first_app" / "domain" / "entities").is_dir()
+        assert (tmp_path / "second_app" / "domain" / "entities").is_dir()
+
+    def test_cli_forwards_to_daemon(self, daemon_socket: Path) -> None:
+        runner = CliRunner(env={"PYC_DAEMON_SOCKET": str(daemon_socket)})
+        with runner.isolated_filesystem():
+            Path("ddd-config.yaml").write_text(SIMPLE_CONFIG.format(root_name="app"))
+            result = runner.invoke(cli, ["validate"])
+            assert result.exit_code == 0
+            assert "Configuration validated successfully" in result.output
+
+            result = runner.invoke(cli, ["daemon", "--status"])
+            assert "Daemon is running" in result.output
+
+    def test_socket_is_private(self, daemon_socket: Path) -> None:
+        assert daemon_socket.stat().st_mode & 0o777 == 0o600
+
+    def test_client_ignores_accessible_socket(self, daemon_socket: Path) -> None:
+        daemon_socket.chmod(0o666)
+        assert DaemonClient(daemon_socket).ping() is False
+
+    def test_client_ignores_socket_of_other_user(
+        self, daemon_socket: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        uid = os.getuid()
+        monkeypatch.setattr(os, "getuid", lambda: uid + 1)
+        assert DaemonClient(daemon_socket).ping() is False
+
+    def test_default_socket_in_private_directory(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.delenv("PYC_DAEMON_SOCKET", raising=False)
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        monkeypatch.setenv("TMPDIR", str(tmp_path))
+        monkeypatch.setattr("tempfile.tempdir", None)
+
+        socket_path = get_socket_path()
+        server = DaemonServer(socket_path)
+        server.server_close()
+
+        assert socket_path.parent == tmp_path / f"pyconstructor-{os.getuid()}"
+        assert socket_path.parent.stat().st_mode & 0o777 == 0o700
+
+    def test_server_refuses_directory_writable_by_others(self, tmp_path: Path) -> None:
+        shared_dir = tmp_path / "shared"
+        shared_dir.mkdir()
+        shared_dir.chmod(0o777)
+
+        with pytest.raises(RuntimeError, match="controlled by another user"):
+            DaemonServer(shared_dir / "pyc.sock")
+
+    def test_forwarded_logs_reach_client(
+        self, daemon_socket: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Configured like the daemon, before any command redirects stdout.
+        monkeypatch.setattr(logging.root, "handlers", [])
+        configure_logging()
+        load_document = YamlParser.load_document
+
+        def load_with_warning(parser: YamlParser, *args: object) -> object:
+            logging.getLogger("src.core.plugins").warning("Template plugin broken skipped")
+            return load_document(parser, *args)  # type: ignore[arg-type]
+
+        monkeypatch.setattr(YamlParser, "load_document", load_with_warning)
+        (tmp_path / "ddd-config.yaml").write_text(SIMPLE_CONFIG.format(root_name="app"))
+        monkeypatch.chdir(tmp_path)
+
+        response = DaemonClient(daemon_socket).request("validate")
+
+        assert response is not None
+        assert "Template plugin broken skipped" in response.stderr
@@ -0,0 +1,84 @@
+from pathlib import Path
+
+from src.core.dependencies import Container
+from src.core.template_engine import TemplateEngine
+from src.core.utils import GenerationRequest
+from src.generators import ProjectGenerator
+from src.preview.collector import PreviewCollector
+from src.schemas import ConfigModel
+
+CONFIG = """settings:
+  preset: "simple"
+  root_name: "{root_name}"
+
+layers:
+  domain:
+    entities: User
+"""
+
+
+class TestContainer:
+
+    def test_requests_do_not_share_config(self, tmp_path: Path) -> None:
+        container = Container()
+        roots = []
+        generators = []
+
+        for root_name in ("first_app", "second_app"):
+            config_path = tmp_path / f"{root_name}.yaml"
+            config_path.write_text(CONFIG.format(root_name=root_name))
+
+            with container.request(GenerationRequest(file_path=config_path)) as request:
+                roots.append(request.get(ConfigModel).settings.root_name)
+                generators.append(request.get(ProjectGenerator))
+
+        assert roots == ["first_app", "second_app"]
+        assert generators[0] is not generators[1]
+        container.close()
+
+    def test_template_engine_is_shared(self, tmp_path: Path) -> None:
+        container = Container()
+        config_path = tmp_path / "ddd-config.yaml"
+        config_path.write_text(CONFIG.format(root_name="app"))
+        engines = []
+
+        for _ in range(2):
+            with container.request(GenerationRequest(file_path=config_path)) as request:
+                engines.append(request.get(ProjectGenerator).context.engine)
+
+        assert engines[0] is engines[1] is TemplateEngine.for_project()
+        container.close()
+
+    def test_template_engine_per_search_path(self, tmp_path: Path) -> None:
+        container = Container()
+        config_path = tmp_path / "ddd-config.yaml"
+        config_path.write_text(CONFIG.format(root_name="app"))
+        overriding_root = tmp_path / "overriding"
+        (overriding_root / ".pyc" / "templates").mkdir(parents=True)
+        engines = []
+
+        for project_root in (tmp_path / "plain", overriding_root):
+            request = GenerationRequest(file_path=config_path, project_root=project_root)
+            with container.request(request) as request_container:
+                engines.append(request_container.get(TemplateEngine))
+
+        assert engines[0] is not engines[1]
+        assert engines[1] is TemplateEngine.for_project(overriding_root)
+        container.close()
+
+    def test_preview_mode_per_request(self, tmp_path: Path) -> None:
+        container = Container()
+        config_path = tmp_path / "ddd-config.yaml"
+        config_path.write_text(CONFIG.format(root_name="app"))
+
+        preview_request = GenerationRequest(file_path=config_path, preview_mode=True)
+        with container.request(preview_request) as request:
+            generator = request.get(ProjectGenerator)
+            assert generator.context.preview_collector is request.get(PreviewCollector)
+
+        with container.request(GenerationRequest(file_path=config_path)) as request:
+            generator = request.get(ProjectGenerator)
+            assert generator.context.preview_mode is False
+            assert generator.context.preview_collector is None
+
+        container.close()
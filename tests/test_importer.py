@@ -0,0 +1,154 @@
+from pathlib import Path
+
+import pytest
+import yaml
+from click.testing import CliRunner
+
+from src.core.batch import BatchGenerator
+from src.core.dependencies import Container
+from src.core.importer import ConfigImporter
+from src.main import cli
+
+STANDARD_CONFIG = """settings:
+  preset: "standard"
+  root_name: "app"
+
+layers:
+  domain:
+    contexts:
+      - name: users
+        entities: User, Admin
+        services:
+      - name: billing
+    value_objects: Email
+  application:
+    contexts:
+      - name: users
+        commands: CreateUser
+  infrastructure:
+"""
+
+ADVANCED_CONFIG = """settings:
+  preset: "advanced"
+  root_name: "app"
+  group_components: false
+  init_imports: true
+
+layers:
+  contexts:
+    - name: users
+      domain:
+        entities: User, Admin
+        repositories: UserRepository
+      application:
+    - name: orders
+      domain:
+        entities: Order
+"""
+
+SIMPLE_CONFIG = """settings:
+  preset: "simple"
+  root_name: "app"
+
+layers:
+  domain:
+    entities: User
+  infrastructure:
+    repositories: UserRepository, OrderRepository
+"""
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
+def generate(config_dir: Path, config: str) -> Path:
+    config_dir.mkdir(parents=True, exist_ok=True)
+    config_path = config_dir / "ddd-config.yaml"
+    config_path.write_text(config)
+    [result] = BatchGenerator(Container(), workers=1).generate([config_path])
+    assert result.success, result.error
+    return config_dir / "app"
+
+
+def project_files(root: Path) -> dict[str, str]:
+    return {path.relative_to(root).as_posix(): path.read_text() for path in root.rglob("*.py")}
+
+
+class TestConfigImporter:
+
+    @pytest.mark.parametrize(
+        ("config", "preset"),
+        [(STANDARD_CONFIG, "standard"), (ADVANCED_CONFIG, "advanced"), (SIMPLE_CONFIG, "simple")],
+    )
+    def test_round_trip(self, tmp_path: Path, config: str, preset: str) -> None:
+        original = generate(tmp_path / "original", config)
+
+        importer = ConfigImporter(original)
+        imported = importer.dump(importer.import_config())
+        regenerated = generate(tmp_path / "imported", imported)
+
+        assert importer.summary.preset == preset
+        assert importer.summary.skipped == []
+        assert project_files(regenerated) == project_files(original)
+
+    def test_import_settings_and_components(self, tmp_path: Path) -> None:
+        original = generate(tmp_path / "original", ADVANCED_CONFIG)
+
+        config = ConfigImporter(original).import_config()
+
+        assert config["settings"] == {
+            "preset": "advanced",
+            "root_name": "app",
+            "group_components": False,
+            "init_imports": True,
+        }
+        users = next(c for c in config["layers"]["contexts"] if c["name"] == "users")
+        assert users["domain"]["entities"] == ["User", "Admin"]
+        assert users["application"] == {}
+
+    def test_skipped_modules(self, tmp_path: Path) -> None:
+        original = generate(tmp_path / "original", STANDARD_CONFIG)
+        (original / "domain" / "helpers.py").write_text("def helper() -> None:\n    pass\n")
+
+        importer = ConfigImporter(original)
+        importer.import_config()
+
+        assert importer.summary.skipped == ["domain/helpers.py"]
+
+    def test_reimport_uses_cache(self, tmp_path: Path) -> None:
+        original = generate(tmp_path / "original", STANDARD_CONFIG)
+        ConfigImporter(original).import_config()
+
+        importer = ConfigImporter(original)
+        importer.import_config()
+
+        assert importer.index.parsed == 0
+        assert importer.index.cached == importer.summary.modules
+
+
+class TestImportCommand:
+
+    def test_import(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        original = generate(tmp_path / "original", STANDARD_CONFIG)
+        monkeypatch.chdir(tmp_path)
+
+        result = CliRunner().invoke(cli, ["import", str(original)])
+
+        assert result.exit_code == 0, result.output
+        assert "Imported standard config: 3 contexts" in result.output
+        config = yaml.safe_load((tmp_path / "ddd-config.yaml").read_text())
+        assert config["layers"]["domain"]["value_objects"] == ["Email"]
+
+    def test_import_keeps_existing_config(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        original = generate(tmp_path / "original", STANDARD_CONFIG)
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "ddd-config.yaml").write_text("settings: {}\n")
+
+        result = CliRunner().invoke(cli, ["import", str(original)])
+
+        assert result.exit_code == 1
+        assert (tmp_path / "ddd-config.yaml").read_text() == "settings: {}\n"
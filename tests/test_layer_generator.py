@@ -2,7 +2,12 @@ import tempfile
 from pathlib import Path
 
 from src.core.template_engine import TemplateEngine
-from src.generators.layer_generator import LayerGenerator
+from src.generators.layer_generator import (
+    LayerGenerator,
+    LayerGeneratorPool,
+    LayerGeneratorSpec,
+)
+from src.generators.utils import AdvancedImportPathGenerator
 
 
 class TestLayerGenerator:
@@ -250,3 +255,45 @@ class TestLayerGenerator:
             assert component_dir.exists()
             assert component_dir.is_dir()
             assert user_file.exists()
+
+
+class TestLayerGeneratorPool:
+
+    def test_shared_by_contexts(self, template_engine: TemplateEngine, tmp_path: Path) -> None:
+        pool = LayerGeneratorPool(template_engine)
+        spec = LayerGeneratorSpec("domain", "src", group_components=True, init_imports=True)
+
+        for context_name in ("billing", "orders"):
+            component_dir = tmp_path / context_name / "entities"
+            component_dir.mkdir(parents=True)
+            pool.get(spec).generate_components(component_dir, "entities", ["Item"], context_name)
+
+        assert len(pool) == 1
+        assert (pool.hits, pool.misses, pool.hit_rate) == (1, 1, 0.5)
+        orders_init = (tmp_path / "orders" / "entities" / "__init__.py").read_text()
+        assert "from src.domain.orders.entities.entities import Item" in orders_init
+
+    def test_keyed_by_full_spec(self, template_engine: TemplateEngine) -> None:
+        pool = LayerGeneratorPool(template_engine)
+        standard = LayerGeneratorSpec("domain", "src", True, True)
+        advanced = LayerGeneratorSpec("domain", "src", True, True, AdvancedImportPathGenerator())
+
+        assert pool.get(standard) is not pool.get(advanced)
+        assert isinstance(pool.get(advanced).import_path_generator, AdvancedImportPathGenerator)
+        assert pool.get(standard) is pool.get(standard)
+
+    def test_evicts_least_recently_used(self, template_engine: TemplateEngine) -> None:
+        pool = LayerGeneratorPool(template_engine, max_size=2)
+        domain, application, interface = (
+            LayerGeneratorSpec(layer, "src", True, False)
+            for layer in ("domain", "application", "interface")
+        )
+
+        first_domain = pool.get(domain)
+        pool.get(application)
+        pool.get(domain)
+        pool.get(interface)
+
+        assert len(pool) == 2
+        assert pool.get(domain) is first_domain
+        assert pool.misses == 3
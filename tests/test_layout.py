@@ -0,0 +1,89 @@
+from pathlib import Path
+
+import pytest
+
+from src.core.dependencies import Container
+from src.core.exceptions import ConfigValidationError
+from src.core.layout import Layout
+from src.core.parser import YamlParser
+from src.core.utils import GenerationRequest
+from src.generators import ProjectGenerator
+
+CONFIG = """settings:
+  preset: "standard"
+  init_imports: true
+  layout: "{root}/{context}/{layer}/{type}"
+
+layers:
+  domain:
+    contexts:
+      - name: billing
+        entities: Invoice
+    services: Clock
+"""
+
+
+class TestLayout:
+
+    def test_compiled_paths_and_imports(self) -> None:
+        layout = Layout("{root}/{layer}/ctx_{context}/{type}").compile(Path("/p/src"), "src")
+
+        assert layout.scope_directories("domain", None) == (Path("/p/src/domain"),)
+        assert layout.component_directories("domain", "billing", "entities") == (
+            Path("/p/src/domain"),
+            Path("/p/src/domain/ctx_billing"),
+            Path("/p/src/domain/ctx_billing/entities"),
+        )
+        assert layout.component_directories("domain", None, "services")[-1] == Path(
+            "/p/src/domain/services"
+        )
+        assert layout.import_package("domain", "billing", "entities") == (
+            "src.domain.ctx_billing.entities"
+        )
+        assert layout.import_package("domain", None, "services") == "src.domain.services"
+        assert layout.scope_package("domain", "billing") == (
+            Path("/p/src/domain/ctx_billing"),
+            "src.domain.ctx_billing",
+        )
+        assert layout.scope_package("domain", None) == (Path("/p/src/domain"), "src.domain")
+
+    def test_separate_import_pattern(self) -> None:
+        layout = Layout("{root}/{layer}/{type}", imports="{root}.{layer}.{type}_pkg")
+
+        compiled = layout.compile(Path("/p/src"), "app")
+
+        assert compiled.import_package("domain", None, "entities") == "app.domain.entities_pkg"
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            "{layer}/{type}",
+            "{root}/{layer}",
+            "{root}/{type}/{layer}",
+            "{root}/{type}",
+            "{root}/{layer}/{name}/{type}",
+            "{root}//{layer}/{type}",
+        ],
+    )
+    def test_invalid_patterns(self, pattern: str) -> None:
+        with pytest.raises(ValueError):
+            Layout(pattern)
+
+    def test_invalid_layout_in_config(self) -> None:
+        with pytest.raises(ConfigValidationError, match="settings.layout"):
+            YamlParser().validate({"settings": {"layout": "{root}/{type}"}, "layers": {}})
+
+    def test_custom_layout_generation(self, tmp_path: Path) -> None:
+        config_path = tmp_path / "ddd-config.yaml"
+        config_path.write_text(CONFIG)
+
+        request = GenerationRequest(file_path=config_path, project_root=tmp_path)
+        with Container().request(request) as request_container:
+            request_container.get(ProjectGenerator).generate()
+
+        root = tmp_path / "src"
+        assert (root / "billing" / "domain" / "entities" / "entities.py").exists()
+        assert (root / "domain" / "services" / "services.py").exists()
+        assert not (root / "domain" / "billing").exists()
+        init = (root / "billing" / "domain" / "entities" / "__init__.py").read_text()
+        assert "from src.billing.domain.entities.entities import Invoice" in init
@@ -0,0 +1,105 @@
+from pathlib import Path
+
+import pytest
+
+from src.core.linter import (
+    CASE_COLLISION,
+    DUPLICATE_NAME,
+    INVALID_IDENTIFIER,
+    MODULE_COLLISION,
+    ConfigLinter,
+    LintIssue,
+)
+from src.core.parser import YamlParser
+
+STANDARD_CONFIG = """settings:
+  preset: "standard"
+  group_components: false
+
+layers:
+  domain:
+    contexts:
+      - name: users
+        entities: User, Admin, User
+        services: [UserService, userService, class]
+      - name: Users
+        entities: [Profile]
+      - name: users
+        entities: Order
+  Domain:
+    entities: 1st
+"""
+
+
+def lint(tmp_path: Path, content: str) -> list[LintIssue]:
+    config_path = tmp_path / "ddd-config.yaml"
+    config_path.write_text(content)
+    parser = YamlParser()
+    document = parser.load_document(config_path)
+    return ConfigLinter(parser.validate(document.data), document.source_map).lint()
+
+
+class TestConfigLinter:
+
+    def test_valid_config(self, valid_yaml_path: Path) -> None:
+        parser = YamlParser()
+        assert ConfigLinter(parser.load(valid_yaml_path)).lint() == []
+
+    def test_issues_with_positions(self, tmp_path: Path) -> None:
+        issues = lint(tmp_path, STANDARD_CONFIG)
+
+        assert [(issue.code, issue.line, issue.column) for issue in issues] == [
+            (DUPLICATE_NAME, 9, 32),
+            (MODULE_COLLISION, 10, 33),
+            (INVALID_IDENTIFIER, 10, 46),
+            (CASE_COLLISION, 11, 9),
+            (DUPLICATE_NAME, 13, 9),
+            (CASE_COLLISION, 15, 3),
+            (INVALID_IDENTIFIER, 16, 15),
+        ]
+        assert "user_service.py" in issues[1].message
+        assert issues[0].format(Path("ddd-config.yaml")) == (
+            "ddd-config.yaml:9:32: Component User is listed more than once in entities "
+            "[duplicate-name]"
+        )
+
+    def test_grouped_components_share_modules(self, tmp_path: Path) -> None:
+        config = STANDARD_CONFIG.replace("group_components: false", "group_components: true")
+
+        codes = [issue.code for issue in lint(tmp_path, config)]
+
+        assert MODULE_COLLISION not in codes
+
+    def test_nested_contexts(self, tmp_path: Path) -> None:
+        issues = lint(
+            tmp_path,
+            """settings:
+  preset: "advanced"
+
+layers:
+  contexts:
+    - name: billing
+      domain:
+        entities: [Invoice, Invoice]
+    - name: Billing
+      application:
+        services: [def]
+""",
+        )
+
+        assert [(issue.code, issue.line) for issue in issues] == [
+            (DUPLICATE_NAME, 8),
+            (CASE_COLLISION, 9),
+            (INVALID_IDENTIFIER, 11),
+        ]
+
+    @pytest.mark.parametrize("layout", ["{root}/{layer}/{type}", "{root}/{layer}_{context}/{type}"])
+    def test_paths_follow_layout(self, tmp_path: Path, layout: str) -> None:
+        config = STANDARD_CONFIG.replace(
+            "group_components: false", f'group_components: true\n  layout: "{layout}"'
+        )
+
+        codes = [issue.code for issue in lint(tmp_path, config)]
+
+        # Without contexts in the layout, entities of all contexts land in one module.
+        assert (MODULE_COLLISION in codes) == ("{context}" not in layout)
@@ -0,0 +1,123 @@
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from src.core.exceptions import ManifestMergeError
+from src.core.manifest import ShardSpec, merge_manifests, shard_of
+from src.main import cli
+
+CONTEXTS = ["user", "order", "payment", "catalog", "shipping", "billing"]
+
+
+def write_config(path: Path, preset: str = "standard") -> None:
+    if preset == "advanced":
+        contexts = "\n".join(
+            f"    - name: {name}\n      domain:\n        entities: {name.title()}"
+            for name in CONTEXTS
+        )
+        layers = f"  contexts:\n{contexts}"
+    else:
+        contexts = "\n".join(
+            f"      - name: {name}\n        entities: {name.title()}" for name in CONTEXTS
+        )
+        layers = f"  domain:\n    contexts:\n{contexts}\n    services: Clock"
+    path.write_text(f'settings:\n  preset: "{preset}"\n\nlayers:\n{layers}\n')
+
+
+def shard_manifest(index: int, count: int, units: list[str], files: list[str]) -> dict:
+    return {
+        "version": 1,
+        "shard": {"index": index, "count": count},
+        "units": units,
+        "files": files,
+        "directories": [],
+    }
+
+
+class TestShardSpec:
+
+    def test_parse(self) -> None:
+        assert ShardSpec.parse("1/4") == ShardSpec(1, 4)
+
+    @pytest.mark.parametrize("value", ["4/4", "1", "a/b", "0/0", "-1/2"])
+    def test_parse_invalid(self, value: str) -> None:
+        with pytest.raises(ValueError):
+            ShardSpec.parse(value)
+
+    def test_partition_is_stable_and_complete(self) -> None:
+        shards = [ShardSpec(index, 3) for index in range(3)]
+        for name in CONTEXTS:
+            owners = [shard.index for shard in shards if shard.owns(name)]
+            assert owners == [shard_of(name, 3)]
+
+
+class TestMergeManifests:
+
+    def test_merge(self) -> None:
+        merged = merge_manifests(
+            [
+                shard_manifest(0, 2, ["user"], ["src/domain/user/entities/entities.py"]),
+                shard_manifest(1, 2, ["order"], ["src/domain/order/entities/entities.py"]),
+            ]
+        )
+        assert merged["shard"] is None
+        assert merged["units"] == ["order", "user"]
+
+    def test_missing_and_duplicated(self) -> None:
+        with pytest.raises(ManifestMergeError) as error:
+            merge_manifests(
+                [
+                    shard_manifest(0, 3, ["user"], ["a.py"]),
+                    shard_manifest(0, 3, ["user"], ["a.py"]),
+                ]
+            )
+        message = str(error.value)
+        assert "Missing shard 1/3" in message
+        assert "Duplicate shard 0/3" in message
+        assert "Duplicate unit user" in message
+        assert "Duplicate file a.py" in message
+
+
+class TestShardedRun:
+
+    @pytest.mark.parametrize("preset", ["standard", "advanced"])
+    def test_shards_cover_full_generation(self, preset: str) -> None:
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            write_config(Path("ddd-config.yaml"), preset)
+            for index in range(3):
+                result = runner.invoke(cli, ["run", "--shard", f"{index}/3"])
+                assert "Project generation completed successfully" in result.output
+
+            manifests = sorted(str(path) for path in Path.cwd().glob("pyc-manifest.shard-*.json"))
+            result = runner.invoke(
+                cli, ["merge-manifests", *manifests, "--file", "ddd-config.yaml"]
+            )
+            assert result.exit_code == 0, result.output
+
+            merged = json.loads(Path("pyc-manifest.json").read_text())
+            assert set(CONTEXTS) <= set(merged["units"])
+            for file in merged["files"]:
+                assert Path(file).exists()
+
+    def test_merge_detects_missing_shard(self) -> None:
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            write_config(Path("ddd-config.yaml"))
+            runner.invoke(cli, ["run", "--shard", "0/2"])
+
+            result = runner.invoke(
+                cli,
+                ["merge-manifests", "pyc-manifest.shard-0-of-2.json", "--file", "ddd-config.yaml"],
+            )
+            assert result.exit_code == 1
+            assert "Missing shard 1/2" in result.output
+
+    def test_simple_preset_rejects_sharding(self) -> None:
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            runner.invoke(cli, ["init", "--preset", "simple"])
+            result = runner.invoke(cli, ["run", "--shard", "0/2"])
+            assert "Sharding is not supported by the simple preset" in result.output
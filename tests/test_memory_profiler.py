@@ -0,0 +1,56 @@
+import tracemalloc
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from src.core.memory_profiler import MemoryProfiler, memory_profiling
+from src.core.tracing import span
+from src.main import cli
+
+STANDARD_CONFIG = """settings:
+  preset: "standard"
+
+layers:
+  domain:
+    contexts:
+      - name: users
+        entities: User
+"""
+
+
+def allocate(size: int) -> list[bytes]:
+    return [bytes(1024) for _ in range(size // 1024)]
+
+
+class TestMemoryProfiler:
+
+    def test_phases_record_retained_and_peak(self) -> None:
+        profiler = MemoryProfiler(top=3)
+        with memory_profiling(profiler):
+            with span("config.parse"):
+                retained = allocate(512 * 1024)
+            with span("project.generate"):
+                with span("template.render"):
+                    allocate(2048 * 1024)
+
+        parse, plan = profiler.phases
+        assert (parse.phase, plan.phase) == ("parse", "plan")
+        assert parse.retained >= 512 * 1024
+        assert abs(plan.retained) < 64 * 1024
+        assert plan.peak - plan.start >= 2048 * 1024
+        assert parse.top_sites[0].traceback[0].filename == __file__
+        assert len(parse.top_sites) <= 3
+        assert profiler.peak >= plan.peak
+        assert not tracemalloc.is_tracing()
+        del retained
+
+    def test_run_with_memory_report(self, tmp_path: Path) -> None:
+        runner = CliRunner(env={"PYC_NO_DAEMON": "1"})
+        with runner.isolated_filesystem(temp_dir=tmp_path):
+            Path("ddd-config.yaml").write_text(STANDARD_CONFIG)
+            result = runner.invoke(cli, ["run", "--memory-report"])
+
+        assert result.exit_code == 0
+        assert "Memory by phase" in result.output
+        assert "Top allocation sites" in result.output
+        assert "Peak traced memory" in result.output
@@ -3,7 +3,7 @@ from pathlib import Path
 
 import pytest
 
-from src.core.exceptions import ConfigFileNotFoundError, YamlParseError
+from src.core.exceptions import ConfigFileNotFoundError, ConfigValidationError, YamlParseError
 from src.core.parser import YamlParser
 from src.schemas import ConfigModel
 
@@ -44,3 +44,51 @@ class TestYamlParser:
             assert isinstance(config, ConfigModel)
         finally:
             os.chdir(original_cwd)
+
+    def test_source_map(self, yaml_parser: YamlParser, tmp_path: Path) -> None:
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            "layers:\n"
+            "  domain:\n"
+            "    contexts:\n"
+            "      - name: users\n"
+            '        entities: "User,  Admin"\n'
+            "        services: [UserService]\n"
+        )
+
+        document = yaml_parser.load_document(config_file)
+        source_map = document.source_map
+
+        context = ("layers", "domain", "contexts", 0)
+        assert source_map[("layers", "domain")] == (2, 3)
+        assert source_map[context] == (4, 9)
+        assert source_map[(*context, "name")] == (4, 9)
+        assert source_map[(*context, "entities", 0)] == (5, 20)
+        assert source_map[(*context, "entities", 1)] == (5, 27)
+        assert source_map[(*context, "services", 0)] == (6, 20)
+        assert (*context, "name", 0) not in source_map
+        assert document.data["layers"]["domain"]["contexts"][0]["name"] == "users"
+
+    def test_validation_error_positions(self, yaml_parser: YamlParser, tmp_path: Path) -> None:
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            "settings:\n"
+            "  preset: standard\n"
+            "  init_imports: maybe\n"
+            "layers:\n"
+            "  domain: {}\n"
+        )
+
+        with pytest.raises(ConfigValidationError) as error:
+            yaml_parser.load(config_file)
+
+        assert error.value.value == [
+            f"{config_file}:3:3: settings.init_imports: "
+            "Input should be a valid boolean, unable to interpret input"
+        ]
+
+    def test_validation_error_without_source(self, yaml_parser: YamlParser) -> None:
+        with pytest.raises(ConfigValidationError) as error:
+            yaml_parser.validate({"settings": {}})
+
+        assert str(error.value) == "Configuration invalid:\n  - layers: Field required"
@@ -0,0 +1,85 @@
+"""Performance regression checks on reference workloads.
+
+Skipped by default, run them with:
+
+    pytest tests/test_performance.py --run-perf
+
+Throughput is measured in generated nodes per second of the fastest of
+several runs, peak memory with tracemalloc during preview. After an
+intended change, or on a new reference machine, record a new baseline with
+--update-perf-baseline and commit it.
+"""
+
+import json
+import platform
+from pathlib import Path
+
+import pytest
+
+from benchmarks.generation import Workload, peak_memory, time_phase
+from benchmarks.synthetic import SyntheticSpec
+
+BASELINE_PATH = Path(__file__).parent / "fixtures" / "perf_baseline.json"
+REFERENCE_WORKLOADS = (
+    SyntheticSpec(preset="standard", contexts=1000),
+    SyntheticSpec(preset="advanced", contexts=500, init_imports=True),
+)
+# Allowed relative drop of throughput and rise of peak memory.
+THROUGHPUT_TOLERANCE = 0.3
+MEMORY_TOLERANCE = 0.15
+REPEAT = 2
+
+
+def measure(spec: SyntheticSpec, work_dir: Path) -> dict[str, float]:
+    workload = Workload(spec, work_dir)
+    metrics = {}
+    for phase in ("preview", "generate"):
+        result = time_phase(workload.phase(phase), REPEAT)
+        metrics[f"{phase}_nodes_per_second"] = result["nodes"] / result["min"]
+    metrics["preview_peak_memory"] = peak_memory(workload.preview)
+    return metrics
+
+
+def load_baseline() -> dict:
+    if not BASELINE_PATH.exists():
+        return {"workloads": {}}
+    return json.loads(BASELINE_PATH.read_text(encoding="utf-8"))
+
+
+def update_baseline(name: str, metrics: dict[str, float]) -> None:
+    baseline = load_baseline()
+    baseline["python"] = platform.python_version()
+    baseline["platform"] = platform.platform()
+    baseline["workloads"][name] = {key: round(value) for key, value in metrics.items()}
+    BASELINE_PATH.write_text(json.dumps(baseline, indent=2) + "\n", encoding="utf-8")
+
+
+@pytest.mark.perf
+class TestPerformance:
+
+    @pytest.mark.parametrize("spec", REFERENCE_WORKLOADS, ids=lambda spec: spec.name)
+    def test_reference_workload(
+        self, spec: SyntheticSpec, tmp_path: Path, request: pytest.FixtureRequest
+    ) -> None:
+        metrics = measure(spec, tmp_path)
+
+        if request.config.getoption("--update-perf-baseline"):
+            update_baseline(spec.name, metrics)
+            return
+
+        expected = load_baseline()["workloads"].get(spec.name)
+        if expected is None:
+            pytest.fail(f"No baseline for {spec.name}, record one with --update-perf-baseline")
+
+        regressions = []
+        for key, value in metrics.items():
+            if key.endswith("_nodes_per_second"):
+                limit = expected[key] * (1 - THROUGHPUT_TOLERANCE)
+                if value < limit:
+                    regressions.append(f"{key}: {value:.0f} < {limit:.0f}")
+            else:
+                limit = expected[key] * (1 + MEMORY_TOLERANCE)
+                if value > limit:
+                    regressions.append(f"{key}: {value:.0f} > {limit:.0f}")
+
+        assert not regressions, f"{spec.name} regressed: " + ", ".join(regressions)
@@ -0,0 +1,101 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.core import plugins
+from src.core.exceptions import PresetNotFoundError
+from src.core.plugins import PluginSpec, discover_plugins, distributions_key
+from src.core.template_engine import TemplateEngine
+from src.core.utils import GenerationContext
+from src.generators import ProjectGenerator
+from src.schemas.config_schema import ConfigModel, LayerConfig, Settings
+
+ENTRY_POINTS = """[pyconstructor.presets]
+acme = acme_presets:AcmePresetGenerator
+
+[pyconstructor.templates]
+acme = acme_templates
+"""
+PRESET_MODULE = """from src.core.layout import Layout
+from src.generators.presets.layout import LayoutPresetGenerator
+
+
+class AcmePresetGenerator(LayoutPresetGenerator):
+    LAYOUT = Layout("{root}/{layer}/bc_{context}/{type}")
+"""
+
+
+@pytest.fixture
+def plugin_dist(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    site_dir = tmp_path / "site"
+    dist_info = site_dir / "acme_plugins-1.0.dist-info"
+    dist_info.mkdir(parents=True)
+    (dist_info / "METADATA").write_text("Metadata-Version: 2.1\nName: acme-plugins\nVersion: 1.0\n")
+    (dist_info / "entry_points.txt").write_text(ENTRY_POINTS)
+    (site_dir / "acme_presets.py").write_text(PRESET_MODULE)
+    templates = site_dir / "acme_templates"
+    templates.mkdir()
+    (templates / "__init__.py").write_text("")
+    (templates / "init.py.jinja").write_text("# acme init\n")
+
+    monkeypatch.syspath_prepend(str(site_dir))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    discover_plugins.cache_clear()
+    yield site_dir
+    discover_plugins.cache_clear()
+    sys.modules.pop("acme_presets", None)
+
+
+class TestPlugins:
+
+    def test_discovery_is_lazy_and_cached(
+        self, plugin_dist: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        index = discover_plugins()
+
+        assert index.presets["acme"] == PluginSpec(
+            "acme", "acme_presets:AcmePresetGenerator", "acme-plugins"
+        )
+        assert index.templates["acme"].package_dir() == plugin_dist / "acme_templates"
+        assert "acme_presets" not in sys.modules
+        assert plugins.get_cache_path().exists()
+
+        def fail() -> None:
+            raise AssertionError("entry points read again")
+
+        monkeypatch.setattr(plugins, "_scan_entry_points", fail)
+        discover_plugins.cache_clear()
+        assert discover_plugins() == index
+
+    def test_cache_key_follows_distributions(self, plugin_dist: Path) -> None:
+        key = distributions_key()
+
+        (plugin_dist / "other-2.0.dist-info").mkdir()
+
+        assert distributions_key() != key
+
+    def test_plugin_preset(self, plugin_dist: Path, tmp_path: Path) -> None:
+        config = ConfigModel(
+            settings=Settings(preset="acme", root_name="app", init_imports=True),
+            layers=LayerConfig.model_validate(
+                {"domain": {"contexts": [{"name": "billing", "entities": "Invoice"}]}}
+            ),
+        )
+        context = GenerationContext(
+            config=config, engine=TemplateEngine(), preview_mode=False, project_root=tmp_path
+        )
+
+        ProjectGenerator(context).generate()
+
+        assert config.settings.preset_name == "acme"
+        assert (tmp_path / "app" / "domain" / "bc_billing" / "entities" / "entities.py").exists()
+        init = tmp_path / "app" / "domain" / "bc_billing" / "entities" / "__init__.py"
+        assert init.read_text().strip() == "# acme init"
+
+    def test_unknown_preset(self, plugin_dist: Path) -> None:
+        config = ConfigModel(settings=Settings(preset="missing"), layers=LayerConfig())
+        context = GenerationContext(config=config, engine=TemplateEngine(), preview_mode=False)
+
+        with pytest.raises(PresetNotFoundError, match="acme"):
+            ProjectGenerator(context)
@@ -0,0 +1,189 @@
+import json
+import logging
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from src.core.dependencies import Container
+from src.core.utils import GenerationRequest
+from src.generators import ProjectGenerator
+from src.main import cli, configure_logging
+from src.preview.collector import PreviewCollector
+from src.preview.stream_render import StreamTreePreviewRender
+
+PATHS = [
+    "app/domain/user/entities/user.py",
+    "app/domain/user/value_objects/email.py",
+    "app/domain/catalog/entities/product.py",
+    "app/application/user/use_cases/register_user.py",
+    "app/infrastructure/repositories/user_repository.py",
+    "app/__init__.py",
+]
+
+STANDARD_CONFIG = """settings:
+  preset: "standard"
+  group_components: false
+
+layers:
+  domain:
+    contexts:
+      - name: users
+        entities: User, Profile
+      - name: orders
+        entities: Order
+  infrastructure:
+    repositories: UserRepository
+"""
+
+
+def collect(render_format: str) -> PreviewCollector:
+    collector = PreviewCollector(render_format=render_format)
+    collector.add_directory(Path("app"))
+    for path in PATHS:
+        collector.add_file(Path(path))
+    return collector
+
+
+class TestStreamTreePreviewRender:
+
+    def test_matches_rich_tree(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
+    ) -> None:
+        monkeypatch.chdir(tmp_path)
+        collect("tree").display()
+        expected = (tmp_path / "structure.md").read_text()
+        rich_output = capsys.readouterr().out
+
+        collect("stream").display()
+        assert (tmp_path / "structure.md").read_text() == expected
+        assert capsys.readouterr().out == rich_output
+
+    def test_deep_tree_is_not_recursive(self) -> None:
+        collector = PreviewCollector(render_format="stream")
+        collector.add_directory(Path("app"))
+        depth = 5000
+        collector.add_file(Path("app", *(f"d{level}" for level in range(depth)), "leaf.py"))
+
+        lines = list(StreamTreePreviewRender.iter_lines(collector.root_node))  # type: ignore
+
+        assert len(lines) == depth + 2
+        assert lines[-1] == " " * 4 * depth + "└── leaf.py\n"
+
+
+def preview(render_format: str) -> str:
+    runner = CliRunner(env={"PYC_NO_DAEMON": "1"})
+    with runner.isolated_filesystem():
+        Path("ddd-config.yaml").write_text(STANDARD_CONFIG)
+        result = runner.invoke(cli, ["preview", "--format", render_format])
+    assert result.exit_code == 0
+    return result.output
+
+
+class TestJsonPreviewRender:
+
+    def test_json_document(self) -> None:
+        document = json.loads(preview("json"))
+
+        root = document["root"]
+        assert root["name"] == "src"
+        domain = next(child for child in root["children"] if child["name"] == "domain")
+        assert [child["name"] for child in domain["children"]] == ["__init__.py", "users", "orders"]
+
+        stats = document["stats"]
+        assert stats["total"]["components"] == 4
+        assert stats["layers"]["domain"]["components"] == 3
+        assert stats["contexts"]["users"] == {"directories": 2, "modules": 4, "components": 2}
+        assert stats["contexts"]["orders"] == {"directories": 2, "modules": 3, "components": 1}
+
+    def test_ndjson_lines(self) -> None:
+        lines = [json.loads(line) for line in preview("ndjson").splitlines()]
+
+        nodes = [line for line in lines if line["kind"] == "node"]
+        assert nodes[0]["path"] == "src"
+        assert {
+            "kind": "node",
+            "name": "user_entity.py",
+            "type": "file",
+            "path": "src/domain/users/entities/user_entity.py",
+        } in nodes
+
+        stats = {
+            (line["scope"], line.get("name")): line for line in lines if line["kind"] == "stats"
+        }
+        assert stats[("total", None)]["modules"] == sum(
+            node["name"].endswith(".py") for node in nodes
+        )
+        assert stats[("layer", "infrastructure")]["components"] == 1
+        assert stats[("context", "orders")]["components"] == 1
+
+    def test_statistics_do_not_depend_on_cwd(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        runner = CliRunner(env={"PYC_NO_DAEMON": "1"})
+        totals = []
+        for project_dir in (tmp_path, tmp_path / "services" / "billing" / "api"):
+            project_dir.mkdir(parents=True, exist_ok=True)
+            (project_dir / "ddd-config.yaml").write_text(STANDARD_CONFIG)
+            monkeypatch.chdir(project_dir)
+            result = runner.invoke(cli, ["preview", "--format", "json"])
+            assert result.exit_code == 0, result.output
+            totals.append(json.loads(result.output)["stats"]["total"])
+
+        assert totals[0] == totals[1]
+        nodes = [json.loads(line) for line in preview("ndjson").splitlines()]
+        directories = sum(node.get("type") == "directory" for node in nodes)
+        assert totals[0]["directories"] == directories
+
+    def test_plugin_warnings_stay_out_of_json(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(logging.root, "handlers", [])
+        configure_logging()
+
+        def broken_plugin_dirs() -> list[Path]:
+            logging.getLogger("src.core.plugins").warning("Template plugin broken skipped")
+            return []
+
+        monkeypatch.setattr("src.core.template_engine.plugin_template_dirs", broken_plugin_dirs)
+        (tmp_path / "ddd-config.yaml").write_text(STANDARD_CONFIG)
+        monkeypatch.chdir(tmp_path)
+
+        result = CliRunner(env={"PYC_NO_DAEMON": "1"}).invoke(cli, ["preview", "--format", "json"])
+
+        assert result.exit_code == 0, result.output
+        assert "Template plugin broken skipped" in result.stderr
+        assert json.loads(result.stdout)["stats"]["total"]["modules"] > 0
+
+
+class TestMeasure:
+
+    def test_sizes_match_generated_files(self, tmp_path: Path) -> None:
+        config_path = tmp_path / "ddd-config.yaml"
+        config_path.write_text(STANDARD_CONFIG.replace("false", "true"))
+        container = Container()
+
+        measure_request = GenerationRequest(
+            file_path=config_path, preview_mode=True, project_root=tmp_path, measure=True
+        )
+        with container.request(measure_request) as request:
+            request.get(ProjectGenerator).generate()
+            collector = request.get(PreviewCollector)
+        assert not (tmp_path / "src").exists()
+
+        with container.request(
+            GenerationRequest(file_path=config_path, project_root=tmp_path)
+        ) as request:
+            request.get(ProjectGenerator).generate()
+        container.close()
+
+        measured = {
+            collector.get_path(node): node.metadata["bytes"]
+            for node in collector.all_nodes
+            if node.has_metadata
+        }
+        assert measured
+        for path, size in measured.items():
+            assert Path(path).stat().st_size == size
+        assert collector.stats.total.bytes == sum(measured.values())
+        assert collector.stats.contexts["users"].bytes > collector.stats.contexts["orders"].bytes
@@ -0,0 +1,74 @@
+import pstats
+import time
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from src.core.profiler import Profiler, profiling
+from src.core.tracing import emit, span
+from src.main import cli
+
+STANDARD_CONFIG = """settings:
+  preset: "standard"
+
+layers:
+  domain:
+    contexts:
+      - name: users
+        entities: User
+      - name: orders
+        entities: Order
+"""
+
+
+class TestProfiler:
+
+    def test_nested_phases_get_exclusive_time(self) -> None:
+        profiler = Profiler()
+        with profiling(profiler):
+            with span("project.generate"):
+                time.sleep(0.01)
+                with span("layer.generate_components"), span("template.render"):
+                    time.sleep(0.02)
+                with span("template.render"):
+                    pass
+
+        totals = profiler.phase_totals()
+        assert list(totals) == ["plan", "render"]
+        assert totals["render"].calls == 2
+        assert 0.01 <= totals["plan"].wall < 0.02
+        assert totals["render"].wall >= 0.02
+
+    def test_time_is_split_by_context(self) -> None:
+        profiler = Profiler()
+        with profiling(profiler):
+            with span("project.generate"):
+                emit("generation.scope", layer="domain", context="users")
+                with span("file.write"):
+                    time.sleep(0.01)
+                emit("generation.scope", layer="domain", context="orders")
+                with span("file.write"):
+                    pass
+
+        contexts = profiler.context_totals()
+        assert contexts["users"]["write"].wall >= 0.01
+        assert contexts["orders"]["write"].calls == 1
+        assert profiler.context_name is None
+
+    def test_disabled_outside_profiling(self) -> None:
+        profiler = Profiler()
+        with span("project.generate"):
+            pass
+        assert profiler.stats == {}
+
+    def test_run_with_profile(self, tmp_path: Path) -> None:
+        runner = CliRunner(env={"PYC_NO_DAEMON": "1"})
+        with runner.isolated_filesystem(temp_dir=tmp_path):
+            Path("ddd-config.yaml").write_text(STANDARD_CONFIG)
+            result = runner.invoke(cli, ["run", "--profile-dump", "run.pstats"])
+
+            assert result.exit_code == 0
+            assert "Project generation completed successfully" in result.output
+            assert "Profile by phase" in result.output
+            assert "Wall time by bounded context" in result.output
+            assert pstats.Stats("run.pstats").total_calls > 0
@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+HEAVY_PACKAGES = ("pydantic", "dishka", "jinja2", "rich", "yaml")
+# Total self import time of a lightweight command, generous enough for slow CI agents.
+STARTUP_BUDGET_US = 400_000
+
+
+def collect_import_times(args: list[str], cwd: Path) -> dict[str, int]:
+    env = {**os.environ, "PYTHONPATH": str(PROJECT_ROOT), "PYC_NO_DAEMON": "1"}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "src.main", *args],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr
+
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_time, _, module = line.removeprefix("import time:").split("|")
+        import_times[module.strip()] = int(self_time)
+    return import_times
+
+
+class TestStartup:
+
+    @pytest.mark.parametrize("args", [["--help"], ["init", "--preset", "simple"]])
+    def test_lightweight_commands_skip_heavy_imports(
+        self, args: list[str], tmp_path: Path
+    ) -> None:
+        import_times = collect_import_times(args, tmp_path)
+
+        heavy_modules = [
+            module for module in import_times if module.split(".")[0] in HEAVY_PACKAGES
+        ]
+        assert heavy_modules == []
+        assert sum(import_times.values()) < STARTUP_BUDGET_US
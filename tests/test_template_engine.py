@@ -1,7 +1,15 @@
+import os
+from pathlib import Path
+
 import pytest
 from jinja2 import TemplateNotFound
 
-from src.core.template_engine import TemplateEngine
+from src.core.template_engine import (
+    BUILTIN_TEMPLATES_DIR,
+    TemplateEngine,
+    template_search_path,
+)
+from src.generators.layer_generator import LayerGenerator
 
 
 class TestTemplateEngine:
@@ -47,3 +55,126 @@ class TestTemplateEngine:
         consonant_article = template_engine._get_article(consonant_word)
         assert vowel_article == "an"
         assert consonant_article == "a"
+
+
+def bump_mtime(path: Path) -> None:
+    mtime_ns = path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def user_templates(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config"))
+    templates_dir = tmp_path / "config" / "pyconstructor" / "templates"
+    templates_dir.mkdir(parents=True)
+    return templates_dir
+
+
+class TestTemplateSearchPath:
+
+    def test_search_path_order(self, user_templates: Path, tmp_path: Path) -> None:
+        project_templates = tmp_path / "project" / ".pyc" / "templates"
+        project_templates.mkdir(parents=True)
+
+        search_path = template_search_path(tmp_path / "project")
+
+        assert search_path[0] == project_templates.resolve()
+        assert search_path[1] == user_templates.resolve()
+        assert search_path[-1] == BUILTIN_TEMPLATES_DIR
+        assert template_search_path(tmp_path / "missing")[0] == user_templates.resolve()
+
+    def test_first_directory_wins(self, user_templates: Path, tmp_path: Path) -> None:
+        project_templates = tmp_path / ".pyc" / "templates"
+        project_templates.mkdir(parents=True)
+        (project_templates / "base_template.py.jinja").write_text("# project {{ name }}")
+        (user_templates / "base_template.py.jinja").write_text("# user {{ name }}")
+        (user_templates / "repository.py.jinja").write_text("# user repository {{ name }}")
+
+        engine = TemplateEngine(template_search_path(tmp_path))
+
+        assert engine.render("base_template.py.jinja", {"name": "User"}) == "# project User"
+        assert engine.render("repository.py.jinja", {"name": "User"}) == "# user repository User"
+        assert engine.template_exists("init.py.jinja")
+
+    def test_lookups_use_the_index(self, user_templates: Path, tmp_path: Path) -> None:
+        template = user_templates / "repository.py.jinja"
+        template.write_text("# repository")
+        engine = TemplateEngine(template_search_path(tmp_path))
+
+        template.unlink()
+        (user_templates / "service.py.jinja").write_text("# service")
+
+        assert engine.template_exists("repository.py.jinja")
+        assert not engine.template_exists("service.py.jinja")
+
+    def test_component_template(self, user_templates: Path, tmp_path: Path) -> None:
+        (user_templates / "repository.py.jinja").write_text("")
+        (user_templates / "multi_entity.py.jinja").write_text("")
+        engine = TemplateEngine(template_search_path(tmp_path))
+
+        assert engine.component_template("repository") == "repository.py.jinja"
+        assert engine.component_template("Repository") == "repository.py.jinja"
+        assert engine.component_template("service") == "base_template.py.jinja"
+        assert engine.component_template("entity", grouped=True) == "multi_entity.py.jinja"
+        assert (
+            engine.component_template("repository", grouped=True)
+            == "multi_component_template.py.jinja"
+        )
+
+    def test_component_type_override(self, user_templates: Path, tmp_path: Path) -> None:
+        (user_templates / "repository.py.jinja").write_text("class {{ name }}Base: ...\n")
+        engine = TemplateEngine(template_search_path(tmp_path))
+        generator = LayerGenerator(
+            engine, layer_name="domain", root_name="src", group_components=False
+        )
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+
+        generator.generate_components(output_dir, "repositories", ["User"])
+        generator.generate_components(output_dir, "services", ["User"])
+
+        repository = (output_dir / "user_repository.py").read_text()
+        assert repository.strip() == "class UserBase: ..."
+        assert "class User" in (output_dir / "user_service.py").read_text()
+
+    def test_engines_shared_per_search_path(self, user_templates: Path, tmp_path: Path) -> None:
+        (tmp_path / "second" / ".pyc" / "templates").mkdir(parents=True)
+
+        first = TemplateEngine.for_project(tmp_path / "first")
+
+        assert TemplateEngine.for_project(tmp_path / "first") is first
+        assert TemplateEngine.for_project(tmp_path / "other") is first
+        assert TemplateEngine.for_project(tmp_path / "second") is not first
+
+    def test_changed_templates_replace_the_engine(
+        self, user_templates: Path, tmp_path: Path
+    ) -> None:
+        project_templates = tmp_path / "project" / ".pyc" / "templates"
+        project_templates.mkdir(parents=True)
+        template = project_templates / "base_template.py.jinja"
+        template.write_text("# first {{ name }}")
+        first = TemplateEngine.for_project(tmp_path / "project")
+        assert first.render("base_template.py.jinja", {"name": "User"}) == "# first User"
+        assert TemplateEngine.for_project(tmp_path / "project") is first
+
+        template.write_text("# edited {{ name }}")
+        bump_mtime(template)
+        edited = TemplateEngine.for_project(tmp_path / "project")
+        assert edited is not first
+        assert edited.render("base_template.py.jinja", {"name": "User"}) == "# edited User"
+
+        (project_templates / "repository.py.jinja").write_text("# repository")
+        bump_mtime(project_templates)
+        added = TemplateEngine.for_project(tmp_path / "project")
+        assert added is not edited
+        assert added.component_template("repository") == "repository.py.jinja"
+
+    def test_uptodate_compares_mtimes(self, user_templates: Path, tmp_path: Path) -> None:
+        template = user_templates / "repository.py.jinja"
+        template.write_text("# repository")
+        engine = TemplateEngine(template_search_path(tmp_path))
+
+        _, _, uptodate = engine.loader.get_source(engine.env, "repository.py.jinja")
+        assert uptodate()
+        bump_mtime(template)
+        assert not uptodate()
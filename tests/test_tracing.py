@@ -0,0 +1,84 @@
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from src.core.tracing import Event, Span, Subscriber, emit, span, subscribe, unsubscribe
+from src.main import cli
+
+STANDARD_CONFIG = """settings:
+  preset: "standard"
+
+layers:
+  domain:
+    contexts:
+      - name: users
+        entities: User
+"""
+
+
+class RecordingSubscriber(Subscriber):
+    def __init__(self) -> None:
+        self.records: list[tuple[str, str]] = []
+
+    def on_start(self, span: Span) -> None:
+        self.records.append(("start", span.name))
+
+    def on_end(self, span: Span) -> None:
+        self.records.append(("end", span.name))
+
+    def on_event(self, event: Event) -> None:
+        self.records.append(("event", event.name))
+
+
+class TestTracing:
+
+    def test_spans_without_subscribers_are_shared_noops(self) -> None:
+        assert span("template.render") is span("file.write", path="a.py")
+
+    def test_subscriber_receives_nested_spans_and_events(self) -> None:
+        subscriber = RecordingSubscriber()
+        subscribe(subscriber)
+        try:
+            with span("project.generate") as outer:
+                emit("generation.scope", context="users")
+                with span("file.write", path="user.py") as inner:
+                    pass
+        finally:
+            unsubscribe(subscriber)
+
+        with span("file.write"):
+            pass
+
+        assert subscriber.records == [
+            ("start", "project.generate"),
+            ("event", "generation.scope"),
+            ("start", "file.write"),
+            ("end", "file.write"),
+            ("end", "project.generate"),
+        ]
+        assert isinstance(inner, Span)
+        assert inner.attributes == {"path": "user.py"}
+        assert outer.start <= inner.start <= inner.end <= outer.end
+
+    def test_run_writes_chrome_trace(self, tmp_path: Path) -> None:
+        runner = CliRunner(env={"PYC_NO_DAEMON": "1"})
+        with runner.isolated_filesystem(temp_dir=tmp_path):
+            Path("ddd-config.yaml").write_text(STANDARD_CONFIG)
+            result = runner.invoke(cli, ["run", "--trace", "trace.json"])
+            assert result.exit_code == 0
+
+            trace = json.loads(Path("trace.json").read_text())
+
+        names = {event["name"] for event in trace["traceEvents"]}
+        assert {
+            "config.parse",
+            "project.generate",
+            "preset.generate",
+            "layer.generate_components",
+            "template.render",
+            "file.write",
+            "generation.scope",
+        } <= names
+        spans = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+        assert all(event["dur"] >= 0 for event in spans)
@@ -21,7 +21,7 @@ class TestFileOperations:
 
         parent_node = file_ops.preview_collector.nodes[str(test_path)]  # type: ignore
         assert len(parent_node.children) == 1
-        file_node = parent_node.children[0]
+        file_node = list(parent_node.children.values())[0]
         assert file_node.name == "__init__.py"
         assert file_node.type == ComponentType.INIT
 
@@ -45,7 +45,7 @@ class TestFileOperations:
 
         parent_node = file_ops.preview_collector.nodes[str(test_path.parent)]  # type: ignore
         assert len(parent_node.children) == 1
-        file_node = parent_node.children[0]
+        file_node = list(parent_node.children.values())[0]
         assert file_node.name == "test_file.py"
         assert file_node.type == ComponentType.FILE
 
@@ -0,0 +1,117 @@
+import json
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from src.core.validation import (
+    BatchValidator,
+    validate_config,
+    write_json_report,
+    write_junit_report,
+)
+from src.main import cli
+
+VALID_CONFIG = """settings:
+  preset: "standard"
+
+layers:
+  domain:
+    contexts:
+      - name: users
+        entities: User, Admin
+"""
+
+
+def write_configs(config_dir: Path) -> list[Path]:
+    config_dir.mkdir(parents=True, exist_ok=True)
+    configs = {
+        "billing.yaml": VALID_CONFIG,
+        "orders.yaml": VALID_CONFIG.replace("User, Admin", "Order, Order"),
+        "broken.yaml": "settings:\n  init_imports: maybe\nlayers: {}\n",
+        "users.yaml": VALID_CONFIG,
+    }
+    for name, content in configs.items():
+        (config_dir / name).write_text(content)
+    return [config_dir / name for name in configs]
+
+
+class TestBatchValidator:
+
+    def test_validate_config(self, tmp_path: Path) -> None:
+        billing, orders, broken, _ = write_configs(tmp_path)
+
+        assert validate_config(billing).success
+        assert validate_config(orders).success
+        assert not validate_config(orders, strict=True).success
+        assert validate_config(broken).errors == [
+            f"{broken}:2:3: settings.init_imports: "
+            "Input should be a valid boolean, unable to interpret input"
+        ]
+        assert "not found" in validate_config(tmp_path / "missing.yaml").errors[0]
+
+    def test_validate_in_processes(self, tmp_path: Path) -> None:
+        paths = write_configs(tmp_path)
+
+        results = list(BatchValidator(workers=2, strict=True).validate(paths))
+
+        assert sorted(result.index for result in results) == [0, 1, 2, 3]
+        results.sort(key=lambda result: result.index)
+        assert [result.config_path for result in results] == paths
+        assert [result.success for result in results] == [True, False, False, True]
+
+    def test_reports(self, tmp_path: Path) -> None:
+        paths = write_configs(tmp_path / "configs")
+        results = list(BatchValidator(workers=1).validate(paths))
+
+        write_json_report(results, tmp_path / "report.json", 0.5)
+        write_junit_report(results, tmp_path / "report.xml", 0.5)
+
+        report = json.loads((tmp_path / "report.json").read_text())
+        assert report["summary"] == {"total": 4, "passed": 3, "failed": 1, "duration": 0.5}
+        assert [item["valid"] for item in report["results"]] == [True, True, False, True]
+        suite = ET.parse(tmp_path / "report.xml").getroot().find("testsuite")
+        assert suite is not None
+        assert (suite.get("tests"), suite.get("failures")) == ("4", "1")
+        failures = [case.get("name") for case in suite if case.find("failure") is not None]
+        assert failures == [str(paths[2])]
+
+
+class TestValidateCommand:
+
+    def test_many_configs(self, tmp_path: Path) -> None:
+        config_dir = tmp_path / "configs"
+        write_configs(config_dir)
+        report_path = tmp_path / "report.xml"
+
+        result = CliRunner().invoke(
+            cli,
+            ["validate", f"{config_dir}/*.yaml", "--workers", "2", "--report", str(report_path)],
+        )
+
+        assert result.exit_code == 1
+        assert "Validating 4 configs" in result.output
+        assert "3 valid, 1 invalid" in result.output
+        assert f"✗ {config_dir / 'broken.yaml'}" in result.output
+        assert ET.parse(report_path).getroot().tag == "testsuites"
+
+    def test_all_valid(self, tmp_path: Path) -> None:
+        paths = write_configs(tmp_path)
+        report_path = tmp_path / "report.xml"
+
+        result = CliRunner().invoke(
+            cli,
+            [
+                "validate",
+                str(paths[0]),
+                str(paths[3]),
+                "--report",
+                str(report_path),
+                "--report-format",
+                "json",
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert "2 valid, 0 invalid" in result.output
+        assert json.loads(report_path.read_text())["summary"]["passed"] == 2